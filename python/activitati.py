@@ -0,0 +1,70 @@
+# Indexul activitatilor economice: sectiunile NACE sunt identificate prin litera de la inceputul denumirii
+# din tabelele INS ("C INDUSTRIA PRELUCRATOARE" -> 'C'). Fiecare sectiune are o prescurtare pentru grafice,
+# iar maparea denumire <-> prescurtare se face prin dictionare, nu prin cautare liniara dupa prefix.
+import re
+
+import pandas as pd
+
+COLOANA_ACTIVITATI = 'Activitati ale economiei'
+
+# Coloana categoriala cu prescurtarea, adaugata la tipizarea tabelelor cu activitati economice
+COLOANA_PRESCURTARE = 'Activitate'
+
+# Sectiunile NACE: litera -> (denumirea din tabelele INS, prescurtarea afisata in grafice)
+SECTIUNI_NACE = {
+    'C': ("C INDUSTRIA PRELUCRATOARE", "Industria prelucratoare"),
+    'G': ("G COMERT CU RIDICATA SI CU AMANUNTUL; REPARAREA AUTOVEHICULELOR SI MOTOCICLETELOR", "Comert si reparatii auto"),
+    'Q': ("Q SANATATE SI ASISTENTA SOCIALA", "Sanatate si asistenta sociala"),
+    'P': ("P INVATAMANT", "Invatamant"),
+    'F': ("F CONSTRUCTII", "Constructii"),
+    'H': ("H TRANSPORT SI DEPOZITARE", "Transport si depozitare"),
+    'O': ("O ADMINISTRATIE PUBLICA SI APARARE; ASIGURARI SOCIALE DIN SISTEMUL PUBLIC", "Administratie publica si aparare"),
+    'A': ("A AGRICULTURA, SILVICULTURA SI PESCUIT", "Agricultura si silvicultura"),
+    'I': ("I HOTELURI SI RESTAURANTE", "Hoteluri si restaurante"),
+    'E': ("E DISTRIBUTIA APEI; SALUBRITATE, GESTIONAREA DESEURILOR, ACTIVITATI DE DECONTAMINARE", "Distributia apei si salubritate"),
+    'M': ("M ACTIVITATI PROFESIONALE, STIINTIFICE SI TEHNICE", "Activitati profesionale si tehnice"),
+    'N': ("N ACTIVITATI DE SERVICII ADMINISTRATIVE SI ACTIVITATI DE SERVICII SUPORT", "Servicii administrative si suport"),
+    'K': ("K INTERMEDIERI FINANCIARE SI ASIGURARI", "Finante si asigurari"),
+    'B': ("B INDUSTRIA EXTRACTIVA", "Industria extractiva"),
+    'D': ("D PRODUCTIA SI FURNIZAREA DE ENERGIE ELECTRICA SI TERMICA, GAZE, APA CALDA SI AER COND", "Energie si utilitati"),
+    'J': ("J INFORMATII SI COMUNICATII", "IT si comunicatii"),
+    'L': ("L TRANZACTII IMOBILIARE", "Tranzactii imobiliare"),
+    'R': ("R ACTIVITATI DE SPECTACOLE, CULTURALE SI RECREATIVE", "Spectacole si recreere"),
+    'S': ("S ALTE ACTIVITATI DE SERVICII", "Alte servicii"),
+    'U': ("U ACTIVITATI ALE ORGANIZATIILOR SI ORGANISMELOR EXTRATERESTRE", "Organizatii internationale"),
+}
+
+_SECTIUNE = re.compile(r'^\s*([A-U]) ')
+
+
+def sectiune_nace(denumire):
+    # Litera sectiunii NACE dintr-o denumire de activitate, sau None (diviziuni, totaluri, agregate)
+    potrivire = _SECTIUNE.match(str(denumire).upper())
+    return potrivire.group(1) if potrivire else None
+
+
+def prescurteaza_activitate(activitate):
+    # Intoarce prescurtarea corespunzatoare activitatii economice
+    sectiune = SECTIUNI_NACE.get(sectiune_nace(activitate))
+    if sectiune:
+        return sectiune[1]
+    # Daca nu gaseste, returneaza primele 30 de caractere urmate de "..."
+    return activitate[:30] + "..."
+
+
+def index_activitati(denumiri):
+    # Maparea in ambele sensuri pentru o lista de denumiri: (denumire -> prescurtare, prescurtare -> denumire).
+    # Daca doua denumiri au aceeasi prescurtare, sensul invers o pastreaza pe prima.
+    prescurtari = {denumire: prescurteaza_activitate(denumire) for denumire in denumiri}
+    denumiri_dupa_prescurtare = {}
+    for denumire, prescurtare in prescurtari.items():
+        denumiri_dupa_prescurtare.setdefault(prescurtare, denumire)
+    return prescurtari, denumiri_dupa_prescurtare
+
+
+def coloana_prescurtari(activitati):
+    # Prescurtarile unei coloane de activitati, ca serie categoriala; fiecare denumire distincta
+    # este prescurtata o singura data, iar randurile primesc doar codul categoriei
+    categorii = activitati.astype('category')
+    prescurtari, _ = index_activitati(categorii.cat.categories)
+    return pd.Series(pd.Categorical(categorii.map(prescurtari)), index=activitati.index, name=COLOANA_PRESCURTARE)
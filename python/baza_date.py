@@ -0,0 +1,79 @@
+# Acces read-only la baza SQLite: pool de conexiuni partajat de tot procesul si versiunea datelor
+import hashlib
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+
+# Baza de date se cauta langa acest fisier, indiferent de directorul din care este pornita aplicatia
+CALE_BAZA_DATE = Path(__file__).resolve().with_name('data.sqlite')
+
+# Dimensiunea zonei mapate in memorie (acopera integral baza actuala, ~400 KB)
+MMAP_OCTETI = 64 * 1024 * 1024
+
+# Numarul maxim de conexiuni inactive pastrate in pool
+MARIME_POOL = 8
+
+_blocare = threading.Lock()
+_conexiuni_libere = []
+_versiune_pool = None
+_amprente = {}
+
+
+def versiune_date(cale=CALE_BAZA_DATE):
+    # Versiunea datelor: hash-ul continutului bazei. Hash-ul se recalculeaza doar cand se schimba
+    # data modificarii sau dimensiunea fisierului, deci la fiecare rerun costa doar un stat().
+    info = os.stat(cale)
+    cheie_stat = (info.st_mtime_ns, info.st_size)
+    amprenta = _amprente.get(str(cale))
+    if amprenta is None or amprenta[0] != cheie_stat:
+        continut_hash = hashlib.sha256()
+        with open(cale, 'rb') as f:
+            for bloc in iter(lambda: f.read(1024 * 1024), b''):
+                continut_hash.update(bloc)
+        amprenta = (cheie_stat, continut_hash.hexdigest()[:16])
+        _amprente[str(cale)] = amprenta
+    return amprenta[1]
+
+
+def _deschide_conexiune():
+    # Conexiune read-only: mode=ro interzice scrierile, immutable=1 elimina blocarile si verificarile
+    # de modificare, iar mmap_size permite citirea paginilor direct din memoria mapata
+    uri = f"{CALE_BAZA_DATE.as_uri()}?mode=ro&immutable=1"
+    conexiune_noua = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    conexiune_noua.execute(f"PRAGMA mmap_size={MMAP_OCTETI}")
+    return conexiune_noua
+
+
+@contextmanager
+def conexiune():
+    # Imprumuta o conexiune din pool. Daca fisierul s-a schimbat de la deschiderea conexiunilor
+    # (o noua versiune a datelor), conexiunile vechi sunt inchise si se deschid altele noi.
+    global _versiune_pool
+    versiune = versiune_date()
+    with _blocare:
+        if versiune != _versiune_pool:
+            while _conexiuni_libere:
+                _conexiuni_libere.pop().close()
+            _versiune_pool = versiune
+        conexiune_imprumutata = _conexiuni_libere.pop() if _conexiuni_libere else None
+
+    if conexiune_imprumutata is None:
+        conexiune_imprumutata = _deschide_conexiune()
+    try:
+        yield conexiune_imprumutata
+    finally:
+        with _blocare:
+            if versiune == _versiune_pool and len(_conexiuni_libere) < MARIME_POOL:
+                _conexiuni_libere.append(conexiune_imprumutata)
+            else:
+                conexiune_imprumutata.close()
+
+
+def citeste_sql(sql, parametri=()):
+    # Executa o interogare parametrizata pe o conexiune din pool si intoarce un DataFrame
+    with conexiune() as con:
+        return pd.read_sql_query(sql, con, params=parametri)
@@ -0,0 +1,66 @@
+# Cache-ul figurilor Plotly construite, comun tuturor sesiunilor: cheia este (pagina, parametri, versiunea
+# datelor), deci o selectie vazuta deja nu mai trece nici prin pregatirea datelor, nici prin constructia
+# figurii. Figurile sunt pastrate ca go.Figure si date direct lui st.plotly_chart, care doar le citeste
+# (to_dict + to_json), fara reconstructie si validare. Dimensiunea totala, masurata o singura data la
+# inserare ca lungimea JSON-ului figurii, este limitata in octeti; la depasire se evacueaza intrarile
+# folosite cel mai demult (LRU). Contoarele de hit/miss arata cat de des este folosit cache-ul.
+import threading
+from collections import OrderedDict
+
+import instrumentare
+
+# Limita cache-ului (octeti, dupa marimea JSON a figurilor)
+CAPACITATE = 64 * 1024 ** 2
+
+_FIGURI = OrderedDict()
+_BLOCARE = threading.Lock()
+_STARE = {'octeti': 0, 'hit': 0, 'miss': 0, 'evacuari': 0}
+
+
+def _octeti(figura):
+    # Marimea figurii ca JSON (ce se trimite browserului), calculata o data, la inserare
+    return len(figura.to_json().encode('utf-8'))
+
+
+def _evacueaza():
+    # Scoate intrarile cel mai putin recent folosite pana cand cache-ul incape in limita
+    while _STARE['octeti'] > CAPACITATE and _FIGURI:
+        _, (figura, marime) = _FIGURI.popitem(last=False)
+        _STARE['octeti'] -= marime
+        _STARE['evacuari'] += 1
+
+
+def figura_memorata(pagina, parametri, versiune, construieste):
+    # Figura (go.Figure) pentru (pagina, parametri, versiune), partajata read-only intre sesiuni. La miss,
+    # construieste() intoarce figura; constructia se face in afara blocarii, ca sesiunile care cer alte
+    # figuri sa nu astepte. O figura mai mare decat limita nu este pastrata.
+    cheie = (pagina, tuple(parametri), versiune)
+    instrumentare.cerere_cache('figuri')
+    with _BLOCARE:
+        intrare = _FIGURI.get(cheie)
+        if intrare is not None:
+            _FIGURI.move_to_end(cheie)
+            _STARE['hit'] += 1
+            return intrare[0]
+        _STARE['miss'] += 1
+
+    instrumentare.ratare_cache('figuri')
+    with instrumentare.faza(f'constructie figura: {pagina}'):
+        figura = construieste()
+    with instrumentare.faza('masurare figura'):
+        marime = _octeti(figura)
+    with _BLOCARE:
+        if marime <= CAPACITATE and cheie not in _FIGURI:
+            _FIGURI[cheie] = (figura, marime)
+            _STARE['octeti'] += marime
+            _evacueaza()
+    return figura
+
+
+def statistici_cache():
+    # Starea cache-ului: numarul de figuri, octetii ocupati, limita, hit/miss, evacuari si rata de hit
+    with _BLOCARE:
+        stare = dict(_STARE, figuri=len(_FIGURI), capacitate=CAPACITATE)
+    cereri = stare['hit'] + stare['miss']
+    stare['rata_hit'] = stare['hit'] / cereri if cereri else 0.0
+    return stare
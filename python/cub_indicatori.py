@@ -0,0 +1,186 @@
+# Etapa de ingestie: transforma tabelele late din baza SQLite (coloane "Anul YYYY" stocate ca TEXT)
+# intr-un cub tipizat in format lung: indicator, judet, dimensiune, an, valoare
+import re
+
+import numpy as np
+import pandas as pd
+
+from activitati import COLOANA_ACTIVITATI, COLOANA_PRESCURTARE, coloana_prescurtari
+from judete import JUDETE, ROMANIA, canonicalizeaza_judete
+
+# Coloana de dimensiune (sex, activitate, nivel de educatie, forma de proprietate) pentru fiecare tabel
+DIMENSIUNI_TABELE = {
+    'Somaj': 'Sexe',
+    'PIB': None,
+    'Salariu': 'Sexe',
+    'Resurse': None,
+    'PopActiva': 'Sexe',
+    'Imigranti': None,
+    'Absolventi': 'Niveluri de educatie',
+    'Salariati1': 'Activitati ale economiei',
+    'Salariati2': 'Activitati ale economiei',
+    'Salariati3': 'Forme de proprietate',
+}
+
+# Numele canonice ale judetelor, in ordinea din judete.JUDETE
+NUME_JUDETE = [nume for nume, _, _, _ in JUDETE]
+
+# Valoarea dimensiunii pentru tabelele care nu au o coloana de dimensiune
+DIMENSIUNE_IMPLICITA = 'Total'
+
+# Coloanele de ani apar fie ca "Anul 2010", fie doar ca "2023" (Salariati1)
+_COLOANA_AN = re.compile(r'^(?:Anul )?(\d{4})$')
+
+
+def este_coloana_an(coloana):
+    # True pentru coloanele cu valori anuale ("Anul 2010" sau "2023")
+    return _COLOANA_AN.match(coloana) is not None
+
+
+def coloane_ani(df):
+    # Coloanele de forma "Anul YYYY", in ordine cronologica
+    return sorted([col for col in df.columns if col.startswith('Anul')],
+                  key=lambda x: int(x.split()[-1]))
+
+
+def tipizeaza_tabel(df, nume_tabel):
+    # Aduce un tabel brut la forma tipizata: fara ID, judetele cu numele canonic (totalul national "Romania"),
+    # coloanele de ani denumite uniform "Anul YYYY" si convertite o singura data la float;
+    # tabelele cu activitati economice primesc si coloana categoriala cu prescurtarea activitatii
+    dimensiune = DIMENSIUNI_TABELE[nume_tabel]
+    redenumiri = {col: f"Anul {_COLOANA_AN.match(col).group(1)}" for col in df.columns if este_coloana_an(col)}
+
+    df_tip = df.rename(columns=redenumiri)
+    ani = coloane_ani(df_tip)
+    coloane = ['Judete'] + ([dimensiune] if dimensiune else [])
+    df_tip = df_tip[coloane + ani].reset_index(drop=True)
+    df_tip['Judete'] = canonicalizeaza_judete(df_tip['Judete'])
+    df_tip[ani] = df_tip[ani].apply(pd.to_numeric, errors='coerce').astype('float64')
+    if dimensiune == COLOANA_ACTIVITATI:
+        # Prescurtarea activitatii, calculata o singura data pe categorie
+        df_tip.insert(len(coloane), COLOANA_PRESCURTARE, coloana_prescurtari(df_tip[dimensiune]))
+    return df_tip
+
+
+def tabel_in_format_lung(df_tip, nume_tabel):
+    # Transforma un tabel tipizat in format lung (un rand pentru fiecare judet x dimensiune x an)
+    dimensiune = DIMENSIUNI_TABELE[nume_tabel]
+    ani = coloane_ani(df_tip)
+    valori = df_tip[ani].to_numpy(dtype='float64')
+    nr_randuri, nr_ani = valori.shape
+
+    if dimensiune:
+        valori_dimensiune = np.repeat(df_tip[dimensiune].to_numpy(dtype=object), nr_ani)
+    else:
+        valori_dimensiune = np.full(nr_randuri * nr_ani, DIMENSIUNE_IMPLICITA, dtype=object)
+
+    df_lung = pd.DataFrame({
+        'Indicator': np.full(nr_randuri * nr_ani, nume_tabel, dtype=object),
+        'Judete': np.repeat(df_tip['Judete'].to_numpy(dtype=object), nr_ani),
+        'Dimensiune': valori_dimensiune,
+        'An': np.tile(np.array([int(an.split()[-1]) for an in ani], dtype='int16'), nr_randuri),
+        'Valoare': valori.ravel(),
+    })
+    # Celulele goale (ex. niveluri de educatie inexistente intr-un judet) nu intra in cub
+    return df_lung[df_lung['Valoare'].notna()]
+
+
+def construieste_cub(citeste_tabel):
+    # Construieste cubul de indicatori pentru toate tabelele din DIMENSIUNI_TABELE.
+    # citeste_tabel(nume_tabel) intoarce tabelul brut, asa cum este stocat in SQLite.
+    # Rezultatul (cub, tabele_tipizate) este partajat intre sesiuni si nu trebuie modificat pe loc.
+    tabele = {
+        nume_tabel: tipizeaza_tabel(citeste_tabel(nume_tabel), nume_tabel)
+        for nume_tabel in DIMENSIUNI_TABELE
+    }
+    cub = pd.concat(
+        [tabel_in_format_lung(df_tip, nume_tabel) for nume_tabel, df_tip in tabele.items()],
+        ignore_index=True
+    )
+    for coloana in ['Indicator', 'Judete', 'Dimensiune']:
+        cub[coloana] = cub[coloana].astype('category')
+    return cub, tabele
+
+
+def selecteaza_din_cub(cub, indicator, judete=None, dimensiune=None, ani=None):
+    # Extrage din cub randurile unui indicator, optional filtrate dupa judete, dimensiune si ani
+    masca = cub['Indicator'] == indicator
+    if judete is not None:
+        masca &= cub['Judete'].isin(judete)
+    if dimensiune is not None:
+        masca &= cub['Dimensiune'] == dimensiune
+    if ani is not None:
+        masca &= cub['An'].isin(ani)
+    return cub[masca]
+
+
+def matrice_indicator(cub, indicator, dimensiune=DIMENSIUNE_IMPLICITA, ani=None):
+    # Valorile unui indicator ca matrice judete x ani (NaN = lipsa). Randurile urmeaza indexul de judete al
+    # cubului (categoriile coloanei Judete), deci randul i este acelasi judet pentru orice indicator.
+    # Cu dimensiune=None valorile sunt adunate pe toate valorile dimensiunii; randul Total al tabelului,
+    # acolo unde exista, inlocuieste suma componentelor in loc sa fie adunat la ea.
+    if ani is None:
+        ani = np.arange(cub['An'].min(), cub['An'].max() + 1)
+    felie = selecteaza_din_cub(cub, indicator, dimensiune=dimensiune, ani=ani)
+    matrice = np.full((len(cub['Judete'].cat.categories), len(ani)), np.nan)
+    if dimensiune is None:
+        este_total = (felie['Dimensiune'] == DIMENSIUNE_IMPLICITA).to_numpy()
+        totaluri = felie[este_total].set_index(['Judete', 'An'])['Valoare']
+        sume = felie[~este_total].groupby(['Judete', 'An'], observed=True)['Valoare'].sum()
+        felie = pd.concat([sume.drop(totaluri.index, errors='ignore'), totaluri]).reset_index()
+    matrice[felie['Judete'].cat.codes.to_numpy(), np.searchsorted(ani, felie['An'].to_numpy())] = felie['Valoare']
+    return matrice
+
+
+def aliniaza_indicatori(cub, indicator_x, dimensiune_x, indicator_y, dimensiune_y):
+    # Doi indicatori aliniati pe cheile (judet, an) pentru dimensiunile alese: (judete, ani, X, Y), unde X si Y
+    # sunt matrice judete x ani (dimensiune None = suma pe dimensiune, ca in matrice_indicator). Randurile sunt
+    # doar judetele canonice si Romania (fara regiuni si macroregiuni); se pastreaza judetele cu cel putin
+    # o pereche completa si anii comuni.
+    ani = np.arange(cub['An'].min(), cub['An'].max() + 1)
+    categorii = cub['Judete'].cat.categories
+    pozitii = categorii.get_indexer(NUME_JUDETE + [ROMANIA])
+    pozitii = pozitii[pozitii >= 0]
+    x = matrice_indicator(cub, indicator_x, dimensiune_x, ani)[pozitii]
+    y = matrice_indicator(cub, indicator_y, dimensiune_y, ani)[pozitii]
+    complete = ~(np.isnan(x) | np.isnan(y))
+    randuri, coloane = complete.any(axis=1), complete.any(axis=0)
+    judete = categorii[pozitii[randuri]]
+    return judete, ani[coloane], x[np.ix_(randuri, coloane)], y[np.ix_(randuri, coloane)]
+
+
+def cub_sectoare(cub, activitati_publice, indicator='Salariati2'):
+    # Salariatii pe judet si an: total, sector public (activitatile date), sector privat, ponderile lor si
+    # cresterea fata de anul precedent (%), dintr-un singur groupby pe cub. Indexat dupa (Judete, An).
+    felie = cub[cub['Indicator'] == indicator]
+    publici = felie['Valoare'].where(felie['Dimensiune'].isin(activitati_publice), 0.0)
+    sectoare = (felie.assign(Salariati_publici=publici)
+                .groupby(['Judete', 'An'], observed=True)[['Valoare', 'Salariati_publici']].sum()
+                .rename(columns={'Valoare': 'Total_salariati'}))
+    return completeaza_sectoare(sectoare)
+
+
+def completeaza_sectoare(sectoare):
+    # Adauga sectorul privat, ponderile si cresterile fata de anul precedent la un cadru cu Total_salariati
+    # si Salariati_publici, indexat dupa (..., An); anul precedent se cauta dupa cheie, nu dupa pozitie
+    sectoare = sectoare.copy()
+    sectoare['Salariati_privati'] = sectoare['Total_salariati'] - sectoare['Salariati_publici']
+    sectoare['Procent_public'] = sectoare['Salariati_publici'] / sectoare['Total_salariati'] * 100
+    sectoare['Procent_privat'] = 100 - sectoare['Procent_public']
+
+    chei = sectoare.index.to_frame(index=False)
+    chei['An'] = chei['An'] - 1
+    precedent = sectoare.reindex(pd.MultiIndex.from_frame(chei) if chei.shape[1] > 1 else pd.Index(chei['An']))
+    for coloana, crestere in [('Total_salariati', 'Crestere_total'), ('Salariati_publici', 'Crestere_publici'),
+                              ('Salariati_privati', 'Crestere_privati')]:
+        anterior = precedent[coloana].to_numpy()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            sectoare[crestere] = np.where(anterior > 0, (sectoare[coloana].to_numpy() - anterior) / anterior * 100,
+                                          np.nan)
+    return sectoare
+
+
+def totaluri_sectoare(sectoare, judete):
+    # Totalurile pe an pentru un set de judete, cu aceleasi coloane ca cub_sectoare (indexat dupa An)
+    felie = sectoare[sectoare.index.get_level_values('Judete').isin(judete)]
+    return completeaza_sectoare(felie.groupby(level='An')[['Total_salariati', 'Salariati_publici']].sum())
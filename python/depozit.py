@@ -0,0 +1,34 @@
+# Depozitul de date partajat de toate sesiunile: cadrele sunt inghetate (coloane numpy read-only)
+# si ajung in pagini doar ca vederi copy-on-write, fara copiere si fara serializare la fiecare acces
+import numpy as np
+import pandas as pd
+
+
+def _coloana_read_only(serie):
+    # Copiaza o singura data valorile coloanei intr-un tablou propriu si il marcheaza read-only
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        coduri = serie.cat.codes.to_numpy(copy=True)
+        coduri.flags.writeable = False
+        return pd.Categorical.from_codes(coduri, dtype=serie.dtype)
+    valori = serie.to_numpy(copy=True)
+    if isinstance(valori, np.ndarray) and valori.dtype == serie.dtype:
+        valori.flags.writeable = False
+        return valori
+    return serie.array
+
+
+def ingheata(df):
+    # Cadru imuabil pentru depozit: orice scriere directa in el ridica o eroare
+    return pd.DataFrame({col: _coloana_read_only(df[col]) for col in df.columns},
+                        index=df.index, copy=False)
+
+
+def vedere(df):
+    # Vedere asupra unui cadru din depozit: partajeaza memoria, iar la prima modificare
+    # (coloana noua, atribuire) pandas copiaza doar coloanele atinse, fara a afecta depozitul
+    return df.copy(deep=False)
+
+
+def octeti(df):
+    # Memoria ocupata de un cadru, inclusiv sirurile de caractere si categoriile
+    return int(df.memory_usage(index=True, deep=True).sum())
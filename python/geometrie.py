@@ -0,0 +1,262 @@
+# Etapa offline de pregatire a geometriei: din ro.json se construiesc variante simplificate ale contururilor
+# judetelor (niveluri de detaliu), cu topologia pastrata: granitele comune a doua judete sunt simplificate
+# o singura data, ca arc comun, deci nu apar goluri sau suprapuneri intre judete vecine.
+#   python python/geometrie.py construieste [--topojson]  - scrie variantele in python/harti/
+#   python python/geometrie.py benchmark                  - dimensiunea si timpul de constructie per nivel
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from judete import CALE_GEOJSON, calculeaza_centroide
+
+DIRECTOR_HARTI = Path(__file__).resolve().with_name('harti')
+
+# Nivelurile de detaliu: (toleranta Douglas-Peucker in grade, zecimale pastrate in coordonate).
+# La dimensiunea hartilor din aplicatie un pixel acopera ~0.008 grade pentru toata tara si ~0.003 grade
+# pentru regiunea Centru, deci tolerantele raman sub un pixel.
+NIVELURI_DETALIU = {
+    'mediu': (0.001, 4),
+    'redus': (0.004, 3),
+}
+
+# Pasii grilei de cuantizare pentru TopoJSON
+CUANTIZARE_TOPOJSON = 100_000
+
+
+def cale_nivel(nivel, extensie='json'):
+    # Fisierul unei variante simplificate (ex. harti/ro_redus.json)
+    return DIRECTOR_HARTI / f'ro_{nivel}.{extensie}'
+
+
+def _inele(geojson):
+    # Toate inelele (exterioare si gauri) ca liste de puncte, fara punctul de inchidere,
+    # impreuna cu pozitia lor (feature, poligon, inel)
+    inele = []
+    for i, feature in enumerate(geojson['features']):
+        geometrie = feature['geometry']
+        poligoane = geometrie['coordinates'] if geometrie['type'] == 'MultiPolygon' else [geometrie['coordinates']]
+        for j, poligon in enumerate(poligoane):
+            for k, inel in enumerate(poligon):
+                puncte = [tuple(punct) for punct in inel]
+                if puncte[0] == puncte[-1]:
+                    puncte = puncte[:-1]
+                inele.append(((i, j, k), puncte))
+    return inele
+
+
+def _jonctiuni(inele):
+    # Punctele in care se intalnesc sau se despart granitele: un punct este jonctiune daca
+    # vecinii lui difera intre inelele in care apare
+    vecini = {}
+    for _, puncte in inele:
+        n = len(puncte)
+        for idx, punct in enumerate(puncte):
+            pereche = frozenset((puncte[idx - 1], puncte[(idx + 1) % n]))
+            vecini.setdefault(punct, set()).add(pereche)
+    return {punct for punct, perechi in vecini.items() if len(perechi) > 1}
+
+
+def construieste_topologie(geojson):
+    # Descompune inelele in arce intre jonctiuni; un arc comun a doua judete este stocat o singura data.
+    # Intoarce (arce, inele_arce), unde fiecare inel este o lista de (index arc, inversat).
+    inele = _inele(geojson)
+    jonctiuni = _jonctiuni(inele)
+    arce = []
+    index_arce = {}
+    inele_arce = []
+    for pozitie, puncte in inele:
+        pozitii_jonctiuni = [idx for idx, punct in enumerate(puncte) if punct in jonctiuni]
+        if pozitii_jonctiuni:
+            start = pozitii_jonctiuni[0]
+            rotit = puncte[start:] + puncte[:start]
+            taieturi = [idx - start for idx in pozitii_jonctiuni] + [len(puncte)]
+            bucati = [rotit[a:b + 1] if b < len(puncte) else rotit[a:] + [rotit[0]]
+                      for a, b in zip(taieturi, taieturi[1:])]
+        else:
+            bucati = [puncte + [puncte[0]]]
+
+        referinte = []
+        for bucata in bucati:
+            cheie, invers = tuple(bucata), tuple(reversed(bucata))
+            if cheie in index_arce:
+                referinte.append((index_arce[cheie], False))
+            elif invers in index_arce:
+                referinte.append((index_arce[invers], True))
+            else:
+                index_arce[cheie] = len(arce)
+                arce.append(np.asarray(bucata, dtype='float64'))
+                referinte.append((index_arce[cheie], False))
+        inele_arce.append((pozitie, referinte))
+    return arce, inele_arce
+
+
+def douglas_peucker(puncte, toleranta):
+    # Simplificarea Douglas-Peucker (iterativa) a unei polilinii; capetele sunt pastrate mereu
+    if toleranta <= 0 or len(puncte) <= 2:
+        return puncte
+    pastreaza = np.zeros(len(puncte), dtype=bool)
+    pastreaza[[0, -1]] = True
+    stiva = [(0, len(puncte) - 1)]
+    while stiva:
+        a, b = stiva.pop()
+        if b - a < 2:
+            continue
+        segment = puncte[b] - puncte[a]
+        relative = puncte[a + 1:b] - puncte[a]
+        lungime = np.hypot(*segment)
+        if lungime == 0:
+            distante = np.hypot(relative[:, 0], relative[:, 1])
+        else:
+            distante = np.abs(segment[0] * relative[:, 1] - segment[1] * relative[:, 0]) / lungime
+        idx = int(np.argmax(distante))
+        if distante[idx] > toleranta:
+            mijloc = a + 1 + idx
+            pastreaza[mijloc] = True
+            stiva += [(a, mijloc), (mijloc, b)]
+    return puncte[pastreaza]
+
+
+def _fara_duplicate(puncte):
+    # Elimina punctele consecutive identice (aparute dupa rotunjire)
+    if len(puncte) < 2:
+        return puncte
+    diferite = np.any(np.diff(puncte, axis=0) != 0, axis=1)
+    return puncte[np.concatenate([[True], diferite])]
+
+
+def _asambleaza_inel(arce, referinte):
+    bucati = [arce[idx][::-1] if invers else arce[idx] for idx, invers in referinte]
+    inel = np.concatenate([bucati[0]] + [bucata[1:] for bucata in bucati[1:]])
+    return _fara_duplicate(inel)
+
+
+def simplifica(geojson, toleranta, zecimale):
+    # Varianta simplificata a unui GeoJSON: arcele sunt simplificate si rotunjite o singura data,
+    # apoi inelele sunt reasamblate; un inel care ar degenera (sub 4 puncte) isi pastreaza arcele originale
+    arce, inele_arce = construieste_topologie(geojson)
+    arce_simple = [np.round(douglas_peucker(arc, toleranta), zecimale) for arc in arce]
+    arce_originale = [np.round(arc, zecimale) for arc in arce]
+
+    rezultat = json.loads(json.dumps(geojson))
+    for (i, j, k), referinte in inele_arce:
+        inel = _asambleaza_inel(arce_simple, referinte)
+        if len(inel) < 4:
+            inel = _asambleaza_inel(arce_originale, referinte)
+        geometrie = rezultat['features'][i]['geometry']
+        poligoane = geometrie['coordinates'] if geometrie['type'] == 'MultiPolygon' else [geometrie['coordinates']]
+        poligoane[j][k] = inel.tolist()
+    return rezultat, arce_simple, inele_arce
+
+
+def in_topojson(geojson, arce, inele_arce, pasi=CUANTIZARE_TOPOJSON):
+    # Codificare TopoJSON: arce cuantizate pe o grila intreaga si codificate diferential,
+    # inele exprimate prin indecsii arcelor (~i pentru un arc parcurs invers)
+    toate = np.concatenate(arce)
+    minim, maxim = toate.min(axis=0), toate.max(axis=0)
+    scala = (maxim - minim) / (pasi - 1)
+    arce_cuantizate = []
+    for arc in arce:
+        intregi = _fara_duplicate(np.round((arc - minim) / scala).astype('int64'))
+        arce_cuantizate.append(np.vstack([intregi[:1], np.diff(intregi, axis=0)]).tolist())
+
+    geometrii = []
+    for i, feature in enumerate(geojson['features']):
+        poligoane = {}
+        for (fi, j, k), referinte in inele_arce:
+            if fi == i:
+                poligoane.setdefault(j, []).append([~idx if invers else idx for idx, invers in referinte])
+        geometrii.append({
+            'type': 'Polygon' if len(poligoane) == 1 else 'MultiPolygon',
+            'arcs': poligoane[0] if len(poligoane) == 1 else [poligoane[j] for j in sorted(poligoane)],
+            'id': feature['properties'].get('id'),
+            'properties': feature['properties'],
+        })
+    return {
+        'type': 'Topology',
+        'transform': {'scale': scala.tolist(), 'translate': minim.tolist()},
+        'objects': {'judete': {'type': 'GeometryCollection', 'geometries': geometrii}},
+        'arcs': arce_cuantizate,
+    }
+
+
+def informatii_judete(geojson):
+    # Centrul si dreptunghiul de incadrare (lon_min, lat_min, lon_max, lat_max) al fiecarui judet
+    centroide = calculeaza_centroide()
+    informatii = {}
+    for feature in geojson['features']:
+        geometrie = feature['geometry']
+        poligoane = geometrie['coordinates'] if geometrie['type'] == 'MultiPolygon' else [geometrie['coordinates']]
+        puncte = np.concatenate([np.asarray(poligon[0]) for poligon in poligoane])
+        id_feature = feature['properties']['id']
+        informatii[id_feature] = {
+            'nume': feature['properties']['name'],
+            'centru': centroide[id_feature],
+            'incadrare': np.round(np.concatenate([puncte.min(axis=0), puncte.max(axis=0)]), 4).tolist(),
+        }
+    return informatii
+
+
+def _scrie_json(date, cale):
+    cale_temporara = cale.with_suffix('.tmp')
+    with open(cale_temporara, 'w', encoding='utf-8') as f:
+        json.dump(date, f, separators=(',', ':'), ensure_ascii=False)
+    cale_temporara.replace(cale)
+
+
+def construieste(topojson=False):
+    # Scrie in harti/ variantele simplificate pentru fiecare nivel si fisierul cu centre si incadrari
+    with open(CALE_GEOJSON, encoding='utf-8') as f:
+        geojson = json.load(f)
+    DIRECTOR_HARTI.mkdir(exist_ok=True)
+    for nivel, (toleranta, zecimale) in NIVELURI_DETALIU.items():
+        simplificat, arce, inele_arce = simplifica(geojson, toleranta, zecimale)
+        _scrie_json(simplificat, cale_nivel(nivel))
+        if topojson:
+            _scrie_json(in_topojson(geojson, arce, inele_arce), cale_nivel(nivel, 'topojson'))
+    _scrie_json(informatii_judete(geojson), DIRECTOR_HARTI / 'judete.json')
+
+
+def benchmark(repetari=5):
+    # Pentru fiecare nivel: octetii fisierului, octetii figurii serializate (harta cu toate judetele)
+    # si timpul median de constructie + serializare a figurii pe server
+    import plotly.graph_objects as go
+
+    variante = {'complet': CALE_GEOJSON}
+    variante.update({nivel: cale_nivel(nivel) for nivel in NIVELURI_DETALIU if cale_nivel(nivel).exists()})
+    for nivel, cale in variante.items():
+        with open(cale, encoding='utf-8') as f:
+            geojson = json.load(f)
+        nume = [feature['properties']['name'] for feature in geojson['features']]
+        puncte = sum(len(inel) for _, inel in _inele(geojson))
+        durate = []
+        for _ in range(repetari):
+            start = time.perf_counter()
+            fig = go.Figure(go.Choropleth(geojson=geojson, featureidkey='properties.name',
+                                          locations=nume, z=np.arange(len(nume))))
+            fig.update_geos(fitbounds='locations', visible=False)
+            figura = fig.to_json()
+            durate.append((time.perf_counter() - start) * 1000)
+        print(f"{nivel:<8} {puncte:>6} puncte  fisier {cale.stat().st_size / 1024:7.1f} KB  "
+              f"figura {len(figura) / 1024:7.1f} KB  constructie {np.median(durate):7.1f} ms")
+
+
+def main(argumente=None):
+    parser = argparse.ArgumentParser(description="Variante simplificate ale hartii judetelor")
+    parser.add_argument('comanda', choices=['construieste', 'benchmark'])
+    parser.add_argument('--topojson', action='store_true', help="scrie si variantele TopoJSON")
+    argumente = parser.parse_args(argumente)
+
+    if argumente.comanda == 'construieste':
+        construieste(argumente.topojson)
+        print(f"Variantele au fost scrise in {DIRECTOR_HARTI}")
+    else:
+        benchmark()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+# Instantaneu columnar al datelor tipizate: tabelele tipizate si cubul in format lung sunt exportate
+# in fisiere Arrow IPC necomprimate (python/instantaneu/), care la pornire se mapeaza in memorie
+# fara parsare si fara conversii text -> float.
+#   python python/instantaneu.py construieste   - exporta instantaneul pentru versiunea curenta a bazei
+#   python python/instantaneu.py benchmark      - compara incarcarea din instantaneu cu citirea din SQLite
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+
+from baza_date import citeste_sql, versiune_date
+from cub_indicatori import DIMENSIUNI_TABELE, construieste_cub
+
+DIRECTOR_INSTANTANEU = Path(__file__).resolve().with_name('instantaneu')
+
+# Se incrementeaza la orice schimbare a formei tabelelor tipizate, ca instantaneele vechi sa fie ignorate
+VERSIUNE_FORMAT = '3'
+
+NUME_CUB = 'cub'
+
+
+def _cheie_versiune(versiune):
+    return f"{versiune}/{VERSIUNE_FORMAT}".encode()
+
+
+def citeste_tabel_brut(nume_tabel):
+    # Citirea completa a unui tabel lat din SQLite (calea fara instantaneu)
+    return citeste_sql(f'SELECT * FROM "{nume_tabel}" ORDER BY rowid')
+
+
+def _scrie_fisier(df, cale, versiune):
+    # Scrie un cadru ca fisier Arrow IPC; NaN ramane NaN (nu null) ca la citire coloanele
+    # numerice sa poata fi folosite direct din memoria mapata
+    coloane = {
+        col: pa.array(df[col].to_numpy()) if df[col].dtype.kind in 'fi' else pa.Array.from_pandas(df[col])
+        for col in df.columns
+    }
+    tabel = pa.table(coloane).replace_schema_metadata({b'versiune': _cheie_versiune(versiune)})
+    cale_temporara = cale.with_suffix('.tmp')
+    with pa.OSFile(str(cale_temporara), 'wb') as fisier:
+        with pa.ipc.new_file(fisier, tabel.schema) as scriitor:
+            scriitor.write_table(tabel)
+    os.replace(cale_temporara, cale)
+
+
+def construieste_instantaneu(cub, tabele, versiune, director=DIRECTOR_INSTANTANEU):
+    # Exporta cubul si tabelele tipizate; fiecare fisier este inlocuit atomic
+    director.mkdir(exist_ok=True)
+    _scrie_fisier(cub, director / f'{NUME_CUB}.arrow', versiune)
+    for nume_tabel, df in tabele.items():
+        _scrie_fisier(df, director / f'{nume_tabel}.arrow', versiune)
+
+
+def _citeste_fisier(cale, versiune):
+    # Mapeaza un fisier in memorie; intoarce None daca lipseste sau apartine altei versiuni
+    if not cale.exists():
+        return None
+    tabel = pa.ipc.open_file(pa.memory_map(str(cale), 'r')).read_all()
+    if (tabel.schema.metadata or {}).get(b'versiune') != _cheie_versiune(versiune):
+        return None
+    return tabel.to_pandas(split_blocks=True)
+
+
+def incarca_instantaneu(versiune, director=DIRECTOR_INSTANTANEU):
+    # (cub, tabele) din instantaneu, sau None daca acesta lipseste, este incomplet sau depasit.
+    # Coloanele numerice raman in memoria mapata (read-only), deci nu mai trebuie inghetate.
+    cub = _citeste_fisier(director / f'{NUME_CUB}.arrow', versiune)
+    if cub is None:
+        return None
+    tabele = {}
+    for nume_tabel in DIMENSIUNI_TABELE:
+        df = _citeste_fisier(director / f'{nume_tabel}.arrow', versiune)
+        if df is None:
+            return None
+        tabele[nume_tabel] = df
+    return cub, tabele
+
+
+def _cronometreaza(functie, repetari):
+    durate = []
+    for _ in range(repetari):
+        start = time.perf_counter()
+        functie()
+        durate.append((time.perf_counter() - start) * 1000)
+    return np.median(durate), min(durate)
+
+
+def benchmark(repetari=20):
+    # Timpul median de obtinere a (cub, tabele) din SQLite (citire + tipizare) fata de instantaneu
+    versiune = versiune_date()
+    if incarca_instantaneu(versiune) is None:
+        construieste_instantaneu(*construieste_cub(citeste_tabel_brut), versiune)
+    rezultate = {
+        'SQLite + tipizare': _cronometreaza(lambda: construieste_cub(citeste_tabel_brut), repetari),
+        'Instantaneu Arrow': _cronometreaza(lambda: incarca_instantaneu(versiune), repetari),
+    }
+    for metoda, (median, minim) in rezultate.items():
+        print(f"{metoda:<20} median {median:8.2f} ms   minim {minim:8.2f} ms")
+    return rezultate
+
+
+def main(argumente=None):
+    parser = argparse.ArgumentParser(description="Instantaneul Arrow al datelor tipizate")
+    parser.add_argument('comanda', choices=['construieste', 'benchmark'])
+    parser.add_argument('--repetari', type=int, default=20)
+    argumente = parser.parse_args(argumente)
+
+    if argumente.comanda == 'construieste':
+        versiune = versiune_date()
+        construieste_instantaneu(*construieste_cub(citeste_tabel_brut), versiune)
+        print(f"Instantaneu scris in {DIRECTOR_INSTANTANEU} (versiunea datelor {versiune})")
+    else:
+        benchmark(argumente.repetari)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,137 @@
+# Instrumentarea optionala a rularilor: durata fiecarei faze (citire SQLite, tipizare, constructia si trimiterea
+# figurilor, sectiunile paginii), cererile si ratarile cache-urilor si octetii trimisi catre browser de fiecare
+# figura (JSON) si tabel (Arrow) afisat prin afisare_masurata. Se activeaza cu ?instrumentare=1 in URL sau cu
+# variabila de mediu INSTRUMENTARE=1; fara ele functiile de aici nu fac nimic. Fiecare rulare este o
+# inregistrare (dict) care poate fi adaugata intr-un jurnal JSONL pentru analiza offline.
+import contextlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+VARIABILA_MEDIU = 'INSTRUMENTARE'
+PARAMETRU_URL = 'instrumentare'
+CALE_JURNAL = Path(__file__).resolve().with_name('instrumentare.jsonl')
+
+# Fiecare sesiune Streamlit isi ruleaza scriptul pe firul ei, deci inregistrarea curenta este locala firului
+_LOCAL = threading.local()
+_BLOCARE = threading.Lock()
+
+
+def activ_din_mediu():
+    return os.environ.get(VARIABILA_MEDIU, '').strip().lower() not in ('', '0', 'false', 'nu')
+
+
+def inregistrare_curenta():
+    return getattr(_LOCAL, 'inregistrare', None)
+
+
+def porneste(rulare):
+    # Incepe inregistrarea unei rulari (pagina sau fragment) pe firul curent
+    _LOCAL.inregistrare = {
+        'moment': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'rulare': rulare,
+        'faze': [],
+        'cache': {},
+        'afisari': [],
+        '_start': time.perf_counter(),
+        '_adancime': 0,
+    }
+
+
+def opreste():
+    # Incheie inregistrarea curenta si o intoarce (None daca nu exista una)
+    inregistrare = inregistrare_curenta()
+    if inregistrare is None:
+        return None
+    _LOCAL.inregistrare = None
+    inregistrare['total_ms'] = round((time.perf_counter() - inregistrare.pop('_start')) * 1000, 2)
+    inregistrare.pop('_adancime')
+    return inregistrare
+
+
+@contextlib.contextmanager
+def faza(nume):
+    # Cronometreaza un bloc; fazele imbricate sunt pastrate cu adancimea lor
+    inregistrare = inregistrare_curenta()
+    if inregistrare is None:
+        yield
+        return
+    intrare = {'faza': nume, 'adancime': inregistrare['_adancime'], 'ms': None}
+    inregistrare['faze'].append(intrare)
+    inregistrare['_adancime'] += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        intrare['ms'] = round((time.perf_counter() - start) * 1000, 2)
+        inregistrare['_adancime'] -= 1
+
+
+def cerere_cache(cache):
+    # O cerere catre un cache; ratarile sunt semnalate separat, din corpul functiei memorate
+    inregistrare = inregistrare_curenta()
+    if inregistrare is not None:
+        inregistrare['cache'].setdefault(cache, {'cereri': 0, 'ratari': 0})['cereri'] += 1
+
+
+def ratare_cache(cache):
+    inregistrare = inregistrare_curenta()
+    if inregistrare is not None:
+        inregistrare['cache'].setdefault(cache, {'cereri': 0, 'ratari': 0})['ratari'] += 1
+
+
+def afisare(tip, octeti, ms):
+    inregistrare = inregistrare_curenta()
+    if inregistrare is not None:
+        inregistrare['afisari'].append({'tip': tip, 'octeti': int(octeti), 'ms': round(ms, 2)})
+
+
+def _octeti_figura(figura):
+    import plotly.io as pio
+
+    return len(pio.to_json(figura, validate=False).encode('utf-8'))
+
+
+def _octeti_tabel(date):
+    from streamlit import dataframe_util
+
+    return len(dataframe_util.convert_anything_to_arrow_bytes(date))
+
+
+_OCTETI = {'plotly_chart': _octeti_figura, 'dataframe': _octeti_tabel}
+
+
+def afisare_masurata(tip, date, afiseaza):
+    # Apeleaza afiseaza(); doar cand firul are o inregistrare activa masoara durata apelului si octetii
+    # trimisi pentru date (figura Plotly ca JSON, tabel ca Arrow)
+    if inregistrare_curenta() is None:
+        return afiseaza()
+    start = time.perf_counter()
+    rezultat = afiseaza()
+    durata = (time.perf_counter() - start) * 1000
+    try:
+        afisare(tip, _OCTETI[tip](date), durata)
+    except Exception:
+        afisare(tip, -1, durata)
+    return rezultat
+
+
+def rezumat(inregistrare):
+    # Totalurile unei inregistrari: octeti trimisi pe tip de afisare si rata de hit a fiecarui cache
+    octeti = {}
+    for intrare in inregistrare['afisari']:
+        octeti[intrare['tip']] = octeti.get(intrare['tip'], 0) + max(intrare['octeti'], 0)
+    cache = {
+        nume: dict(valori, hit=valori['cereri'] - valori['ratari'])
+        for nume, valori in inregistrare['cache'].items()
+    }
+    return {'total_ms': inregistrare['total_ms'], 'octeti': octeti, 'cache': cache}
+
+
+def scrie_jurnal(inregistrare, cale=CALE_JURNAL):
+    # Adauga inregistrarea ca o linie in jurnalul JSONL
+    linie = json.dumps(inregistrare, ensure_ascii=False)
+    with _BLOCARE, open(cale, 'a', encoding='utf-8') as f:
+        f.write(linie + '\n')
@@ -0,0 +1,165 @@
+# Nomenclatorul judetelor: cod SIRUTA, nume canonic, prescurtare auto, regiune de dezvoltare
+# si macroregiune, plus centrele geometrice calculate din conturul judetelor (ro.json)
+import json
+import unicodedata
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+CALE_GEOJSON = Path(__file__).resolve().with_name('ro.json')
+
+# (nume canonic, cod SIRUTA, prescurtare auto, regiune de dezvoltare)
+JUDETE = [
+    ('Alba', 10, 'AB', 'CENTRU'),
+    ('Arad', 29, 'AR', 'VEST'),
+    ('Arges', 38, 'AG', 'SUD-MUNTENIA'),
+    ('Bacau', 47, 'BC', 'NORD-EST'),
+    ('Bihor', 56, 'BH', 'NORD-VEST'),
+    ('Bistrita-Nasaud', 65, 'BN', 'NORD-VEST'),
+    ('Botosani', 74, 'BT', 'NORD-EST'),
+    ('Brasov', 83, 'BV', 'CENTRU'),
+    ('Braila', 92, 'BR', 'SUD-EST'),
+    ('Buzau', 109, 'BZ', 'SUD-EST'),
+    ('Caras-Severin', 118, 'CS', 'VEST'),
+    ('Cluj', 127, 'CJ', 'NORD-VEST'),
+    ('Constanta', 136, 'CT', 'SUD-EST'),
+    ('Covasna', 145, 'CV', 'CENTRU'),
+    ('Dambovita', 154, 'DB', 'SUD-MUNTENIA'),
+    ('Dolj', 163, 'DJ', 'SUD-VEST OLTENIA'),
+    ('Galati', 172, 'GL', 'SUD-EST'),
+    ('Gorj', 181, 'GJ', 'SUD-VEST OLTENIA'),
+    ('Harghita', 190, 'HR', 'CENTRU'),
+    ('Hunedoara', 207, 'HD', 'VEST'),
+    ('Ialomita', 216, 'IL', 'SUD-MUNTENIA'),
+    ('Iasi', 225, 'IS', 'NORD-EST'),
+    ('Ilfov', 234, 'IF', 'BUCURESTI - ILFOV'),
+    ('Maramures', 243, 'MM', 'NORD-VEST'),
+    ('Mehedinti', 252, 'MH', 'SUD-VEST OLTENIA'),
+    ('Mures', 261, 'MS', 'CENTRU'),
+    ('Neamt', 270, 'NT', 'NORD-EST'),
+    ('Olt', 289, 'OT', 'SUD-VEST OLTENIA'),
+    ('Prahova', 298, 'PH', 'SUD-MUNTENIA'),
+    ('Satu Mare', 305, 'SM', 'NORD-VEST'),
+    ('Salaj', 314, 'SJ', 'NORD-VEST'),
+    ('Sibiu', 323, 'SB', 'CENTRU'),
+    ('Suceava', 332, 'SV', 'NORD-EST'),
+    ('Teleorman', 341, 'TR', 'SUD-MUNTENIA'),
+    ('Timis', 350, 'TM', 'VEST'),
+    ('Tulcea', 369, 'TL', 'SUD-EST'),
+    ('Vaslui', 378, 'VS', 'NORD-EST'),
+    ('Valcea', 387, 'VL', 'SUD-VEST OLTENIA'),
+    ('Vrancea', 396, 'VN', 'SUD-EST'),
+    ('Municipiul Bucuresti', 403, 'B', 'BUCURESTI - ILFOV'),
+    ('Calarasi', 519, 'CL', 'SUD-MUNTENIA'),
+    ('Giurgiu', 528, 'GR', 'SUD-MUNTENIA'),
+]
+
+# Regiunile de dezvoltare grupate pe macroregiuni (NUTS 1)
+MACROREGIUNI = {
+    'MACROREGIUNEA UNU': ['NORD-VEST', 'CENTRU'],
+    'MACROREGIUNEA DOI': ['NORD-EST', 'SUD-EST'],
+    'MACROREGIUNEA TREI': ['SUD-MUNTENIA', 'BUCURESTI - ILFOV'],
+    'MACROREGIUNEA PATRU': ['SUD-VEST OLTENIA', 'VEST'],
+}
+
+MACROREGIUNE_REGIUNE = {
+    regiune: macroregiune
+    for macroregiune, regiuni in MACROREGIUNI.items()
+    for regiune in regiuni
+}
+
+# Numele sub care apare totalul national in date
+ROMANIA = 'Romania'
+
+# Variantele sub care apare totalul national in coloana Judete
+ALIASURI_ROMANIA = {
+    'TOTAL': ROMANIA,
+    'Total': ROMANIA,
+    'MEDIA ROMÂNIA': ROMANIA,
+    'Media România': ROMANIA
+}
+
+# Alte denumiri ale judetelor intalnite in surse, pe langa numele canonic
+ALIASURI_JUDETE = {
+    'Bucuresti': 'Municipiul Bucuresti',
+    'Mun. Bucuresti': 'Municipiul Bucuresti',
+    'Bistrita Nasaud': 'Bistrita-Nasaud',
+    'Caras Severin': 'Caras-Severin',
+}
+
+
+def cheie_nume(nume):
+    # Forma de comparatie a unui nume: fara diacritice (inclusiv ş/ţ cu sedila), majuscule,
+    # spatii si cratime uniformizate ("Brașov", "BRASOV" si "Brasov" dau aceeasi cheie)
+    fara_diacritice = unicodedata.normalize('NFKD', str(nume)).encode('ascii', 'ignore').decode('ascii')
+    return ' '.join(fara_diacritice.upper().replace(' - ', '-').split())
+
+
+def id_geojson(prescurtare):
+    # Identificatorul judetului in ro.json ("RO" + prescurtarea auto, ex. ROAB, ROB)
+    return 'RO' + prescurtare
+
+
+# Indexul de canonicalizare: cheia de comparatie a oricarei variante de nume -> numele canonic
+# (cele 42 de judete, aliasurile lor si variantele totalului national)
+INDEX_JUDETE = {cheie_nume(nume): nume for nume, _, _, _ in JUDETE}
+INDEX_JUDETE.update({cheie_nume(alias): nume for alias, nume in {**ALIASURI_JUDETE, **ALIASURI_ROMANIA}.items()})
+INDEX_JUDETE[cheie_nume(ROMANIA)] = ROMANIA
+
+# Numele canonic -> identificatorul feature-ului din ro.json
+ID_GEOJSON_JUDETE = {nume: id_geojson(prescurtare) for nume, _, prescurtare, _ in JUDETE}
+
+
+def canonicalizeaza_judete(valori):
+    # Numele canonice pentru o coloana de judete. Cheia de comparatie se calculeaza o singura data pentru
+    # fiecare valoare distincta, apoi se aplica printr-un singur map; valorile care nu sunt judete
+    # (regiuni, macroregiuni) raman neschimbate
+    valori = pd.Series(valori)
+    mapare = {valoare: INDEX_JUDETE.get(cheie_nume(valoare), valoare) for valoare in valori.dropna().unique()}
+    return valori.map(mapare)
+
+
+def _centru_inel(inel):
+    # Centrul de greutate si aria (cu semn) unui contur inchis, prin formula lui Gauss
+    x, y = inel[:, 0], inel[:, 1]
+    x2, y2 = np.roll(x, -1), np.roll(y, -1)
+    produs = x * y2 - x2 * y
+    arie = produs.sum() / 2
+    if arie == 0:
+        return arie, x.mean(), y.mean()
+    return arie, ((x + x2) * produs).sum() / (6 * arie), ((y + y2) * produs).sum() / (6 * arie)
+
+
+def calculeaza_centroide(cale_geojson=CALE_GEOJSON):
+    # Centrele geometrice ale judetelor din ro.json: {id feature: (latitudine, longitudine)}.
+    # Pentru judetele formate din mai multe poligoane se ponderaza cu aria fiecaruia (fara gauri).
+    with open(cale_geojson, encoding='utf-8') as f:
+        geojson = json.load(f)
+
+    centroide = {}
+    for feature in geojson['features']:
+        geometrie = feature['geometry']
+        poligoane = geometrie['coordinates']
+        if geometrie['type'] == 'Polygon':
+            poligoane = [poligoane]
+        rezultate = [_centru_inel(np.asarray(poligon[0], dtype='float64')) for poligon in poligoane]
+        arii = np.array([abs(arie) for arie, _, _ in rezultate])
+        lon = np.average([cx for _, cx, _ in rezultate], weights=arii)
+        lat = np.average([cy for _, _, cy in rezultate], weights=arii)
+        centroide[feature['properties']['id']] = (round(float(lat), 4), round(float(lon), 4))
+    return centroide
+
+
+def tabel_centroide(coordonate_ajustate=None, cale_geojson=CALE_GEOJSON):
+    # Tabelul etichetelor de pe harta, indexat dupa numele canonic: prescurtare, latitudine, longitudine.
+    # coordonate_ajustate {judet: (lat, lon)} inlocuieste centrul geometric acolo unde eticheta
+    # trebuie mutata (ex. judete cu forma neregulata)
+    centroide = calculeaza_centroide(cale_geojson)
+    tabel = pd.DataFrame(
+        [(nume, prescurtare) + centroide[ID_GEOJSON_JUDETE[nume]] for nume, _, prescurtare, _ in JUDETE],
+        columns=['Judete', 'Prescurtare', 'lat', 'lon']
+    ).set_index('Judete')
+    for judet, (lat, lon) in (coordonate_ajustate or {}).items():
+        tabel.loc[judet, ['lat', 'lon']] = lat, lon
+    return tabel
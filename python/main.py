@@ -1,62 +1,298 @@
 import streamlit as st
 import pandas as pd
-import sqlite3
 import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import geopandas as gpd
+import functools
 import json
-import folium
-from streamlit_folium import st_folium
-from scipy import stats
-from scipy.stats import shapiro, kstest, ttest_1samp
+import time
 import warnings
-from pathlib import Path
+from activitati import COLOANA_PRESCURTARE, SECTIUNI_NACE, index_activitati, prescurteaza_activitate
+from baza_date import citeste_sql, versiune_date
+from cache_figuri import figura_memorata, statistici_cache
+import instrumentare
+from cub_indicatori import (DIMENSIUNE_IMPLICITA, aliniaza_indicatori, construieste_cub, cub_sectoare,
+                            este_coloana_an, tipizeaza_tabel, totaluri_sectoare)
+from depozit import ingheata, octeti, vedere
+from instantaneu import construieste_instantaneu, incarca_instantaneu
+from geometrie import cale_nivel
+from judete import ALIASURI_ROMANIA, CALE_GEOJSON, tabel_centroide
+from panel import DEPENDENTA_IMPLICITA, EXPLICATIVE_IMPLICITE, VARIABILE_PANEL, date_panel, estimeaza_panel
+from shift_share import COMPONENTE, descompunere_shift_share, shift_share_activitati, shift_share_judete
+from specializare import (clasament_lq, clasament_specializare, indici_specializare, tabele_specializare,
+                          tensor_ocupare)
+from statistici import (CHEI_GRILA, NIVEL_SEMNIFICATIE, cauta_statistici, cauta_teste, corelatii, felii_nenormale,
+                        grila_statistici, grila_teste, teste_semnificativitate)
 warnings.filterwarnings('ignore')
 
-@st.cache_data
-def incarca_date(nume_tabel):
-    # Functie pentru a incarca date din baza SQLite intr-un DataFrame pandas
-    conexiune = sqlite3.connect('data.sqlite')
-    df = pd.read_sql_query(f"SELECT * FROM {nume_tabel}", conexiune)
-    conexiune.close()
-    return df
-
-@st.cache_data
-def incarca_date_geografice():
-    # Incarca datele geografice pentru judetele Romaniei
+def _ghilimele(identificator):
+    # Citeaza un nume de tabel/coloana pentru SQL (numele nu pot fi transmise ca parametri)
+    return '"' + identificator.replace('"', '""') + '"'
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _coloane_tabel(nume_tabel, versiune):
+    df = citeste_sql("SELECT name FROM pragma_table_info(?) ORDER BY cid", (nume_tabel,))
+    if df.empty:
+        raise ValueError(f"Tabelul '{nume_tabel}' nu exista in baza de date")
+    return df['name'].tolist()
+
+def coloane_tabel(nume_tabel):
+    # Coloanele unui tabel, in ordinea din baza; tabelele necunoscute sunt respinse
+    return _coloane_tabel(nume_tabel, versiune_date())
+
+def ani_tabel(nume_tabel):
+    # Coloanele de ani ale unui tabel, de la cel mai recent la cel mai vechi
+    return sorted([col for col in coloane_tabel(nume_tabel) if este_coloana_an(col)],
+                  key=lambda x: int(x.split()[-1]), reverse=True)
+
+def construieste_interogare(nume_tabel, judete=None, filtre=None, ani=None):
+    # Construieste interogarea SQL parametrizata pentru un tabel, cu filtrele aplicate direct in SQL:
+    # judete - lista de judete ("Romania" acopera si variantele TOTAL / Media Romania)
+    # filtre - dictionar {coloana de dimensiune: lista de valori acceptate}
+    # ani - coloanele de ani de citit (implicit toate)
+    coloane = coloane_tabel(nume_tabel)
+    filtre = filtre or {}
+    for coloana in list(filtre) + list(ani or []):
+        if coloana not in coloane:
+            raise ValueError(f"Coloana '{coloana}' nu exista in tabelul '{nume_tabel}'")
+
+    coloane_dimensiuni = [col for col in coloane if col != 'ID' and not este_coloana_an(col)]
+    coloane_ani = [col for col in coloane if este_coloana_an(col)] if ani is None else list(ani)
+    selectie = ", ".join(_ghilimele(col) for col in coloane_dimensiuni + coloane_ani)
+
+    conditii = []
+    parametri = []
+    if judete is not None:
+        valori_judete = list(judete)
+        if 'Romania' in valori_judete:
+            valori_judete += list(ALIASURI_ROMANIA)
+        filtre = {'Judete': valori_judete, **filtre}
+    for coloana, valori in filtre.items():
+        valori = list(valori)
+        conditii.append(f"{_ghilimele(coloana)} IN ({', '.join('?' * len(valori))})")
+        parametri += valori
+
+    # Citirea intregului tabel pastreaza ordinea randurilor (parcurgerea dupa rowid nu cere sortare).
+    # Feliile filtrate vin in ordinea indexului pe judete, fara ORDER BY: sortarea lor dupa rowid ar
+    # cere un B-tree temporar, iar apelantii (harti, statistici, bare) nu depind de ordinea randurilor.
+    sql = f"SELECT {selectie} FROM {_ghilimele(nume_tabel)}"
+    if conditii:
+        sql += " WHERE " + " AND ".join(conditii)
+    else:
+        sql += " ORDER BY rowid"
+    return sql, tuple(parametri)
+
+@st.cache_resource(show_spinner=False, max_entries=512)
+def _executa_interogare(sql, parametri, versiune):
+    # Cache-ul este indexat dupa interogarea completa (text SQL + parametri) si versiunea datelor:
+    # la inlocuirea bazei cu o noua versiune, intrarile vechi nu mai sunt folosite si ies din cache.
+    # Rezultatul este pastrat o singura data in proces, inghetat, si partajat de toate sesiunile.
+    instrumentare.ratare_cache('incarca_date')
+    with instrumentare.faza('citire SQLite'):
+        return ingheata(citeste_sql(sql, parametri))
+
+def incarca_date(nume_tabel, judete=None, filtre=None, ani=None):
+    # Functie pentru a incarca date din baza SQLite intr-un DataFrame pandas.
+    # Filtrele pe judete, dimensiuni si coloanele de ani sunt aplicate in SQL, nu in pandas.
+    sql, parametri = construieste_interogare(nume_tabel, judete, filtre, ani)
+    instrumentare.cerere_cache('incarca_date')
+    return vedere(_executa_interogare(sql, parametri, versiune_date()))
+
+def tabel_filtrat(nume_tabel, judete=None, filtre=None, ani=None):
+    # Citeste doar felia ceruta dintr-un tabel si o aduce la forma tipizata
+    df = incarca_date(nume_tabel, judete, filtre, ani)
+    with instrumentare.faza('tipizare'):
+        return tipizeaza_tabel(df, nume_tabel)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _valori_distincte(nume_tabel, coloana, versiune):
+    if coloana not in coloane_tabel(nume_tabel):
+        raise ValueError(f"Coloana '{coloana}' nu exista in tabelul '{nume_tabel}'")
+    df = citeste_sql(
+        f"SELECT {_ghilimele(coloana)} AS valoare FROM {_ghilimele(nume_tabel)} "
+        f"GROUP BY {_ghilimele(coloana)} ORDER BY MIN(rowid)"
+    )
+    return df['valoare'].tolist()
+
+def valori_distincte(nume_tabel, coloana):
+    # Valorile distincte ale unei coloane de dimensiune, in ordinea primei aparitii in tabel
+    return _valori_distincte(nume_tabel, coloana, versiune_date())
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def incarca_cub(versiune):
+    # Construieste o singura data pentru fiecare versiune a datelor cubul tipizat de indicatori,
+    # partajat read-only intre toate sesiunile. Daca exista un instantaneu Arrow pentru aceasta versiune,
+    # este mapat direct in memorie; altfel cubul se construieste din SQLite si se salveaza instantaneul
+    # pentru urmatoarea pornire.
+    instantaneu = incarca_instantaneu(versiune)
+    if instantaneu is not None:
+        return instantaneu
+    with instrumentare.faza('construire cub'):
+        cub, tabele = construieste_cub(incarca_date)
+    try:
+        construieste_instantaneu(cub, tabele, versiune)
+    except OSError:
+        pass
+    return ingheata(cub), {nume_tabel: ingheata(df) for nume_tabel, df in tabele.items()}
+
+def tabel_tipizat(nume_tabel):
+    # Intoarce tabelul tipizat (Romania in loc de TOTAL, ani ca float) din cubul partajat.
+    # Paginile primesc o vedere: modificarile lor copiaza doar coloanele atinse, nu tabelul comun.
+    cub, tabele = incarca_cub(versiune_date())
+    return vedere(tabele[nume_tabel])
+
+def afiseaza_figura(figura):
+    # Afiseaza o figura Plotly pe toata latimea; st.plotly_chart nu modifica figura primita, deci si
+    # figurile din cache-ul figurilor pot fi trimise direct
+    with instrumentare.faza('afisare figura'):
+        instrumentare.afisare_masurata('plotly_chart', figura,
+                                       lambda: st.plotly_chart(figura, use_container_width=True))
+
+def afiseaza_tabel(date, **optiuni):
+    # st.dataframe, cu octetii trimisi masurati cand instrumentarea este activa
+    return instrumentare.afisare_masurata('dataframe', date, lambda: st.dataframe(date, **optiuni))
+
+# Numarul de intrari pastrate in jurnalul de timpi al sesiunii
+MAX_JURNAL_TIMPI = 50
+
+def cronometrat(nume):
+    # Decorator: blocul este o faza a instrumentarii si, cand instrumentarea este activa, durata fiecarei
+    # executii intra in jurnalul sesiunii, impreuna cu numarul rularii complete a paginii; un bloc care
+    # apare fara o rulare completa noua a fost rerulat singur
+    def decorator(functie):
+        @functools.wraps(functie)
+        def bloc(*args, **kwargs):
+            activ = instrumentare_activa()
+            start = time.perf_counter()
+            try:
+                with instrumentare.faza(nume):
+                    return functie(*args, **kwargs)
+            finally:
+                if activ:
+                    durata = (time.perf_counter() - start) * 1000
+                    jurnal = st.session_state.setdefault('jurnal_timpi', [])
+                    jurnal.append({'Ora': time.strftime('%H:%M:%S'),
+                                   'Rulare': st.session_state.get('rulari_complete', 0),
+                                   'Bloc': nume, 'ms': round(durata, 1)})
+                    del jurnal[:-MAX_JURNAL_TIMPI]
+        return bloc
+    return decorator
+
+def fragment_cronometrat(nume):
+    # Fragment Streamlit cronometrat: widget-urile din el reruleaza doar fragmentul, nu toata pagina;
+    # cu instrumentarea activa, durata ultimei rulari este afisata la finalul fragmentului
+    def decorator(functie):
+        @functools.wraps(functie)
+        def corp(*args, **kwargs):
+            start = time.perf_counter()
+            rezultat = functie(*args, **kwargs)
+            if instrumentare_activa():
+                st.caption(f"{nume}: {(time.perf_counter() - start) * 1000:.0f} ms")
+            return rezultat
+        corp_cronometrat = cronometrat(nume)(corp)
+
+        def fragment(*args, **kwargs):
+            # Rulat singur (fara pagina), fragmentul are propria inregistrare de instrumentare
+            propriu = instrumentare_activa() and instrumentare.inregistrare_curenta() is None
+            if propriu:
+                instrumentare.porneste(f"fragment: {nume}")
+            try:
+                return corp_cronometrat(*args, **kwargs)
+            finally:
+                if propriu:
+                    inregistrare = instrumentare.opreste()
+                    if st.session_state.get('instrumentare_jurnal'):
+                        instrumentare.scrie_jurnal(inregistrare)
+        return st.fragment(functools.wraps(functie)(fragment))
+    return decorator
+
+def instrumentare_activa():
+    # Instrumentarea este pornita prin ?instrumentare=1 in URL sau prin variabila de mediu INSTRUMENTARE
+    parametru = st.query_params.get(instrumentare.PARAMETRU_URL, '')
+    return instrumentare.activ_din_mediu() or parametru.lower() in ('1', 'true', 'da')
+
+def afiseaza_instrumentare(inregistrare):
+    # Panoul din sidebar cu inregistrarea rularii curente: faze, cache-uri si octetii trimisi catre browser;
+    # la cerere, inregistrarea este adaugata in jurnalul JSONL
+    rezumat = instrumentare.rezumat(inregistrare)
+    with st.sidebar.expander("Instrumentare rulare", expanded=True):
+        octeti = ", ".join(f"{tip} {valoare / 1024:.1f} KB" for tip, valoare in rezumat['octeti'].items())
+        st.caption(f"{inregistrare['rulare']}: {rezumat['total_ms']:.0f} ms" + (f"; trimis: {octeti}" if octeti else ""))
+        if inregistrare['faze']:
+            faze = pd.DataFrame(inregistrare['faze'])
+            faze['faza'] = ['\u2003' * adancime + faza for faza, adancime in zip(faze['faza'], faze['adancime'])]
+            st.dataframe(faze[['faza', 'ms']], hide_index=True, use_container_width=True)
+        if rezumat['cache']:
+            st.dataframe(pd.DataFrame(rezumat['cache']).T[['cereri', 'hit', 'ratari']], use_container_width=True)
+        if inregistrare['afisari']:
+            st.dataframe(pd.DataFrame(inregistrare['afisari']), hide_index=True, use_container_width=True)
+        if st.checkbox(f"Adauga rularile in {instrumentare.CALE_JURNAL.name}", key='instrumentare_jurnal'):
+            instrumentare.scrie_jurnal(inregistrare)
+
+def afiseaza_jurnal_timpi():
+    # Jurnalul de timpi al sesiunii, cele mai recente intrari primele
+    jurnal = st.session_state.get('jurnal_timpi', [])
+    with st.sidebar.expander("Jurnal timpi (blocuri si fragmente)"):
+        if jurnal:
+            st.dataframe(pd.DataFrame(jurnal[::-1]), hide_index=True, use_container_width=True)
+        else:
+            st.caption("Nicio intrare inca")
+
+def afiseaza_memorie_date():
+    # Memoria ocupata de depozitul partajat: fiecare tabel tipizat si cubul in format lung
+    cub, tabele = incarca_cub(versiune_date())
+    randuri = [(nume_tabel, len(df), octeti(df)) for nume_tabel, df in tabele.items()]
+    randuri.append(('Cub (format lung)', len(cub), octeti(cub)))
+    df_memorie = pd.DataFrame(randuri, columns=['Tabel', 'Randuri', 'Octeti'])
+    with st.sidebar.expander("Memorie date partajate"):
+        afiseaza_tabel(df_memorie.assign(KB=(df_memorie['Octeti'] / 1024).round(1)).drop(columns='Octeti'),
+                       hide_index=True, use_container_width=True)
+        st.caption(f"Total: {df_memorie['Octeti'].sum() / 1024 ** 2:.2f} MB, "
+                   f"comun tuturor sesiunilor")
+        cache = statistici_cache()
+        st.caption(f"Cache figuri: {cache['figuri']} figuri, {cache['octeti'] / 1024 ** 2:.2f} / "
+                   f"{cache['capacitate'] / 1024 ** 2:.0f} MB, {cache['hit']} hit / {cache['miss']} miss "
+                   f"({cache['rata_hit']:.0%}), {cache['evacuari']} evacuari")
+
+def incarca_date_geografice(nivel='complet'):
+    # Datele geografice la nivelul de detaliu cerut, din cache-ul comun al proceselor (vezi mai jos)
+    instrumentare.cerere_cache('incarca_date_geografice')
+    return _incarca_date_geografice(nivel)
+
+@st.cache_resource(show_spinner=False)
+def _incarca_date_geografice(nivel):
+    # Incarca datele geografice pentru judetele Romaniei, la nivelul de detaliu cerut:
+    # 'complet' este ro.json, 'mediu' si 'redus' sunt variantele simplificate din harti/
+    # (construite cu geometrie.py); daca o varianta lipseste se foloseste ro.json.
+    # Obiectul este comun tuturor sesiunilor si este doar citit de figuri.
+    instrumentare.ratare_cache('incarca_date_geografice')
+    cale = CALE_GEOJSON if nivel == 'complet' else cale_nivel(nivel)
+    if not cale.exists():
+        cale = CALE_GEOJSON
     try:
         # Incearca sa incarce din fisierul GeoJSON
-        with open('ro.json', 'r', encoding='utf-8') as f:
+        with open(cale, 'r', encoding='utf-8') as f:
             geojson_data = json.load(f)
         return geojson_data, 'geojson'
     except:
         try:
             #
-            # Fallback la shapefile
-            gdf = gpd.read_file('ro.shp')
+            # Fallback la shapefile (geopandas se importa doar pe aceasta ramura)
+            import geopandas as gpd
+            gdf = gpd.read_file(CALE_GEOJSON.with_name('ro.shp'))
             return gdf, 'shapefile'
         except:
             st.error("Nu s-au putut incarca datele geografice. Verifica fisierele ro.json sau ro.shp")
             return None, None
 
-def filtreaza_regiunea_centru_si_romania(df):
-    # Filtreaza doar datele pentru judetele din regiunea Centru si pentru Romania
-    judete_centru = ['Alba', 'Brasov', 'Covasna', 'Harghita', 'Mures', 'Sibiu', 'Romania']
-    return df[df['Judete'].isin(judete_centru)]
+def nivel_detaliu(doar_centru):
+    # Nivelul de detaliu al conturului: la zoom pe regiunea Centru se vad mai multe detalii
+    return 'mediu' if doar_centru else 'redus'
 
 def extrage_ani(lista_ani):
     # Preia doar anul din coloanele de forma "Anul YYYY"
     return [col.split()[-1] for col in lista_ani]
 
-def converteste_ani_la_float(df, ani):
-    # Converteste valorile din coloanele de ani la tip float (numeric)
-    for an in ani:
-        df[an] = pd.to_numeric(df[an], errors='coerce')
-    return df
-
 # Definitii de culori pentru fiecare judet
 JUD_COLORS = {
     "Alba": "#1976D2",
@@ -71,40 +307,6 @@ JUD_COLORS = {
 # Paleta generala de culori fara includerea Romaniei
 PALETA = [JUD_COLORS[j] for j in ["Alba", "Brasov", "Covasna", "Harghita", "Mures", "Sibiu"]]
 
-# Dictionar pentru prescurtarea denumirilor activitatilor economice
-PRESCURTARI_ACTIVITATI = {
-    "C INDUSTRIA PRELUCRATOARE": "Industria prelucratoare",
-    "G COMERT CU RIDICATA SI CU AMANUNTUL; REPARAREA AUTOVEHICULELOR SI MOTOCICLETELOR": "Comert si reparatii auto",
-    "Q SANATATE SI ASISTENTA SOCIALA": "Sanatate si asistenta sociala",
-    "P INVATAMANT": "Invatamant",
-    "F CONSTRUCTII": "Constructii",
-    "H TRANSPORT SI DEPOZITARE": "Transport si depozitare",
-    "O ADMINISTRATIE PUBLICA SI APARARE; ASIGURARI SOCIALE DIN SISTEMUL PUBLIC": "Administratie publica si aparare",
-    "A AGRICULTURA, SILVICULTURA SI PESCUIT": "Agricultura si silvicultura",
-    "I HOTELURI SI RESTAURANTE": "Hoteluri si restaurante",
-    "E DISTRIBUTIA APEI; SALUBRITATE, GESTIONAREA DESEURILOR, ACTIVITATI DE DECONTAMINARE": "Distributia apei si salubritate",
-    "M ACTIVITATI PROFESIONALE, STIINTIFICE SI TEHNICE": "Activitati profesionale si tehnice",
-    "N ACTIVITATI DE SERVICII ADMINISTRATIVE SI ACTIVITATI DE SERVICII SUPORT": "Servicii administrative si suport",
-    "K INTERMEDIERI FINANCIARE SI ASIGURARI": "Finante si asigurari",
-    "B INDUSTRIA EXTRACTIVA": "Industria extractiva",
-    "D PRODUCTIA SI FURNIZAREA DE ENERGIE ELECTRICA SI TERMICA, GAZE, APA CALDA SI AER COND": "Energie si utilitati",
-    "J INFORMATII SI COMUNICATII": "IT si comunicatii",
-    "L TRANZACTII IMOBILIARE": "Tranzactii imobiliare",
-    "R ACTIVITATI DE SPECTACOLE, CULTURALE SI RECREATIVE": "Spectacole si recreere",
-    "S ALTE ACTIVITATI DE SERVICII": "Alte servicii",
-    "U ACTIVITATI ALE ORGANIZATIILOR SI ORGANISMELOR EXTRATERESTRE": "Organizatii internationale",
-}
-
-# Maparea numelor judetelor pentru concordanta cu datele geografice
-MAPARE_JUDETE = {
-    'Alba': ['Alba', 'ALBA'],
-    'Brasov': ['Brasov', 'BRASOV', 'Brașov', 'BRAȘOV'],
-    'Covasna': ['Covasna', 'COVASNA'],
-    'Harghita': ['Harghita', 'HARGHITA'],
-    'Mures': ['Mures', 'MURES', 'Mureș', 'MUREȘ'],
-    'Sibiu': ['Sibiu', 'SIBIU']
-}
-
 # Lista cu toate judetele Romaniei pentru mapare
 TOATE_JUDETELE = [
     'Alba', 'Arad', 'Arges', 'Bacau', 'Bihor', 'Bistrita-Nasaud', 'Botosani', 'Braila',
@@ -115,6 +317,16 @@ TOATE_JUDETELE = [
     'Valcea', 'Vaslui', 'Vrancea', 'Municipiul Bucuresti'
 ]
 
+# Activitatile economice considerate sector public
+ACTIVITATI_PUBLICE = [
+    'O ADMINISTRATIE PUBLICA SI APARARE; ASIGURARI SOCIALE DIN SISTEMUL PUBLIC',
+    'P INVATAMANT',
+    'Q SANATATE SI ASISTENTA SOCIALA'
+]
+
+# Judetele din regiunea Centru
+JUDETE_CENTRU = ['Alba', 'Brasov', 'Covasna', 'Harghita', 'Mures', 'Sibiu']
+
 # Coordonatele ajustate ale centrelor judetelor din regiunea Centru
 COORDONATE_JUDETE = {
     'Alba': (46.0667, 23.5833),
@@ -125,51 +337,206 @@ COORDONATE_JUDETE = {
     'Sibiu': (45.7833, 24.1500)
 }
 
-# Prescurtari pentru judete conform sistemului auto din Romania
-PRESCURTARI_JUDETE = {
-    'Alba': 'AB',
-    'Brasov': 'BV', 
-    'Covasna': 'CV',
-    'Harghita': 'HR',
-    'Mures': 'MS',
-    'Sibiu': 'SB'
+@st.cache_resource(show_spinner=False)
+def centroide_judete():
+    # Centrele tuturor celor 42 de judete (calculate o singura data din ro.json), cu prescurtarea auto;
+    # pentru judetele din Centru se pastreaza coordonatele ajustate
+    return tabel_centroide(COORDONATE_JUDETE)
+
+def trace_etichete_judete(judete, texte=None, marime=14, culoare="black"):
+    # O singura urma Scattergeo cu etichetele tuturor judetelor cerute (implicit prescurtarile),
+    # in locul unei urme separate pentru fiecare judet
+    judete = pd.Series(judete, dtype=object).reset_index(drop=True)
+    centre = centroide_judete().reindex(judete)
+    gasite = centre['lat'].notna().to_numpy()
+    if texte is None:
+        texte = centre['Prescurtare']
+    return go.Scattergeo(
+        lat=centre['lat'].to_numpy()[gasite],
+        lon=centre['lon'].to_numpy()[gasite],
+        text=pd.Series(texte, dtype=object).to_numpy()[gasite],
+        mode='text',
+        textfont=dict(
+            size=marime,
+            color=culoare,
+            family="Arial Black"
+        ),
+        textposition='middle center',
+        showlegend=False,
+        hoverinfo='skip'
+    )
+
+
+# Registrul indicatorilor afisati pe harta: tabel, dimensiune filtrata, agregare, scala de culori si unitati.
+# Un indicator nou are nevoie doar de o intrare aici, fara cod nou de desenare.
+#   dimensiune - coloana dupa care se filtreaza (utilizatorul alege valoarea) sau None
+#   agregare - 'suma' aduna toate randurile unui judet (ex. toate activitatile); None = un rand pe judet
+#   factor_harta - scalarea valorilor pe harta (ex. salariati afisati in mii); tabelul ramane in unitati brute
+INDICATORI = {
+    "Rata somajului": dict(
+        tabel='Somaj', subtitlu="Rata somajului pe judete", dimensiune='Sexe',
+        eticheta_dimensiune="Alege sexul:", titlu="Rata somajului ({dimensiune}) in anul {an}",
+        scala="Reds", format_valoare=':.2f', titlu_scala="Rata somaj (%)",
+    ),
+    "Rata de ocupare a resurselor de munca": dict(
+        tabel='Resurse', subtitlu="Rata de ocupare a resurselor de munca",
+        titlu="Rata de ocupare a resurselor de munca in anul {an}",
+        scala="Blues", format_valoare=':.2f', titlu_scala="Rata ocupare (%)",
+    ),
+    "Populatia activa": dict(
+        tabel='PopActiva', subtitlu="Populatia activa", dimensiune='Sexe',
+        eticheta_dimensiune="Alege sexul:", titlu="Populatia activa ({dimensiune}) in anul {an}",
+        scala="Greens", format_valoare=':.0f', titlu_scala="Populatie activa (mii persoane)",
+    ),
+    "Numarul total de absolventi": dict(
+        tabel='Absolventi', subtitlu="Numarul total de absolventi", agregare='suma',
+        titlu="Numarul total de absolventi in anul {an}",
+        scala="Purples", format_valoare=':.0f', titlu_scala="Numar absolventi",
+    ),
+    "Numarul total de salariati": dict(
+        tabel='Salariati2', subtitlu="Numarul total de salariati", agregare='suma',
+        titlu="Numarul total de salariati in anul {an}", factor_harta=1 / 1000,
+        scala="Burg", format_valoare=':.1f', titlu_scala="Numar salariati (mii)",
+    ),
+    "Numarul de salariati pe activitati economice": dict(
+        tabel='Salariati2', subtitlu="Numarul de salariati pe activitati economice",
+        dimensiune='Activitati ale economiei', eticheta_dimensiune="Alege activitatea economica:",
+        titlu="Salariati in {dimensiune} ({an})",
+        scala="Oranges", format_valoare=':.0f', titlu_scala="Numar salariati",
+    ),
+    "PIB regional pe locuitor": dict(
+        tabel='PIB', subtitlu="PIB regional pe locuitor",
+        titlu="PIB regional pe locuitor in anul {an}",
+        scala="PuRd", format_valoare=':.0f', titlu_scala="PIB pe locuitor (lei)",
+    ),
+    "Castigul salarial mediu net": dict(
+        tabel='Salariu', subtitlu="Castigul salarial mediu net", dimensiune='Sexe',
+        eticheta_dimensiune="Alege sexul:", titlu="Castigul salarial mediu net ({dimensiune}) in anul {an}",
+        scala="amp", format_valoare=':.0f', titlu_scala="Salariu mediu net (lei)",
+    ),
+    "Imigranti definitivi": dict(
+        tabel='Imigranti', subtitlu="Imigranti definitivi",
+        titlu="Imigranti definitivi in anul {an}",
+        scala="Teal", format_valoare=':.0f', titlu_scala="Numar imigranti",
+    ),
 }
 
-def standardizeaza_nume_judete(nume_judet):
-    # Standardizeaza numele judetelor pentru mapare
-    for standard, variante in MAPARE_JUDETE.items():
-        if nume_judet in variante:
-            return standard
-    return nume_judet
-
-def prescurteaza_activitate(activitate):
-    # Intoarce prescurtarea corespunzatoare activitatii economice
-    activitate_norm = activitate.strip().upper()
-    for cheie in PRESCURTARI_ACTIVITATI:
-        if activitate_norm.startswith(cheie):
-            return PRESCURTARI_ACTIVITATI[cheie]
-    # Daca nu gaseste, returneaza primele 30 de caractere urmate de "..."
-    return activitate[:30] + "..."
-
-def replace_total_with_romania(df):
-    # Inlocuieste valorile "TOTAL" sau variante cu "Romania"
-    df = df.copy()
-    df['Judete'] = df['Judete'].replace({
-        'TOTAL': 'Romania',
-        'Total': 'Romania',
-        'MEDIA ROMÂNIA': 'Romania',
-        'Media România': 'Romania'
-    })
-    return df
+@st.cache_resource(show_spinner=False, max_entries=1)
+def specializare_judete(versiune):
+    # Indicii de specializare (LQ, Krugman, HHI) pentru toate judetele, activitatile si anii, plus formatul lung
+    cub, tabele = incarca_cub(versiune)
+    indici = indici_specializare(*tensor_ocupare(cub))
+    return indici, tabele_specializare(indici)
+
+@fragment_cronometrat("Specializare: activitatea aleasa")
+def sectiune_lq_activitate(indici, an, judete):
+    # Clasamentul judetelor dupa LQ pentru activitatea aleasa; schimbarea activitatii reruleaza doar fragmentul
+    activitati = list(indici['activitati'])
+    prescurtari = [prescurteaza_activitate(a) for a in activitati]
+    prescurtare = st.selectbox("Alege activitatea economica:", prescurtari,
+                               index=prescurtari.index(prescurteaza_activitate('C INDUSTRIA PRELUCRATOARE')))
+    activitate = activitati[prescurtari.index(prescurtare)]
+    clasament = clasament_lq(indici, activitate, an, judete)
+    
+    st.subheader(f"Coeficientul de localizare - {prescurtare} ({an})")
+    culori = [JUD_COLORS.get(jud, "rgba(128, 128, 128, 0.6)") for jud in clasament.index]
+    fig = go.Figure(go.Bar(
+        x=clasament['LQ'], y=clasament.index, orientation='h',
+        marker_color=culori,
+        customdata=clasament[['Pondere (%)', 'Salariati']].to_numpy(),
+        hovertemplate="<b>%{y}</b><br>LQ: %{x:.2f}<br>Pondere in judet: %{customdata[0]:.1f}%<br>"
+                      "Salariati: %{customdata[1]:,.0f}<extra></extra>"
+    ))
+    fig.add_vline(x=1, line_dash="dash", line_color="#888")
+    fig.update_layout(height=max(400, 22 * len(clasament)), yaxis=dict(autorange='reversed'),
+                      xaxis_title="Coeficient de localizare (LQ)", margin=dict(l=0, r=0, t=30, b=0))
+    afiseaza_figura(fig)
+    afiseaza_tabel(clasament.round({'LQ': 3, 'Pondere (%)': 2}), use_container_width=True)
+
+@cronometrat("Specializare: pagina")
+def analiza_specializare():
+    # Specializarea economica a judetelor: coeficienti de localizare, indicele Krugman si indicele Herfindahl
+    st.header("Specializarea economica a judetelor")
+    st.info("Coeficientul de localizare (LQ) compara ponderea unei activitati in ocuparea judetului cu ponderea ei "
+            "la nivel national: LQ > 1 inseamna ca judetul este specializat in acea activitate. Indicele Krugman "
+            "(0 - structura identica cu cea nationala) si indicele Herfindahl (HHI) masoara cat de diferita, "
+            "respectiv cat de concentrata este structura ocuparii judetului.")
+    indici, (pe_activitati, pe_judete, concentrare) = specializare_judete(versiune_date())
+    ani = sorted(indici['ani'].tolist(), reverse=True)
+    an = st.selectbox("Alege anul:", ani, index=0)
+    doar_centru = st.checkbox("Afiseaza doar regiunea Centru", value=False)
+    judete = JUDETE_CENTRU if doar_centru else None
+    
+    # Clasamentul judetelor pentru o activitate
+    sectiune_lq_activitate(indici, an, judete)
+    
+    # Clasamentul specializarii de ansamblu
+    st.subheader(f"Specializarea de ansamblu a judetelor ({an})")
+    specializare = clasament_specializare(indici, an, judete)
+    specializare['Activitatea cea mai specializata'] = specializare['Activitatea cea mai specializata'].map(prescurteaza_activitate)
+    afiseaza_tabel(specializare.round({'Indice Krugman': 3, 'HHI': 4, 'LQ maxim': 3}), use_container_width=True)
+    
+    # Concentrarea geografica a activitatilor
+    st.subheader(f"Concentrarea geografica a activitatilor ({an})")
+    df_concentrare = concentrare[concentrare['An'] == an].drop(columns='An')
+    df_concentrare['Activitate'] = df_concentrare['Activitate'].map(prescurteaza_activitate)
+    afiseaza_tabel(df_concentrare.sort_values('HHI geografic', ascending=False).set_index('Activitate').round(4),
+                   use_container_width=True)
+    
+    st.download_button(
+        "Descarca coeficientii de localizare pentru toti anii (CSV)",
+        data=pe_activitati.to_csv(index=False).encode('utf-8'),
+        file_name="coeficienti_localizare.csv",
+        mime="text/csv"
+    )
 
-def filtreaza_judete_pentru_harta(df, doar_centru=False):
-    # Filtreaza judetele pentru afisare pe harta
-    if doar_centru:
-        judete_target = ['Alba', 'Brasov', 'Covasna', 'Harghita', 'Mures', 'Sibiu']
-    else:
-        judete_target = TOATE_JUDETELE
-    
-    return df[df['Judete'].isin(judete_target)]
+@st.cache_resource(show_spinner=False, max_entries=1)
+def shift_share_salariati(versiune):
+    # Descompunerea shift-share pentru toate judetele, activitatile si perechile de ani ale unei versiuni a datelor
+    cub, tabele = incarca_cub(versiune)
+    return descompunere_shift_share(cub)
+
+@cronometrat("Shift-share: pagina")
+def analiza_shift_share():
+    # Descompunerea variatiei numarului de salariati in efect national, structural si regional
+    st.header("Analiza shift-share a numarului de salariati")
+    st.info("Variatia numarului de salariati dintr-un judet este impartita in trei componente: efectul national "
+            "(cresterea pe care judetul ar fi avut-o evoluand ca economia nationala), efectul structural (avantajul "
+            "sau dezavantajul dat de mixul de activitati) si efectul regional (competitivitatea proprie a judetului).")
+    descompunere = shift_share_salariati(versiune_date())
+    ani = descompunere['ani'].tolist()
+    an_baza, an_final = st.select_slider("Perioada analizata:", options=ani, value=(ani[0], ani[-1]))
+    if an_baza == an_final:
+        st.warning("Alege doi ani diferiti.")
+        return
+    doar_centru = st.checkbox("Afiseaza doar regiunea Centru", value=True)
+    judete = JUDETE_CENTRU if doar_centru else None
+    
+    # Componentele pe judete
+    tabel = shift_share_judete(descompunere, an_baza, an_final, judete).sort_values('Variatie totala', ascending=False)
+    st.subheader(f"Componentele variatiei pe judete ({an_baza} - {an_final})")
+    fig = go.Figure([
+        go.Bar(name=componenta, x=tabel.index, y=tabel[componenta], marker_color=culoare)
+        for componenta, culoare in zip(COMPONENTE, ['#9aa5b1', '#f0a35e', '#c72a2a'])
+    ])
+    fig.add_trace(go.Scatter(name="Variatie totala", x=tabel.index, y=tabel['Variatie totala'], mode='markers',
+                             marker=dict(size=12, color="#222", symbol='diamond')))
+    fig.update_layout(barmode='relative', height=550, yaxis_title="Salariati",
+                      legend=dict(orientation='h', y=1.08), margin=dict(l=0, r=0, t=40, b=0))
+    afiseaza_figura(fig)
+    afiseaza_tabel(tabel.round(0), use_container_width=True)
+    
+    # Componentele pe activitati pentru un judet
+    sectiune_shift_share_judet(descompunere, list(tabel.index), an_baza, an_final)
+
+@fragment_cronometrat("Shift-share: judetul ales")
+def sectiune_shift_share_judet(descompunere, judete, an_baza, an_final):
+    # Detalierea pe activitati pentru judetul ales; schimbarea judetului reruleaza doar fragmentul
+    judet = st.selectbox("Alege judetul pentru detalierea pe activitati:", judete)
+    detaliu = shift_share_activitati(descompunere, judet, an_baza, an_final)
+    detaliu.index = detaliu.index.map(prescurteaza_activitate)
+    st.subheader(f"{judet}: componentele pe activitati economice ({an_baza} - {an_final})")
+    afiseaza_tabel(detaliu.sort_values('Efect regional', ascending=False).round(0), use_container_width=True)
 
 def analiza_spatiala_choropleth():
     # Analiza spatiala cu choropleth maps pentru Romania
@@ -188,491 +555,82 @@ def analiza_spatiala_choropleth():
     # Selecteaza tipul de analiza spatiala
     tip_analiza = st.selectbox(
         "Alege tipul de date pentru afisare:",
-        [
-            "Rata somajului",
-            "Rata de ocupare a resurselor de munca",
-            "Populatia activa",
-            "Numarul total de absolventi",
-            "Numarul total de salariati",
-            "Numarul de salariati pe activitati economice",
-            "PIB regional pe locuitor",
-            "Castigul salarial mediu net",
-            "Imigranti definitivi"
-        ]
-    )
-    
-    if tip_analiza == "Rata somajului":
-        choropleth_rata_somaj(geo_data, geo_type)
-    elif tip_analiza == "Rata de ocupare a resurselor de munca":
-        choropleth_rata_ocupare(geo_data, geo_type)
-    elif tip_analiza == "Populatia activa":
-        choropleth_populatie_activa(geo_data, geo_type)
-    elif tip_analiza == "Numarul total de absolventi":
-        choropleth_absolventi(geo_data, geo_type)
-    elif tip_analiza == "Numarul total de salariati":
-        choropleth_salariati_total(geo_data, geo_type)
-    elif tip_analiza == "Numarul de salariati pe activitati economice":
-        choropleth_salariati_activitati(geo_data, geo_type)
-    elif tip_analiza == "PIB regional pe locuitor":
-        choropleth_pib(geo_data, geo_type)
-    elif tip_analiza == "Castigul salarial mediu net":
-        choropleth_salariu_mediu(geo_data, geo_type)
-    elif tip_analiza == "Imigranti definitivi":
-        choropleth_imigranti(geo_data, geo_type)
-
-def choropleth_pib(geo_data, geo_type):
-    # Creeaza choropleth map pentru PIB regional pe locuitor
-    st.subheader("PIB regional pe locuitor - Harta interactiva")
-
-    # Incarca datele de PIB
-    df_pib = incarca_date('PIB')
-    df_pib = replace_total_with_romania(df_pib)
-
-    # Selecteaza parametrii
-    ani = sorted([col for col in df_pib.columns if col.startswith('Anul')],
-                 key=lambda x: int(x.split()[-1]), reverse=True)
-    an = st.selectbox("Alege anul:", ani, index=0)
-    doar_centru = st.checkbox("Afiseaza doar regiunea Centru", value=False)
-
-    # Filtreaza datele
-    df_filtrat = filtreaza_judete_pentru_harta(df_pib, doar_centru)
-    df_filtrat = converteste_ani_la_float(df_filtrat, [an])
-    df_filtrat['Judete_std'] = df_filtrat['Judete'].apply(standardizeaza_nume_judete)
-
-    # Coordonatele și prescurtările județelor din regiunea Centru
-    coordonate_judete = {
-        'Alba': (46.0667, 23.5833),
-        'Brasov': (45.6500, 25.6000),
-        'Covasna': (45.8667, 26.1833),
-        'Harghita': (46.3600, 25.8000),
-        'Mures': (46.5500, 24.5667),
-        'Sibiu': (45.7833, 24.1500)
-    }
-    
-    prescurtari_judete = {
-        'Alba': 'AB',
-        'Brasov': 'BV', 
-        'Covasna': 'CV',
-        'Harghita': 'HR',
-        'Mures': 'MS',
-        'Sibiu': 'SB'
-    }
-
-    # Creeaza harta cu Plotly
-    if geo_type == 'geojson':
-        fig = px.choropleth(
-            df_filtrat,
-            geojson=geo_data,
-            locations='Judete_std',
-            color=an,
-            hover_name='Judete',
-            hover_data={an: ':.0f'},
-            featureidkey="properties.name",
-            projection="mercator",
-            color_continuous_scale="PuRd",
-            title=f"PIB regional pe locuitor in anul {an.split()[-1]} - {'Regiunea Centru' if doar_centru else 'Romania'}"
-        )
-
-        # Adauga labeluri DOAR pentru regiunea Centru
-        if doar_centru:
-            for _, row in df_filtrat.iterrows():
-                if row['Judete'] in coordonate_judete and row['Judete'] in prescurtari_judete:
-                    lat, lon = coordonate_judete[row['Judete']]
-                    prescurtare = prescurtari_judete[row['Judete']]
-                    
-                    fig.add_scattergeo(
-                        lat=[lat],
-                        lon=[lon],
-                        text=[prescurtare],
-                        mode='text',
-                        textfont=dict(
-                            size=14,
-                            color="black",
-                            family="Arial Black"
-                        ),
-                        textposition='middle center',
-                        showlegend=False,
-                        hoverinfo='skip'
-                    )
-
-    fig.update_geos(
-        fitbounds="locations",
-        visible=False,
-        bgcolor="rgba(0,0,0,0)"
-    )
-    fig.update_layout(
-        width=1200,
-        height=800,
-        title=dict(font=dict(size=20)),
-        coloraxis_colorbar=dict(title="PIB pe locuitor (lei)"),
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)"
-    )
-
-    st.plotly_chart(fig, use_container_width=True)
-    st.markdown("#### Datele afisate pe harta")
-    st.dataframe(df_filtrat[['Judete', an]].set_index('Judete'))
-
-def choropleth_salariu_mediu(geo_data, geo_type):
-    # Creeaza choropleth map pentru castigul salarial mediu net
-    st.subheader("Castigul salarial mediu net - Harta interactiva")
-
-    # Incarca datele de salariu
-    df_salariu = incarca_date('Salariu')
-    df_salariu = replace_total_with_romania(df_salariu)
-
-    # Selecteaza parametrii
-    ani = sorted([col for col in df_salariu.columns if col.startswith('Anul')],
-                 key=lambda x: int(x.split()[-1]), reverse=True)
-    sex = st.selectbox("Alege sexul:", df_salariu['Sexe'].unique())
-    an = st.selectbox("Alege anul:", ani, index=0)
-    doar_centru = st.checkbox("Afiseaza doar regiunea Centru", value=False)
-
-    # Filtreaza datele
-    df_filtrat = filtreaza_judete_pentru_harta(df_salariu, doar_centru)
-    df_filtrat = df_filtrat[df_filtrat['Sexe'] == sex]
-    df_filtrat = converteste_ani_la_float(df_filtrat, [an])
-    df_filtrat['Judete_std'] = df_filtrat['Judete'].apply(standardizeaza_nume_judete)
-
-    # Coordonatele și prescurtările județelor din regiunea Centru
-    coordonate_judete = {
-        'Alba': (46.0667, 23.5833),
-        'Brasov': (45.6500, 25.6000),
-        'Covasna': (45.8667, 26.1833),
-        'Harghita': (46.3600, 25.8000),
-        'Mures': (46.5500, 24.5667),
-        'Sibiu': (45.7833, 24.1500)
-    }
-    
-    prescurtari_judete = {
-        'Alba': 'AB',
-        'Brasov': 'BV', 
-        'Covasna': 'CV',
-        'Harghita': 'HR',
-        'Mures': 'MS',
-        'Sibiu': 'SB'
-    }
-
-    # Creeaza harta cu Plotly
-    if geo_type == 'geojson':
-        fig = px.choropleth(
-            df_filtrat,
-            geojson=geo_data,
-            locations='Judete_std',
-            color=an,
-            hover_name='Judete',
-            hover_data={an: ':.0f'},
-            featureidkey="properties.name",
-            projection="mercator",
-            color_continuous_scale="amp",
-            title=f"Castigul salarial mediu net ({sex}) in anul {an.split()[-1]} - {'Regiunea Centru' if doar_centru else 'Romania'}"
-        )
-
-        # Adauga labeluri DOAR pentru regiunea Centru
-        if doar_centru:
-            for _, row in df_filtrat.iterrows():
-                if row['Judete'] in coordonate_judete and row['Judete'] in prescurtari_judete:
-                    lat, lon = coordonate_judete[row['Judete']]
-                    prescurtare = prescurtari_judete[row['Judete']]
-                    
-                    fig.add_scattergeo(
-                        lat=[lat],
-                        lon=[lon],
-                        text=[prescurtare],
-                        mode='text',
-                        textfont=dict(
-                            size=14,
-                            color="black",
-                            family="Arial Black"
-                        ),
-                        textposition='middle center',
-                        showlegend=False,
-                        hoverinfo='skip'
-                    )
-
-    fig.update_geos(
-        fitbounds="locations",
-        visible=False,
-        bgcolor="rgba(0,0,0,0)"
-    )
-    fig.update_layout(
-        width=1200,
-        height=800,
-        title=dict(font=dict(size=20)),
-        coloraxis_colorbar=dict(title="Salariu mediu net (lei)"),
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)"
-    )
-
-    st.plotly_chart(fig, use_container_width=True)
-    st.markdown("#### Datele afisate pe harta")
-    st.dataframe(df_filtrat[['Judete', an]].set_index('Judete'))
-
-def choropleth_imigranti(geo_data, geo_type):
-    # Creeaza choropleth map pentru imigranti definitivi
-    st.subheader("Imigranti definitivi - Harta interactiva")
-
-    # Incarca datele de imigranti
-    df_imigranti = incarca_date('Imigranti')
-    df_imigranti = replace_total_with_romania(df_imigranti)
-
-    # Selecteaza parametrii
-    ani = sorted([col for col in df_imigranti.columns if col.startswith('Anul')],
-                 key=lambda x: int(x.split()[-1]), reverse=True)
-    an = st.selectbox("Alege anul:", ani, index=0)
-    doar_centru = st.checkbox("Afiseaza doar regiunea Centru", value=False)
-
-    # Filtreaza datele
-    df_filtrat = filtreaza_judete_pentru_harta(df_imigranti, doar_centru)
-    df_filtrat = converteste_ani_la_float(df_filtrat, [an])
-    df_filtrat['Judete_std'] = df_filtrat['Judete'].apply(standardizeaza_nume_judete)
-
-    # Coordonatele si prescurtarile judetelor din regiunea Centru
-    coordonate_judete = {
-        'Alba': (46.0667, 23.5833),
-        'Brasov': (45.6500, 25.6000),
-        'Covasna': (45.8667, 26.1833),
-        'Harghita': (46.3600, 25.8000),
-        'Mures': (46.5500, 24.5667),
-        'Sibiu': (45.7833, 24.1500)
-    }
-    
-    prescurtari_judete = {
-        'Alba': 'AB',
-        'Brasov': 'BV', 
-        'Covasna': 'CV',
-        'Harghita': 'HR',
-        'Mures': 'MS',
-        'Sibiu': 'SB'
-    }
-
-    # Creeaza harta cu Plotly
-    if geo_type == 'geojson':
-        fig = px.choropleth(
-            df_filtrat,
-            geojson=geo_data,
-            locations='Judete_std',
-            color=an,
-            hover_name='Judete',
-            hover_data={an: ':.0f'},
-            featureidkey="properties.name",
-            projection="mercator",
-            color_continuous_scale="Teal",
-            title=f"Imigranti definitivi in anul {an.split()[-1]} - {'Regiunea Centru' if doar_centru else 'Romania'}"
-        )
-
-        # Adauga labeluri DOAR pentru regiunea Centru
-        if doar_centru:
-            for _, row in df_filtrat.iterrows():
-                if row['Judete'] in coordonate_judete and row['Judete'] in prescurtari_judete:
-                    lat, lon = coordonate_judete[row['Judete']]
-                    prescurtare = prescurtari_judete[row['Judete']]
-                    
-                    fig.add_scattergeo(
-                        lat=[lat],
-                        lon=[lon],
-                        text=[prescurtare],
-                        mode='text',
-                        textfont=dict(
-                            size=14,
-                            color="black",
-                            family="Arial Black"
-                        ),
-                        textposition='middle center',
-                        showlegend=False,
-                        hoverinfo='skip'
-                    )
-
-    fig.update_geos(
-        fitbounds="locations",
-        visible=False,
-        bgcolor="rgba(0,0,0,0)"
-    )
-    fig.update_layout(
-        width=1200,
-        height=800,
-        title=dict(font=dict(size=20)),
-        coloraxis_colorbar=dict(title="Numar imigranti"),
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)"
+        list(INDICATORI)
     )
+    choropleth_indicator(tip_analiza)
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def pregateste_date_harta(indicator, valoare_dimensiune, an, doar_centru, versiune):
+    # Cadrul afisat pe harta pentru o selectie: judetele cerute, filtrate si agregate direct in SQL,
+    # cu coloanele Judete (numele canonic, identic cu cel din ro.json) si valoarea anului ales;
+    # fara an (an=None) se pastreaza toti anii, de la cel mai recent la cel mai vechi
+    config = INDICATORI[indicator]
+    judete = JUDETE_CENTRU if doar_centru else TOATE_JUDETELE
+    filtre = {config['dimensiune']: [valoare_dimensiune]} if config.get('dimensiune') else None
+    ani = [an] if an else ani_tabel(config['tabel'])
+    df = tabel_filtrat(config['tabel'], judete=judete, filtre=filtre, ani=ani)[['Judete'] + ani]
+    if config.get('agregare') == 'suma':
+        df = df.groupby('Judete')[ani].sum().reset_index()
+    return df
 
-    st.plotly_chart(fig, use_container_width=True)
-    st.markdown("#### Datele afisate pe harta")
-    st.dataframe(df_filtrat[['Judete', an]].set_index('Judete'))
-
-def choropleth_rata_somaj(geo_data, geo_type):
-    # Creeaza choropleth map pentru rata somajului
-    st.subheader("Rata somajului pe judete - Harta interactiva")
-
-    # Incarca datele de somaj
-    df_somaj = incarca_date('Somaj')
-    df_somaj = replace_total_with_romania(df_somaj)
-
-    # Selecteaza parametrii
-    ani = sorted([col for col in df_somaj.columns if col.startswith('Anul')],
-                 key=lambda x: int(x.split()[-1]), reverse=True)
-    sex = st.selectbox("Alege sexul:", df_somaj['Sexe'].unique())
-    an = st.selectbox("Alege anul:", ani, index=0)
-    doar_centru = st.checkbox("Afiseaza doar regiunea Centru", value=False)
-
-    # Filtreaza datele
-    df_filtrat = filtreaza_judete_pentru_harta(df_somaj, doar_centru)
-    df_filtrat = df_filtrat[df_filtrat['Sexe'] == sex]
-    df_filtrat = converteste_ani_la_float(df_filtrat, [an])
-
-    # Standardizeaza numele judetelor
-    df_filtrat['Judete_std'] = df_filtrat['Judete'].apply(standardizeaza_nume_judete)
-
-    # Coordonatele și prescurtările județelor din regiunea Centru
-    coordonate_judete = {
-        'Alba': (46.0667, 23.5833),
-        'Brasov': (45.6500, 25.6000),
-        'Covasna': (45.8667, 26.1833),
-        'Harghita': (46.3600, 25.8000),
-        'Mures': (46.5500, 24.5667),
-        'Sibiu': (45.7833, 24.1500)
-    }
-    
-    prescurtari_judete = {
-        'Alba': 'AB',
-        'Brasov': 'BV', 
-        'Covasna': 'CV',
-        'Harghita': 'HR',
-        'Mures': 'MS',
-        'Sibiu': 'SB'
-    }
-
-    # Creeaza harta cu Plotly
-    if geo_type == 'geojson':
-        fig = px.choropleth(
-            df_filtrat,
-            geojson=geo_data,
-            locations='Judete_std',
-            color=an,
-            hover_name='Judete',
-            hover_data={an: ':.2f'},
-            featureidkey="properties.name",
-            projection="mercator",
-            color_continuous_scale="Reds",
-            title=f"Rata somajului ({sex}) in anul {an.split()[-1]} - {'Regiunea Centru' if doar_centru else 'Romania'}"
-        )
-
-        # Adauga labeluri DOAR pentru regiunea Centru
-        if doar_centru:
-            for _, row in df_filtrat.iterrows():
-                if row['Judete'] in coordonate_judete and row['Judete'] in prescurtari_judete:
-                    lat, lon = coordonate_judete[row['Judete']]
-                    prescurtare = prescurtari_judete[row['Judete']]
-                    
-                    fig.add_scattergeo(
-                        lat=[lat],
-                        lon=[lon],
-                        text=[prescurtare],
-                        mode='text',
-                        textfont=dict(
-                            size=14,
-                            color="black",
-                            family="Arial Black"
-                        ),
-                        textposition='middle center',
-                        showlegend=False,
-                        hoverinfo='skip'
-                    )
-
-    fig.update_geos(
-        fitbounds="locations",
-        visible=False,
-        bgcolor="rgba(0,0,0,0)"
-    )
-    fig.update_layout(
-        width=1200,
-        height=800,
-        title=dict(font=dict(size=20)),
-        coloraxis_colorbar=dict(title="Rata somaj (%)"),
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)"
+# Comutatorul modului in care anul se schimba in browser, pe graficele cu selectie de an
+ETICHETA_MOD_INTERACTIV = "Schimba anul direct pe grafic (fara reincarcare)"
+AJUTOR_MOD_INTERACTIV = ("Datele tuturor anilor sunt trimise o singura data, iar anul se alege din slider-ul "
+                         "graficului, fara rularea din nou a paginii")
+
+def slider_ani(ani, modificari, urme):
+    # Slider Plotly care schimba anul direct in browser: fiecare pas aplica (method 'update') modificarile
+    # urmelor si ale layout-ului pentru un an, fara rerulare Streamlit si fara cerere catre server.
+    # modificari - lista (restyle, relayout) in ordinea anilor; urme - indicii urmelor modificate.
+    # Pasii sunt in ordine cronologica, iar pasul activ este primul an din ani (cel afisat initial).
+    pasi = sorted(zip(ani, modificari), key=lambda pas: int(pas[0].split()[-1]))
+    return [dict(
+        active=[an for an, _ in pasi].index(ani[0]),
+        currentvalue=dict(font=dict(size=16), prefix="Anul: ", visible=True, xanchor="right"),
+        pad=dict(b=10, t=50),
+        len=0.9,
+        x=0.1,
+        y=0,
+        steps=[dict(label=an.split()[-1], method="update", args=[restyle, relayout, urme])
+               for an, (restyle, relayout) in pasi]
+    )]
+
+def figura_choropleth(indicator, valoare_dimensiune, an, doar_centru, etichete, versiune):
+    # Figura pentru o selectie; se construieste doar la prima cerere, apoi vine din cache-ul figurilor.
+    # Fara an (an=None) figura contine matricea judete x ani, iar anul se alege din slider, in browser.
+    config = INDICATORI[indicator]
+    df = pregateste_date_harta(indicator, valoare_dimensiune, an, doar_centru, versiune)
+    ani = list(df.columns[1:])
+    an = ani[0]
+    geo_data, geo_type = incarca_date_geografice(nivel_detaliu(doar_centru))
+    geojson = geo_data if geo_type == 'geojson' else geo_data.__geo_interface__
+
+    eticheta_dimensiune = valoare_dimensiune
+    if config.get('dimensiune') == 'Activitati ale economiei':
+        eticheta_dimensiune = prescurteaza_activitate(valoare_dimensiune)
+    zona = 'Regiunea Centru' if doar_centru else 'Romania'
+
+    def titlu(an):
+        return f"{config['titlu'].format(dimensiune=eticheta_dimensiune, an=an.split()[-1])} - {zona}"
+
+    df_harta = df.assign(Valoare=df[an] * config.get('factor_harta', 1))
+    fig = px.choropleth(
+        df_harta,
+        geojson=geojson,
+        locations='Judete',
+        color='Valoare',
+        hover_name='Judete',
+        hover_data={'Valoare': config['format_valoare'], 'Judete': False},
+        labels={'Valoare': an if len(ani) == 1 else config['titlu_scala']},
+        featureidkey="properties.name",
+        projection="mercator",
+        color_continuous_scale=config['scala'],
+        title=titlu(an)
     )
 
-    st.plotly_chart(fig, use_container_width=True)
-    # Afiseaza tabelul cu datele
-    st.markdown("#### Datele afisate pe harta")
-    st.dataframe(df_filtrat[['Judete', an]].set_index('Judete'))
-
-def choropleth_rata_ocupare(geo_data, geo_type):
-    # Creeaza choropleth map pentru rata de ocupare
-    st.subheader("Rata de ocupare a resurselor de munca - Harta interactiva")
-
-    # Incarca datele de ocupare
-    df_resurse = incarca_date('Resurse')
-    df_resurse = replace_total_with_romania(df_resurse)
-
-    # Selecteaza parametrii
-    ani = sorted([col for col in df_resurse.columns if col.startswith('Anul')],
-                 key=lambda x: int(x.split()[-1]), reverse=True)
-    an = st.selectbox("Alege anul:", ani, index=0)
-    doar_centru = st.checkbox("Afiseaza doar regiunea Centru", value=False)
-
-    # Filtreaza datele
-    df_filtrat = filtreaza_judete_pentru_harta(df_resurse, doar_centru)
-    df_filtrat = converteste_ani_la_float(df_filtrat, [an])
-    df_filtrat['Judete_std'] = df_filtrat['Judete'].apply(standardizeaza_nume_judete)
-
-    # Coordonatele si prescurtarile judetelor din regiunea Centru
-    coordonate_judete = {
-        'Alba': (46.0667, 23.5833),
-        'Brasov': (45.6500, 25.6000),
-        'Covasna': (45.8667, 26.1833),
-        'Harghita': (46.3600, 25.8000),
-        'Mures': (46.5500, 24.5667),
-        'Sibiu': (45.7833, 24.1500)
-    }
-    
-    prescurtari_judete = {
-        'Alba': 'AB',
-        'Brasov': 'BV', 
-        'Covasna': 'CV',
-        'Harghita': 'HR',
-        'Mures': 'MS',
-        'Sibiu': 'SB'
-    }
-
-    # Creeaza harta cu Plotly
-    if geo_type == 'geojson':
-        fig = px.choropleth(
-            df_filtrat,
-            geojson=geo_data,
-            locations='Judete_std',
-            color=an,
-            hover_name='Judete',
-            hover_data={an: ':.2f'},
-            featureidkey="properties.name",
-            projection="mercator",
-            color_continuous_scale="Blues",
-            title=f"Rata de ocupare a resurselor de munca in anul {an.split()[-1]} - {'Regiunea Centru' if doar_centru else 'Romania'}"
-        )
-
-        # Adauga labeluri DOAR pentru regiunea Centru
-        if doar_centru:
-            for _, row in df_filtrat.iterrows():
-                if row['Judete'] in coordonate_judete and row['Judete'] in prescurtari_judete:
-                    lat, lon = coordonate_judete[row['Judete']]
-                    prescurtare = prescurtari_judete[row['Judete']]
-                    
-                    fig.add_scattergeo(
-                        lat=[lat],
-                        lon=[lon],
-                        text=[prescurtare],
-                        mode='text',
-                        textfont=dict(
-                            size=14,
-                            color="black",
-                            family="Arial Black"
-                        ),
-                        textposition='middle center',
-                        showlegend=False,
-                        hoverinfo='skip'
-                    )
+    # Etichetele judetelor: mereu pentru regiunea Centru, la cerere pentru toata tara
+    if doar_centru or etichete:
+        fig.add_trace(trace_etichete_judete(df_harta['Judete']))
 
     fig.update_geos(
         fitbounds="locations",
@@ -683,422 +641,74 @@ def choropleth_rata_ocupare(geo_data, geo_type):
         width=1200,
         height=800,
         title=dict(font=dict(size=20)),
-        coloraxis_colorbar=dict(title="Rata ocupare (%)"),
+        coloraxis_colorbar=dict(title=config['titlu_scala']),
         paper_bgcolor="rgba(0,0,0,0)",
         plot_bgcolor="rgba(0,0,0,0)"
     )
-
-    st.plotly_chart(fig, use_container_width=True)
-    st.markdown("#### Datele afisate pe harta")
-    st.dataframe(df_filtrat[['Judete', an]].set_index('Judete'))
-
-def choropleth_populatie_activa(geo_data, geo_type):
-    # Creeaza choropleth map pentru populatia activa
-    st.subheader("Populatia activa - Harta interactiva")
-
-    # Incarca datele de populatie activa
-    df_popactiva = incarca_date('PopActiva')
-    df_popactiva = replace_total_with_romania(df_popactiva)
-
-    # Selecteaza parametrii
-    ani = sorted([col for col in df_popactiva.columns if col.startswith('Anul')],
-                 key=lambda x: int(x.split()[-1]), reverse=True)
-    sex = st.selectbox("Alege sexul:", df_popactiva['Sexe'].unique())
-    an = st.selectbox("Alege anul:", ani, index=0)
+    if len(ani) > 1:
+        factor = config.get('factor_harta', 1)
+        fig.update_layout(sliders=slider_ani(
+            ani, [({'z': [df[a].to_numpy() * factor]}, {'title.text': titlu(a)}) for a in ani], [0]))
+    return fig
+
+def choropleth_indicator(indicator):
+    # Motorul unic de choropleth: widget-urile si harta sunt generate din intrarea din INDICATORI
+    config = INDICATORI[indicator]
+    st.subheader(f"{config['subtitlu']} - Harta interactiva")
+
+    valoare_dimensiune = None
+    if config.get('dimensiune') == 'Activitati ale economiei':
+        _, denumiri = index_activitati(valori_distincte(config['tabel'], config['dimensiune']))
+        activitate = st.selectbox(config['eticheta_dimensiune'], list(denumiri))
+        valoare_dimensiune = denumiri[activitate]
+    elif config.get('dimensiune'):
+        valoare_dimensiune = st.selectbox(config['eticheta_dimensiune'],
+                                          valori_distincte(config['tabel'], config['dimensiune']))
+    loc_an = st.container()
     doar_centru = st.checkbox("Afiseaza doar regiunea Centru", value=False)
-
-    # Filtreaza datele
-    df_filtrat = filtreaza_judete_pentru_harta(df_popactiva, doar_centru)
-    df_filtrat = df_filtrat[df_filtrat['Sexe'] == sex]
-    df_filtrat = converteste_ani_la_float(df_filtrat, [an])
-    df_filtrat['Judete_std'] = df_filtrat['Judete'].apply(standardizeaza_nume_judete)
-
-    # Coordonatele si prescurtarile judetelor din regiunea Centru
-    coordonate_judete = {
-        'Alba': (46.0667, 23.5833),
-        'Brasov': (45.6500, 25.6000),
-        'Covasna': (45.8667, 26.1833),
-        'Harghita': (46.3600, 25.8000),
-        'Mures': (46.5500, 24.5667),
-        'Sibiu': (45.7833, 24.1500)
-    }
-    
-    prescurtari_judete = {
-        'Alba': 'AB',
-        'Brasov': 'BV', 
-        'Covasna': 'CV',
-        'Harghita': 'HR',
-        'Mures': 'MS',
-        'Sibiu': 'SB'
-    }
-
-    # Creeaza harta cu Plotly
-    if geo_type == 'geojson':
-        fig = px.choropleth(
-            df_filtrat,
-            geojson=geo_data,
-            locations='Judete_std',
-            color=an,
-            hover_name='Judete',
-            hover_data={an: ':.0f'},
-            featureidkey="properties.name",
-            projection="mercator",
-            color_continuous_scale="Greens",
-            title=f"Populatia activa ({sex}) in anul {an.split()[-1]} - {'Regiunea Centru' if doar_centru else 'Romania'}"
-        )
-
-        # Adauga labeluri DOAR pentru regiunea Centru
-        if doar_centru:
-            for _, row in df_filtrat.iterrows():
-                if row['Judete'] in coordonate_judete and row['Judete'] in prescurtari_judete:
-                    lat, lon = coordonate_judete[row['Judete']]
-                    prescurtare = prescurtari_judete[row['Judete']]
-                    
-                    fig.add_scattergeo(
-                        lat=[lat],
-                        lon=[lon],
-                        text=[prescurtare],
-                        mode='text',
-                        textfont=dict(
-                            size=14,
-                            color="black",
-                            family="Arial Black"
-                        ),
-                        textposition='middle center',
-                        showlegend=False,
-                        hoverinfo='skip'
-                    )
-
-    fig.update_geos(
-        fitbounds="locations",
-        visible=False,
-        bgcolor="rgba(0,0,0,0)"
-    )
-    fig.update_layout(
-        width=1200,
-        height=800,
-        title=dict(font=dict(size=20)),
-        coloraxis_colorbar=dict(title="Populatie activa (mii persoane)"),
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)"
-    )
-
-    st.plotly_chart(fig, use_container_width=True)
+    etichete = doar_centru or st.checkbox("Afiseaza prescurtarile judetelor", value=False)
+    # In modul interactiv toti anii sunt trimisi o singura data, iar anul se schimba din slider-ul hartii
+    an = None
+    if not st.checkbox(ETICHETA_MOD_INTERACTIV, value=False, help=AJUTOR_MOD_INTERACTIV):
+        an = loc_an.selectbox("Alege anul:", ani_tabel(config['tabel']), index=0)
+
+    versiune = versiune_date()
+    figura = figura_memorata(
+        "Analiză spațială", (indicator, valoare_dimensiune, an, doar_centru, etichete), versiune,
+        lambda: figura_choropleth(indicator, valoare_dimensiune, an, doar_centru, etichete, versiune))
+    afiseaza_figura(figura)
     st.markdown("#### Datele afisate pe harta")
-    st.dataframe(df_filtrat[['Judete', an]].set_index('Judete'))
-
-def choropleth_absolventi(geo_data, geo_type):
-    # Creeaza choropleth map pentru numarul total de absolventi
-    st.subheader("Numarul total de absolventi - Harta interactiva")
-
-    # Incarca datele de absolventi
-    df_absolventi = incarca_date('Absolventi')
-    df_absolventi = replace_total_with_romania(df_absolventi)
+    df = pregateste_date_harta(indicator, valoare_dimensiune, an, doar_centru, versiune)
+    afiseaza_tabel(df.set_index('Judete'))
 
-    # Selecteaza parametrii
-    ani = sorted([col for col in df_absolventi.columns if col.startswith('Anul')],
+def analiza_pib_evolutie():
+    # Analiza evolutiei PIB-ului regional pe locuitor
+    st.header("Evolutia PIB-ului regional pe locuitor")
+    st.info("Acest grafic arata evolutia PIB-ului regional pe locuitor in timp pentru fiecare judet din regiunea Centru. "
+            "Linia alba punctata reprezinta media nationala.")
+    
+    df = tabel_tipizat('PIB')
+    ani = sorted([col for col in df.columns if col.startswith('Anul')],
                  key=lambda x: int(x.split()[-1]), reverse=True)
-    an = st.selectbox("Alege anul:", ani, index=0)
-    doar_centru = st.checkbox("Afiseaza doar regiunea Centru", value=False)
-
-    # Filtreaza datele
-    df_filtrat = filtreaza_judete_pentru_harta(df_absolventi, doar_centru)
-    df_filtrat = converteste_ani_la_float(df_filtrat, [an])
-    df_total = df_filtrat.groupby('Judete')[an].sum().reset_index()
-    df_total['Judete_std'] = df_total['Judete'].apply(standardizeaza_nume_judete)
-
-    # Coordonatele si prescurtarile judetelor din regiunea Centru
-    coordonate_judete = {
-        'Alba': (46.0667, 23.5833),
-        'Brasov': (45.6500, 25.6000),
-        'Covasna': (45.8667, 26.1833),
-        'Harghita': (46.3600, 25.8000),
-        'Mures': (46.5500, 24.5667),
-        'Sibiu': (45.7833, 24.1500)
-    }
-    
-    prescurtari_judete = {
-        'Alba': 'AB',
-        'Brasov': 'BV', 
-        'Covasna': 'CV',
-        'Harghita': 'HR',
-        'Mures': 'MS',
-        'Sibiu': 'SB'
-    }
-
-    # Creeaza harta cu Plotly
-    if geo_type == 'geojson':
-        fig = px.choropleth(
-            df_total,
-            geojson=geo_data,
-            locations='Judete_std',
-            color=an,
-            hover_name='Judete',
-            hover_data={an: ':.0f'},
-            featureidkey="properties.name",
-            projection="mercator",
-            color_continuous_scale="Purples",
-            title=f"Numarul total de absolventi in anul {an.split()[-1]} - {'Regiunea Centru' if doar_centru else 'Romania'}"
-        )
+    
+    df_filtrat = df[(df['Judete'].isin(['Alba', 'Brasov', 'Covasna', 'Harghita', 'Mures', 'Sibiu'])) |
+                    (df['Judete'] == 'Romania')]
+    
+    grafic_linie_pib(df_filtrat, ani, "Evolutia PIB-ului regional pe locuitor", "PIB pe locuitor (lei)")
 
-        # Adauga labeluri DOAR pentru regiunea Centru
-        if doar_centru:
-            for _, row in df_total.iterrows():
-                if row['Judete'] in coordonate_judete and row['Judete'] in prescurtari_judete:
-                    lat, lon = coordonate_judete[row['Judete']]
-                    prescurtare = prescurtari_judete[row['Judete']]
-                    
-                    fig.add_scattergeo(
-                        lat=[lat],
-                        lon=[lon],
-                        text=[prescurtare],
-                        mode='text',
-                        textfont=dict(
-                            size=14,
-                            color="black",
-                            family="Arial Black"
-                        ),
-                        textposition='middle center',
-                        showlegend=False,
-                        hoverinfo='skip'
-                    )
+def grafic_linie_pib(df, ani, titlu, ylabel):
+    # Creaza grafic linie pentru evolutia PIB-ului pe judete
+    st.divider()
+    figura = figura_memorata("Evoluție PIB", (titlu, ylabel), versiune_date(),
+                             lambda: figura_linie_pib(df, ani, titlu, ylabel))
+    afiseaza_figura(figura)
+    st.markdown("#### Tabel cu datele")
+    afiseaza_tabel(df.set_index('Judete')[ani])
+    st.divider()
 
-    fig.update_geos(
-        fitbounds="locations",
-        visible=False,
-        bgcolor="rgba(0,0,0,0)"
-    )
-    fig.update_layout(
-        width=1200,
-        height=800,
-        title=dict(font=dict(size=20)),
-        coloraxis_colorbar=dict(title="Numar absolventi"),
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)"
-    )
-
-    st.plotly_chart(fig, use_container_width=True)
-    st.markdown("#### Datele afisate pe harta")
-    st.dataframe(df_total.set_index('Judete')[[an]])
-
-def choropleth_salariati_total(geo_data, geo_type):
-    # Creeaza choropleth map pentru numarul total de salariati
-    st.subheader("Numarul total de salariati - Harta interactiva")
-
-    # Incarca datele de salariati
-    df_salariati = incarca_date('Salariati2')
-    df_salariati = replace_total_with_romania(df_salariati)
-
-    # Selecteaza parametrii
-    ani = sorted([col for col in df_salariati.columns if col.startswith('Anul')],
-                 key=lambda x: int(x.split()[-1]), reverse=True)
-    an = st.selectbox("Alege anul:", ani, index=0)
-    doar_centru = st.checkbox("Afiseaza doar regiunea Centru", value=False)
-
-    # Calculeaza totalul pe judete
-    df_filtrat = filtreaza_judete_pentru_harta(df_salariati, doar_centru)
-    df_filtrat = converteste_ani_la_float(df_filtrat, [an])
-    df_total = df_filtrat.groupby('Judete')[an].sum().reset_index()
-    df_total['Judete_std'] = df_total['Judete'].apply(standardizeaza_nume_judete)
-
-    # Converteste la mii pentru afisare
-    df_total[f'{an}_mii'] = df_total[an] / 1000
-
-    # Coordonatele și prescurtările județelor din regiunea Centru
-    coordonate_judete = {
-        'Alba': (46.0667, 23.5833),
-        'Brasov': (45.6500, 25.6000),
-        'Covasna': (45.8667, 26.1833),
-        'Harghita': (46.3600, 25.8000),
-        'Mures': (46.5500, 24.5667),
-        'Sibiu': (45.7833, 24.1500)
-    }
-    
-    prescurtari_judete = {
-        'Alba': 'AB',
-        'Brasov': 'BV', 
-        'Covasna': 'CV',
-        'Harghita': 'HR',
-        'Mures': 'MS',
-        'Sibiu': 'SB'
-    }
-
-    # Creeaza harta cu Plotly
-    if geo_type == 'geojson':
-        fig = px.choropleth(
-            df_total,
-            geojson=geo_data,
-            locations='Judete_std',
-            color=f'{an}_mii',
-            hover_name='Judete',
-            hover_data={f'{an}_mii': ':.1f'},
-            featureidkey="properties.name",
-            projection="mercator",
-            color_continuous_scale="Burg",
-            title=f"Numarul total de salariati in anul {an.split()[-1]} - {'Regiunea Centru' if doar_centru else 'Romania'}"
-        )
-
-        # Adauga labeluri DOAR pentru regiunea Centru
-        if doar_centru:
-            for _, row in df_total.iterrows():
-                if row['Judete'] in coordonate_judete and row['Judete'] in prescurtari_judete:
-                    lat, lon = coordonate_judete[row['Judete']]
-                    prescurtare = prescurtari_judete[row['Judete']]
-                    
-                    fig.add_scattergeo(
-                        lat=[lat],
-                        lon=[lon],
-                        text=[prescurtare],
-                        mode='text',
-                        textfont=dict(
-                            size=14,
-                            color="black",
-                            family="Arial Black"
-                        ),
-                        textposition='middle center',
-                        showlegend=False,
-                        hoverinfo='skip'
-                    )
-
-    fig.update_geos(
-        fitbounds="locations",
-        visible=False,
-        bgcolor="rgba(0,0,0,0)"
-    )
-    fig.update_layout(
-        width=1200,
-        height=800,
-        title=dict(font=dict(size=20)),
-        coloraxis_colorbar=dict(title="Numar salariati (mii)"),
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)"
-    )
-
-    st.plotly_chart(fig, use_container_width=True)
-    st.markdown("#### Datele afisate pe harta")
-    df_display = df_total[['Judete', an]].set_index('Judete')
-    st.dataframe(df_display)
-
-def choropleth_salariati_activitati(geo_data, geo_type):
-    # Creeaza choropleth map pentru salariati pe activitati economice
-    st.subheader("Numarul de salariati pe activitati economice - Harta interactiva")
-
-    # Incarca datele de salariati
-    df_salariati = incarca_date('Salariati2')
-    df_salariati = replace_total_with_romania(df_salariati)
-
-    # Selecteaza parametrii
-    ani = sorted([col for col in df_salariati.columns if col.startswith('Anul')],
-                 key=lambda x: int(x.split()[-1]), reverse=True)
-    an = st.selectbox("Alege anul:", ani, index=0)
-    doar_centru = st.checkbox("Afiseaza doar regiunea Centru", value=False)
-
-    activitati = df_salariati['Activitati ale economiei'].unique()
-    activitati_prescurtate = [prescurteaza_activitate(a) for a in activitati]
-    activitate = st.selectbox("Alege activitatea economica:", activitati_prescurtate)
-    activitate_originala = [a for a in activitati if prescurteaza_activitate(a) == activitate][0]
-
-    # Filtreaza datele
-    df_filtrat = filtreaza_judete_pentru_harta(df_salariati, doar_centru)
-    df_filtrat = df_filtrat[df_filtrat['Activitati ale economiei'] == activitate_originala]
-    df_filtrat = converteste_ani_la_float(df_filtrat, [an])
-    df_filtrat['Judete_std'] = df_filtrat['Judete'].apply(standardizeaza_nume_judete)
-
-    # Coordonatele si prescurtarile judetelor din regiunea Centru
-    coordonate_judete = {
-        'Alba': (46.0667, 23.5833),
-        'Brasov': (45.6500, 25.6000),
-        'Covasna': (45.8667, 26.1833),
-        'Harghita': (46.3600, 25.8000),
-        'Mures': (46.5500, 24.5667),
-        'Sibiu': (45.7833, 24.1500)
-    }
-    
-    prescurtari_judete = {
-        'Alba': 'AB',
-        'Brasov': 'BV', 
-        'Covasna': 'CV',
-        'Harghita': 'HR',
-        'Mures': 'MS',
-        'Sibiu': 'SB'
-    }
-
-    # Creeaza harta cu Plotly
-    if geo_type == 'geojson':
-        fig = px.choropleth(
-            df_filtrat,
-            geojson=geo_data,
-            locations='Judete_std',
-            color=an,
-            hover_name='Judete',
-            hover_data={an: ':.0f'},
-            featureidkey="properties.name",
-            projection="mercator",
-            color_continuous_scale="Oranges",
-            title=f"Salariati in {activitate} ({an.split()[-1]}) - {'Regiunea Centru' if doar_centru else 'Romania'}"
-        )
-
-        # Adauga labeluri DOAR pentru regiunea Centru
-        if doar_centru:
-            for _, row in df_filtrat.iterrows():
-                if row['Judete'] in coordonate_judete and row['Judete'] in prescurtari_judete:
-                    lat, lon = coordonate_judete[row['Judete']]
-                    prescurtare = prescurtari_judete[row['Judete']]
-                    
-                    fig.add_scattergeo(
-                        lat=[lat],
-                        lon=[lon],
-                        text=[prescurtare],
-                        mode='text',
-                        textfont=dict(
-                            size=14,
-                            color="black",
-                            family="Arial Black"
-                        ),
-                        textposition='middle center',
-                        showlegend=False,
-                        hoverinfo='skip'
-                    )
-
-    fig.update_geos(
-        fitbounds="locations",
-        visible=False,
-        bgcolor="rgba(0,0,0,0)"
-    )
-    fig.update_layout(
-        width=1200,
-        height=800,
-        title=dict(font=dict(size=20)),
-        coloraxis_colorbar=dict(title="Numar salariati"),
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)"
-    )
-
-    st.plotly_chart(fig, use_container_width=True)
-    st.markdown("#### Datele afisate pe harta")
-    st.dataframe(df_filtrat[['Judete', an]].set_index('Judete'))
-
-def analiza_pib_evolutie():
-    # Analiza evolutiei PIB-ului regional pe locuitor
-    st.header("Evolutia PIB-ului regional pe locuitor")
-    st.info("Acest grafic arata evolutia PIB-ului regional pe locuitor in timp pentru fiecare judet din regiunea Centru. "
-            "Linia alba punctata reprezinta media nationala.")
-    
-    df = incarca_date('PIB')
-    ani = sorted([col for col in df.columns if col.startswith('Anul')],
-                 key=lambda x: int(x.split()[-1]), reverse=True)
-    
-    df_filtrat = df[(df['Judete'].isin(['Alba', 'Brasov', 'Covasna', 'Harghita', 'Mures', 'Sibiu'])) |
-                    (df['Judete'].str.upper() == 'TOTAL')]
-    
-    grafic_linie_pib(df_filtrat, ani, "Evolutia PIB-ului regional pe locuitor", "PIB pe locuitor (lei)")
-
-def grafic_linie_pib(df, ani, titlu, ylabel):
-    # Creaza grafic linie pentru evolutia PIB-ului pe judete
-    st.divider()
+def figura_linie_pib(df, ani, titlu, ylabel):
+    # Figura cu evolutia PIB-ului pe judete si linia mediei nationale
     ani_num = extrage_ani(ani)
-    df = replace_total_with_romania(df)
-    df = converteste_ani_la_float(df, ani)
     df_judete = df[df['Judete'] != 'Romania']
     
     fig = go.Figure()
@@ -1115,522 +725,169 @@ def grafic_linie_pib(df, ani, titlu, ylabel):
             marker=dict(size=10, line=dict(width=1.5, color="#222"), color=color)
         ))
     
-    # Adauga linia pentru media nationala (Romania)
-    df_total = df[df['Judete'] == 'Romania']
-    if not df_total.empty:
-        row = df_total.iloc[0]
-        fig.add_trace(go.Scatter(
-            x=ani_num,
-            y=[row[an] for an in ani],
-            mode='lines+markers',
-            name="Medie Romania",
-            text=[f"Medie Romania<br>{an}: {row[an]:.0f} lei" for an in ani],
-            hoverinfo='text+y',
-            line=dict(width=5, color="#FFFFFF", dash='dot'),
-            marker=dict(size=12, color="#FFFFFF", line=dict(width=2, color='black'))
-        ))
-    
-    # Configurare aspect grafic
-    fig.update_layout(
-        width=1000, height=650,
-        font=dict(family="Segoe UI, Arial", size=16),
-        title=dict(text=titlu, font=dict(size=26)),
-        xaxis_title=dict(text="Anul", font=dict(size=18)),
-        yaxis_title=dict(text=ylabel, font=dict(size=18)),
-        yaxis=dict(tickfont=dict(size=14)),
-        xaxis=dict(tickfont=dict(size=14)),
-        legend_title=dict(text="Judet", font=dict(size=16)),
-        legend=dict(font=dict(size=14)),
-        hovermode="x unified"
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
-    st.markdown("#### Tabel cu datele")
-    st.dataframe(df.set_index('Judete')[ani])
-    st.divider()
-
-def analiza_statistici_descriptive():
-    # Analiza cu statistici descriptive pentru diferite indicatori
-    st.header("Statistici descriptive pentru indicatorii pietei muncii")
-    st.info("Aceasta analiza calculeaza statistici descriptive (media, mediana, dispersia, etc.) "
-            "pentru diferiti indicatori ai pietei muncii din regiunea Centru.")
-    
-    # Selecteaza tipul de indicator
-    tip_indicator = st.selectbox(
-        "Alege indicatorul pentru analiza:",
-        [
-            "Rata somajului",
-            "PIB regional pe locuitor", 
-            "Castigul salarial mediu net",
-            "Rata de ocupare a resurselor de munca",
-            "Populatia activa",
-            "Imigranti definitivi"
-        ]
-    )
-    
-    if tip_indicator == "Rata somajului":
-        calculeaza_statistici_somaj()
-    elif tip_indicator == "PIB regional pe locuitor":
-        calculeaza_statistici_pib()
-    elif tip_indicator == "Castigul salarial mediu net":
-        calculeaza_statistici_salariu()
-    elif tip_indicator == "Rata de ocupare a resurselor de munca":
-        calculeaza_statistici_ocupare()
-    elif tip_indicator == "Populatia activa":
-        calculeaza_statistici_populatie()
-    elif tip_indicator == "Imigranti definitivi":
-        calculeaza_statistici_imigranti()
-
-def verifica_semnificativitatea_statistici(valori, nume_indicator):
-    """
-    Verifica semnificativitatea statisticilor descriptive
-    """
-    rezultate = {}
-    n = len(valori)
-    
-    # Test de normalitate
-    if n <= 50:
-        # Shapiro-Wilk pentru esantioane mici
-        stat_shapiro, p_shapiro = shapiro(valori)
-        rezultate['test_normalitate'] = f"Shapiro-Wilk: statistica={stat_shapiro:.4f}, p-value={p_shapiro:.4f}"
-        rezultate['normalitate_concluzie'] = "Datele urmează distribuția normală" if p_shapiro > 0.05 else "Datele NU urmează distribuția normală"
-    else:
-        # Kolmogorov-Smirnov pentru esantioane mari
-        stat_ks, p_ks = kstest(valori, 'norm')
-        rezultate['test_normalitate'] = f"Kolmogorov-Smirnov: statistica={stat_ks:.4f}, p-value={p_ks:.4f}"
-        rezultate['normalitate_concluzie'] = "Datele urmează distribuția normală" if p_ks > 0.05 else "Datele NU urmează distribuția normală"
-    
-    # Intervale de incredere pentru medie (95% si 99%)
-    media = np.mean(valori)
-    eroare_std = stats.sem(valori)  # Standard error of mean
-    
-    # Interval 95%
-    ic_95 = stats.t.interval(0.95, n-1, loc=media, scale=eroare_std)
-    rezultate['interval_incredere_95'] = f"IC 95% pentru medie: [{ic_95[0]:.3f}, {ic_95[1]:.3f}]"
-    
-    # Interval 99%
-    ic_99 = stats.t.interval(0.99, n-1, loc=media, scale=eroare_std)
-    rezultate['interval_incredere_99'] = f"IC 99% pentru medie: [{ic_99[0]:.3f}, {ic_99[1]:.3f}]"
-    
-    # Test t pentru media (testam daca media difera semnificativ de 0)
-    t_stat, p_t = ttest_1samp(valori, 0)
-    rezultate['test_t_media'] = f"Test t pentru medie=0: t={t_stat:.4f}, p-value={p_t:.4f}"
-    rezultate['media_semnificativa'] = "Media este semnificativ diferită de 0" if p_t < 0.05 else "Media NU este semnificativ diferită de 0"
-    
-    # Detectarea valorilor extreme (outliers) - metoda IQR
-    Q1 = np.percentile(valori, 25)
-    Q3 = np.percentile(valori, 75)
-    IQR = Q3 - Q1
-    limita_inf = Q1 - 1.5 * IQR
-    limita_sup = Q3 + 1.5 * IQR
-    
-    outliers = valori[(valori < limita_inf) | (valori > limita_sup)]
-    rezultate['outliers'] = f"Valori extreme detectate: {len(outliers)} din {n} observații"
-    if len(outliers) > 0:
-        rezultate['lista_outliers'] = f"Valorile extreme sunt: {outliers.tolist()}"
-    
-    # Test pentru varianta (test Chi-patrat)
-    varianta_observata = np.var(valori, ddof=1)
-    chi2_stat = (n-1) * varianta_observata / 1
-    p_chi2 = 1 - stats.chi2.cdf(chi2_stat, n-1)
-    rezultate['test_varianta'] = f"Test Chi² pentru varianță: χ²={chi2_stat:.4f}, p-value={p_chi2:.4f}"
-    
-    return rezultate
-
-def calculeaza_statistici_somaj():
-    # Calculeaza statistici descriptive pentru rata somajului
-    st.subheader("Statistici descriptive - Rata somajului")
-    
-    df = incarca_date('Somaj')
-    df = replace_total_with_romania(df)
-    
-    # Selecteaza parametrii
-    sex = st.selectbox("Alege sexul:", df['Sexe'].unique())
-    ani = sorted([col for col in df.columns if col.startswith('Anul')],
-                 key=lambda x: int(x.split()[-1]), reverse=True)
-    an = st.selectbox("Alege anul:", ani, index=0)
-    
-    # Filtreaza datele pentru regiunea Centru
-    df_centru = df[(df['Sexe'] == sex) & 
-                   (df['Judete'].isin(['Alba', 'Brasov', 'Covasna', 'Harghita', 'Mures', 'Sibiu']))]
-    df_centru = converteste_ani_la_float(df_centru, [an])
-    
-    # Calculeaza statisticile
-    valori = df_centru[an].dropna()
-    
-    statistici = {
-        'Media': np.mean(valori),
-        'Mediana': np.median(valori),
-        'Dispersia': np.var(valori, ddof=1),
-        'Abaterea standard': np.std(valori, ddof=1),
-        'Minimul': np.min(valori),
-        'Maximul': np.max(valori),
-        'Coeficientul de variatie (%)': (np.std(valori, ddof=1) / np.mean(valori)) * 100,
-        'Amplitudinea': np.max(valori) - np.min(valori)
-    }
-    
-    # Afiseaza rezultatele
-    st.markdown("#### Statistici descriptive calculate")
-    df_stat = pd.DataFrame(list(statistici.items()), columns=['Statistica', 'Valoare'])
-    df_stat['Valoare'] = df_stat['Valoare'].round(3)
-    st.dataframe(df_stat, use_container_width=True)
-    
-    # Verificarea semnificativitatii
-    rezultate_teste = verifica_semnificativitatea_statistici(valori, "Rata somajului")
-    
-    # Sectiunea informativa cu rezultatele verificarii
-    st.markdown("#### Verificarea semnificativității statisticilor")
-    st.info(f"""
-    **Rezultatele testelor statistice pentru rata somajului:**
-    
-    📊 **Test de normalitate:** {rezultate_teste['test_normalitate']}
-    ✅ **Concluzie normalitate:** {rezultate_teste['normalitate_concluzie']}
-    
-    📈 **Intervale de încredere:**
-    - {rezultate_teste['interval_incredere_95']}
-    - {rezultate_teste['interval_incredere_99']}
-    
-    🎯 **Test pentru medie:** {rezultate_teste['test_t_media']}
-    ✅ **Concluzie medie:** {rezultate_teste['media_semnificativa']}
-    
-    ⚠️ **Valori extreme:** {rezultate_teste['outliers']}
-    {rezultate_teste.get('lista_outliers', '')}
-    
-    📊 **Test pentru varianță:** {rezultate_teste['test_varianta']}
-    
-    **Interpretare:**
-    - Dacă p-value < 0.05 → rezultatul este semnificativ statistic
-    - Intervalele de încredere arată intervalul în care se află adevărata valoare a mediei cu o probabilitate de 95%/99%
-    - Valorile extreme pot influența semnificativ rezultatele statisticilor descriptive
-    """)
-    
-    # Afiseaza datele folosite
-    st.markdown("#### Datele folosite pentru calcul")
-    st.dataframe(df_centru[['Judete', an]].set_index('Judete'))
-
-def calculeaza_statistici_pib():
-    # Calculeaza statistici descriptive pentru PIB
-    st.subheader("Statistici descriptive - PIB regional pe locuitor")
-    
-    df = incarca_date('PIB')
-    df = replace_total_with_romania(df)
-    
-    # Selecteaza parametrii
-    ani = sorted([col for col in df.columns if col.startswith('Anul')],
-                 key=lambda x: int(x.split()[-1]), reverse=True)
-    an = st.selectbox("Alege anul:", ani, index=0)
-    
-    # Filtreaza datele pentru regiunea Centru
-    df_centru = df[df['Judete'].isin(['Alba', 'Brasov', 'Covasna', 'Harghita', 'Mures', 'Sibiu'])]
-    df_centru = converteste_ani_la_float(df_centru, [an])
-    
-    # Calculeaza statisticile
-    valori = df_centru[an].dropna()
-    
-    statistici = {
-        'Media': np.mean(valori),
-        'Mediana': np.median(valori),
-        'Dispersia': np.var(valori, ddof=1),
-        'Abaterea standard': np.std(valori, ddof=1),
-        'Minimul': np.min(valori),
-        'Maximul': np.max(valori),
-        'Coeficientul de variatie (%)': (np.std(valori, ddof=1) / np.mean(valori)) * 100,
-        'Amplitudinea': np.max(valori) - np.min(valori)
-    }
-    
-    # Afiseaza rezultatele
-    st.markdown("#### Statistici descriptive calculate")
-    df_stat = pd.DataFrame(list(statistici.items()), columns=['Statistica', 'Valoare'])
-    df_stat['Valoare'] = df_stat['Valoare'].round(2)
-    st.dataframe(df_stat, use_container_width=True)
-    
-    # Verificarea semnificativitatii
-    rezultate_teste = verifica_semnificativitatea_statistici(valori, "PIB regional pe locuitor")
-    
-    # Sectiunea informativa cu rezultatele verificarii
-    st.markdown("#### Verificarea semnificativității statisticilor")
-    st.info(f"""
-    **Rezultatele testelor statistice pentru PIB regional pe locuitor:**
-    
-    📊 **Test de normalitate:** {rezultate_teste['test_normalitate']}
-    ✅ **Concluzie normalitate:** {rezultate_teste['normalitate_concluzie']}
-    
-    📈 **Intervale de încredere:**
-    - {rezultate_teste['interval_incredere_95']}
-    - {rezultate_teste['interval_incredere_99']}
-    
-    🎯 **Test pentru medie:** {rezultate_teste['test_t_media']}
-    ✅ **Concluzie medie:** {rezultate_teste['media_semnificativa']}
-    
-    ⚠️ **Valori extreme:** {rezultate_teste['outliers']}
-    {rezultate_teste.get('lista_outliers', '')}
-    
-    📊 **Test pentru varianță:** {rezultate_teste['test_varianta']}
-    
-    **Interpretare:**
-    - Dacă p-value < 0.05 → rezultatul este semnificativ statistic
-    - Intervalele de încredere arată intervalul în care se află adevărata valoare a mediei cu o probabilitate de 95%/99%
-    - Valorile extreme pot influența semnificativ rezultatele statisticilor descriptive
-    """)
-    
-    # Afiseaza datele folosite
-    st.markdown("#### Datele folosite pentru calcul")
-    st.dataframe(df_centru[['Judete', an]].set_index('Judete'))
-
-def calculeaza_statistici_salariu():
-    # Calculeaza statistici descriptive pentru salariul mediu
-    st.subheader("Statistici descriptive - Castigul salarial mediu net")
-    
-    df = incarca_date('Salariu')
-    df = replace_total_with_romania(df)
-    
-    # Selecteaza parametrii
-    sex = st.selectbox("Alege sexul:", df['Sexe'].unique())
-    ani = sorted([col for col in df.columns if col.startswith('Anul')],
-                 key=lambda x: int(x.split()[-1]), reverse=True)
-    an = st.selectbox("Alege anul:", ani, index=0)
-    
-    # Filtreaza datele pentru regiunea Centru
-    df_centru = df[(df['Sexe'] == sex) & 
-                   (df['Judete'].isin(['Alba', 'Brasov', 'Covasna', 'Harghita', 'Mures', 'Sibiu']))]
-    df_centru = converteste_ani_la_float(df_centru, [an])
-    
-    # Calculeaza statisticile
-    valori = df_centru[an].dropna()
-    
-    statistici = {
-        'Media': np.mean(valori),
-        'Mediana': np.median(valori),
-        'Dispersia': np.var(valori, ddof=1),
-        'Abaterea standard': np.std(valori, ddof=1),
-        'Minimul': np.min(valori),
-        'Maximul': np.max(valori),
-        'Coeficientul de variatie (%)': (np.std(valori, ddof=1) / np.mean(valori)) * 100,
-        'Amplitudinea': np.max(valori) - np.min(valori)
-    }
-    
-    # Afiseaza rezultatele
-    st.markdown("#### Statistici descriptive calculate")
-    df_stat = pd.DataFrame(list(statistici.items()), columns=['Statistica', 'Valoare'])
-    df_stat['Valoare'] = df_stat['Valoare'].round(2)
-    st.dataframe(df_stat, use_container_width=True)
-    
-    # Verificarea semnificativitatii
-    rezultate_teste = verifica_semnificativitatea_statistici(valori, "Castigul salarial mediu net")
-    
-    # Sectiunea informativa cu rezultatele verificarii
-    st.markdown("#### Verificarea semnificativității statisticilor")
-    st.info(f"""
-    **Rezultatele testelor statistice pentru castigul salarial mediu net:**
-    
-    📊 **Test de normalitate:** {rezultate_teste['test_normalitate']}
-    ✅ **Concluzie normalitate:** {rezultate_teste['normalitate_concluzie']}
-    
-    📈 **Intervale de încredere:**
-    - {rezultate_teste['interval_incredere_95']}
-    - {rezultate_teste['interval_incredere_99']}
-    
-    🎯 **Test pentru medie:** {rezultate_teste['test_t_media']}
-    ✅ **Concluzie medie:** {rezultate_teste['media_semnificativa']}
-    
-    ⚠️ **Valori extreme:** {rezultate_teste['outliers']}
-    {rezultate_teste.get('lista_outliers', '')}
-    
-    📊 **Test pentru varianță:** {rezultate_teste['test_varianta']}
-    
-    **Interpretare:**
-    - Dacă p-value < 0.05 → rezultatul este semnificativ statistic
-    - Intervalele de încredere arată intervalul în care se află adevărata valoare a mediei cu o probabilitate de 95%/99%
-    - Valorile extreme pot influența semnificativ rezultatele statisticilor descriptive
-    """)
-    
-    # Afiseaza datele folosite
-    st.markdown("#### Datele folosite pentru calcul")
-    st.dataframe(df_centru[['Judete', an]].set_index('Judete'))
-
-def calculeaza_statistici_ocupare():
-    # Calculeaza statistici descriptive pentru rata de ocupare
-    st.subheader("Statistici descriptive - Rata de ocupare a resurselor de munca")
-    
-    df = incarca_date('Resurse')
-    df = replace_total_with_romania(df)
-    
-    # Selecteaza parametrii
-    ani = sorted([col for col in df.columns if col.startswith('Anul')],
-                 key=lambda x: int(x.split()[-1]), reverse=True)
-    an = st.selectbox("Alege anul:", ani, index=0)
-    
-    # Filtreaza datele pentru regiunea Centru
-    df_centru = df[df['Judete'].isin(['Alba', 'Brasov', 'Covasna', 'Harghita', 'Mures', 'Sibiu'])]
-    df_centru = converteste_ani_la_float(df_centru, [an])
-    
-    # Calculeaza statisticile
-    valori = df_centru[an].dropna()
-    
-    statistici = {
-        'Media': np.mean(valori),
-        'Mediana': np.median(valori),
-        'Dispersia': np.var(valori, ddof=1),
-        'Abaterea standard': np.std(valori, ddof=1),
-        'Minimul': np.min(valori),
-        'Maximul': np.max(valori),
-        'Coeficientul de variatie (%)': (np.std(valori, ddof=1) / np.mean(valori)) * 100,
-        'Amplitudinea': np.max(valori) - np.min(valori)
-    }
-    
-    # Afiseaza rezultatele
-    st.markdown("#### Statistici descriptive calculate")
-    df_stat = pd.DataFrame(list(statistici.items()), columns=['Statistica', 'Valoare'])
-    df_stat['Valoare'] = df_stat['Valoare'].round(3)
-    st.dataframe(df_stat, use_container_width=True)
-    
-    # Verificarea semnificativitatii
-    rezultate_teste = verifica_semnificativitatea_statistici(valori, "Rata de ocupare a resurselor de munca")
-    
-    # Sectiunea informativa cu rezultatele verificarii
-    st.markdown("#### Verificarea semnificativității statisticilor")
-    st.info(f"""
-    **Rezultatele testelor statistice pentru rata de ocupare a resurselor de munca:**
-    
-    📊 **Test de normalitate:** {rezultate_teste['test_normalitate']}
-    ✅ **Concluzie normalitate:** {rezultate_teste['normalitate_concluzie']}
-    
-    📈 **Intervale de încredere:**
-    - {rezultate_teste['interval_incredere_95']}
-    - {rezultate_teste['interval_incredere_99']}
-    
-    🎯 **Test pentru medie:** {rezultate_teste['test_t_media']}
-    ✅ **Concluzie medie:** {rezultate_teste['media_semnificativa']}
-    
-    ⚠️ **Valori extreme:** {rezultate_teste['outliers']}
-    {rezultate_teste.get('lista_outliers', '')}
-    
-    📊 **Test pentru varianță:** {rezultate_teste['test_varianta']}
-    
-    **Interpretare:**
-    - Dacă p-value < 0.05 → rezultatul este semnificativ statistic
-    - Intervalele de încredere arată intervalul în care se află adevărata valoare a mediei cu o probabilitate de 95%/99%
-    - Valorile extreme pot influența semnificativ rezultatele statisticilor descriptive
-    """)
-    
-    # Afiseaza datele folosite
-    st.markdown("#### Datele folosite pentru calcul")
-    st.dataframe(df_centru[['Judete', an]].set_index('Judete'))
-
-def calculeaza_statistici_populatie():
-    # Calculeaza statistici descriptive pentru populatia activa
-    st.subheader("Statistici descriptive - Populatia activa")
-    
-    df = incarca_date('PopActiva')
-    df = replace_total_with_romania(df)
-    
-    # Selecteaza parametrii
-    sex = st.selectbox("Alege sexul:", df['Sexe'].unique())
-    ani = sorted([col for col in df.columns if col.startswith('Anul')],
-                 key=lambda x: int(x.split()[-1]), reverse=True)
-    an = st.selectbox("Alege anul:", ani, index=0)
-    
-    # Filtreaza datele pentru regiunea Centru
-    df_centru = df[(df['Sexe'] == sex) & 
-                   (df['Judete'].isin(['Alba', 'Brasov', 'Covasna', 'Harghita', 'Mures', 'Sibiu']))]
-    df_centru = converteste_ani_la_float(df_centru, [an])
-    
-    # Calculeaza statisticile
-    valori = df_centru[an].dropna()
-    
-    statistici = {
-        'Media': np.mean(valori),
-        'Mediana': np.median(valori),
-        'Dispersia': np.var(valori, ddof=1),
-        'Abaterea standard': np.std(valori, ddof=1),
-        'Minimul': np.min(valori),
-        'Maximul': np.max(valori),
-        'Coeficientul de variatie (%)': (np.std(valori, ddof=1) / np.mean(valori)) * 100,
-        'Amplitudinea': np.max(valori) - np.min(valori)
-    }
-    
-    # Afiseaza rezultatele
-    st.markdown("#### Statistici descriptive calculate")
-    df_stat = pd.DataFrame(list(statistici.items()), columns=['Statistica', 'Valoare'])
-    df_stat['Valoare'] = df_stat['Valoare'].round(3)
-    st.dataframe(df_stat, use_container_width=True)
-    
-    # Verificarea semnificativitatii
-    rezultate_teste = verifica_semnificativitatea_statistici(valori, "Populatia activa")
+    # Adauga linia pentru media nationala (Romania)
+    df_total = df[df['Judete'] == 'Romania']
+    if not df_total.empty:
+        row = df_total.iloc[0]
+        fig.add_trace(go.Scatter(
+            x=ani_num,
+            y=[row[an] for an in ani],
+            mode='lines+markers',
+            name="Medie Romania",
+            text=[f"Medie Romania<br>{an}: {row[an]:.0f} lei" for an in ani],
+            hoverinfo='text+y',
+            line=dict(width=5, color="#FFFFFF", dash='dot'),
+            marker=dict(size=12, color="#FFFFFF", line=dict(width=2, color='black'))
+        ))
     
-    # Sectiunea informativa cu rezultatele verificarii
-    st.markdown("#### Verificarea semnificativității statisticilor")
-    st.info(f"""
-    **Rezultatele testelor statistice pentru populatia activa:**
+    # Configurare aspect grafic
+    fig.update_layout(
+        width=1000, height=650,
+        font=dict(family="Segoe UI, Arial", size=16),
+        title=dict(text=titlu, font=dict(size=26)),
+        xaxis_title=dict(text="Anul", font=dict(size=18)),
+        yaxis_title=dict(text=ylabel, font=dict(size=18)),
+        yaxis=dict(tickfont=dict(size=14)),
+        xaxis=dict(tickfont=dict(size=14)),
+        legend_title=dict(text="Judet", font=dict(size=16)),
+        legend=dict(font=dict(size=14)),
+        hovermode="x unified"
+    )
+    return fig
+
+# Indicatorii din pagina de statistici descriptive: (zecimale afisate, denumirea folosita in text).
+# Tabelul si dimensiunea fiecaruia sunt luate din INDICATORI.
+STATISTICI_INDICATORI = {
+    "Rata somajului": (3, "rata somajului"),
+    "PIB regional pe locuitor": (2, "PIB regional pe locuitor"),
+    "Castigul salarial mediu net": (2, "castigul salarial mediu net"),
+    "Rata de ocupare a resurselor de munca": (3, "rata de ocupare a resurselor de munca"),
+    "Populatia activa": (3, "populatia activa"),
+    "Imigranti definitivi": (2, "imigranti definitivi"),
+}
+
+# Seturile de judete pentru care se precalculeaza statisticile
+SETURI_JUDETE = {
+    'Regiunea Centru': JUDETE_CENTRU,
+    'Toate judetele': TOATE_JUDETELE,
+}
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def grila_statistici_descriptive(versiune):
+    # Grila completa de statistici (toti indicatorii x dimensiuni x ani x seturi de judete),
+    # calculata o singura data pentru fiecare versiune a datelor
+    cub, tabele = incarca_cub(versiune)
+    return ingheata(grila_statistici(cub, SETURI_JUDETE))
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def grila_teste_semnificativitate(versiune):
+    # Testele de semnificativitate pentru toate feliile, in acelasi lot si cu aceleasi chei ca grila de statistici
+    cub, tabele = incarca_cub(versiune)
+    return grila_teste(cub, SETURI_JUDETE)
+
+def analiza_statistici_descriptive():
+    # Analiza cu statistici descriptive pentru diferite indicatori
+    st.header("Statistici descriptive pentru indicatorii pietei muncii")
+    st.info("Aceasta analiza calculeaza statistici descriptive (media, mediana, dispersia, etc.) "
+            "pentru diferiti indicatori ai pietei muncii din regiunea Centru.")
     
-    📊 **Test de normalitate:** {rezultate_teste['test_normalitate']}
-    ✅ **Concluzie normalitate:** {rezultate_teste['normalitate_concluzie']}
+    # Selecteaza tipul de indicator
+    tip_indicator = st.selectbox(
+        "Alege indicatorul pentru analiza:",
+        list(STATISTICI_INDICATORI)
+    )
+    calculeaza_statistici(tip_indicator)
+
+    # Exportul grilei complete, pentru toate indicatorii, anii si seturile de judete
+    grila = grila_statistici_descriptive(versiune_date())
+    st.download_button(
+        "Descarca grila completa de statistici (CSV)",
+        data=grila.to_csv(index=False).encode('utf-8'),
+        file_name="statistici_descriptive.csv",
+        mime="text/csv"
+    )
+    teste = grila_teste_semnificativitate(versiune_date())
+    st.download_button(
+        "Descarca rezultatele testelor de semnificativitate (CSV)",
+        data=teste.to_csv(index=False).encode('utf-8'),
+        file_name="teste_semnificativitate.csv",
+        mime="text/csv"
+    )
+    with st.expander("Feliile in care normalitatea este respinsa"):
+        afiseaza_tabel(felii_nenormale(teste)[CHEI_GRILA + ['n', 'Test normalitate', 'p normalitate']],
+                       use_container_width=True, hide_index=True)
+
+def verifica_semnificativitatea_statistici(teste):
+    # Textele afisate pentru rezultatele numerice ale testelor de semnificativitate (vezi statistici.py)
+    rezultate = {}
+    n = teste['n']
     
-    📈 **Intervale de încredere:**
-    - {rezultate_teste['interval_incredere_95']}
-    - {rezultate_teste['interval_incredere_99']}
+    # Test de normalitate
+    rezultate['test_normalitate'] = (f"{teste['Test normalitate']}: statistica={teste['Statistica normalitate']:.4f}, "
+                                     f"p-value={teste['p normalitate']:.4f}")
+    rezultate['normalitate_concluzie'] = ("Datele urmează distribuția normală" if teste['p normalitate'] > NIVEL_SEMNIFICATIE
+                                          else "Datele NU urmează distribuția normală")
     
-    🎯 **Test pentru medie:** {rezultate_teste['test_t_media']}
-    ✅ **Concluzie medie:** {rezultate_teste['media_semnificativa']}
+    # Intervale de incredere pentru medie (95% si 99%)
+    for nivel in (95, 99):
+        rezultate[f'interval_incredere_{nivel}'] = (f"IC {nivel}% pentru medie: [{teste[f'IC {nivel}% inferior']:.3f}, "
+                                                   f"{teste[f'IC {nivel}% superior']:.3f}]")
     
-    ⚠️ **Valori extreme:** {rezultate_teste['outliers']}
-    {rezultate_teste.get('lista_outliers', '')}
+    # Test t pentru media (testam daca media difera semnificativ de 0)
+    rezultate['test_t_media'] = f"Test t pentru medie=0: t={teste['t medie']:.4f}, p-value={teste['p medie']:.4f}"
+    rezultate['media_semnificativa'] = ("Media este semnificativ diferită de 0" if teste['p medie'] < NIVEL_SEMNIFICATIE
+                                        else "Media NU este semnificativ diferită de 0")
     
-    📊 **Test pentru varianță:** {rezultate_teste['test_varianta']}
+    # Valorile extreme (outliers) - metoda IQR
+    rezultate['outliers'] = f"Valori extreme detectate: {teste['Numar valori extreme']} din {n} observații"
+    if teste['Numar valori extreme'] > 0:
+        rezultate['lista_outliers'] = f"Valorile extreme sunt: {list(teste['Valori extreme'])}"
     
-    **Interpretare:**
-    - Dacă p-value < 0.05 → rezultatul este semnificativ statistic
-    - Intervalele de încredere arată intervalul în care se află adevărata valoare a mediei cu o probabilitate de 95%/99%
-    - Valorile extreme pot influența semnificativ rezultatele statisticilor descriptive
-    """)
+    # Test pentru varianta (test Chi-patrat)
+    rezultate['test_varianta'] = f"Test Chi² pentru varianță: χ²={teste['Chi2 varianta']:.4f}, p-value={teste['p varianta']:.4f}"
     
-    # Afiseaza datele folosite
-    st.markdown("#### Datele folosite pentru calcul")
-    st.dataframe(df_centru[['Judete', an]].set_index('Judete'))
+    return rezultate
 
-def calculeaza_statistici_imigranti():
-    # Calculeaza statistici descriptive pentru imigranti
-    st.subheader("Statistici descriptive - Imigranti definitivi")
-    
-    df = incarca_date('Imigranti')
-    df = replace_total_with_romania(df)
+def calculeaza_statistici(indicator):
+    # Afiseaza statisticile descriptive ale unui indicator pentru judetele din regiunea Centru;
+    # valorile sunt citite din grila precalculata, nu recalculate la fiecare schimbare de selectie
+    config = INDICATORI[indicator]
+    zecimale, denumire = STATISTICI_INDICATORI[indicator]
+    tabel = config['tabel']
+    st.subheader(f"Statistici descriptive - {indicator}")
     
     # Selecteaza parametrii
-    ani = sorted([col for col in df.columns if col.startswith('Anul')],
-                 key=lambda x: int(x.split()[-1]), reverse=True)
+    dimensiune = DIMENSIUNE_IMPLICITA
+    filtre = None
+    if config.get('dimensiune'):
+        dimensiune = st.selectbox(config['eticheta_dimensiune'], valori_distincte(tabel, config['dimensiune']))
+        filtre = {config['dimensiune']: [dimensiune]}
+    ani = ani_tabel(tabel)
     an = st.selectbox("Alege anul:", ani, index=0)
     
-    # Filtreaza datele pentru regiunea Centru
-    df_centru = df[df['Judete'].isin(['Alba', 'Brasov', 'Covasna', 'Harghita', 'Mures', 'Sibiu'])]
-    df_centru = converteste_ani_la_float(df_centru, [an])
-    
-    # Calculeaza statisticile
+    # Citeste doar judetele din regiunea Centru, pentru selectia facuta
+    df_centru = tabel_filtrat(tabel, judete=JUDETE_CENTRU, filtre=filtre, ani=[an])
     valori = df_centru[an].dropna()
     
-    statistici = {
-        'Media': np.mean(valori),
-        'Mediana': np.median(valori),
-        'Dispersia': np.var(valori, ddof=1),
-        'Abaterea standard': np.std(valori, ddof=1),
-        'Minimul': np.min(valori),
-        'Maximul': np.max(valori),
-        'Coeficientul de variatie (%)': (np.std(valori, ddof=1) / np.mean(valori)) * 100,
-        'Amplitudinea': np.max(valori) - np.min(valori)
-    }
-    
     # Afiseaza rezultatele
     st.markdown("#### Statistici descriptive calculate")
-    df_stat = pd.DataFrame(list(statistici.items()), columns=['Statistica', 'Valoare'])
-    df_stat['Valoare'] = df_stat['Valoare'].round(2)
-    st.dataframe(df_stat, use_container_width=True)
-    
-    # Verificarea semnificativitatii
-    rezultate_teste = verifica_semnificativitatea_statistici(valori, "Imigranti definitivi")
+    grila = grila_statistici_descriptive(versiune_date())
+    df_stat = cauta_statistici(grila, 'Regiunea Centru', tabel, dimensiune, int(an.split()[-1]))
+    df_stat['Valoare'] = df_stat['Valoare'].round(zecimale)
+    afiseaza_tabel(df_stat, use_container_width=True)
+    
+    # Verificarea semnificativitatii: rezultatele precalculate ale feliei, sau testele memorate ale
+    # valorilor afisate daca felia lipseste din grila
+    teste = cauta_teste(grila_teste_semnificativitate(versiune_date()), 'Regiunea Centru', tabel, dimensiune,
+                        int(an.split()[-1]))
+    if teste is None:
+        teste = teste_semnificativitate(valori.to_numpy())
+    rezultate_teste = verifica_semnificativitatea_statistici(teste)
     
     # Sectiunea informativa cu rezultatele verificarii
     st.markdown("#### Verificarea semnificativității statisticilor")
     st.info(f"""
-    **Rezultatele testelor statistice pentru imigranti definitivi:**
+    **Rezultatele testelor statistice pentru {denumire}:**
     
     📊 **Test de normalitate:** {rezultate_teste['test_normalitate']}
     ✅ **Concluzie normalitate:** {rezultate_teste['normalitate_concluzie']}
@@ -1655,14 +912,21 @@ def calculeaza_statistici_imigranti():
     
     # Afiseaza datele folosite
     st.markdown("#### Datele folosite pentru calcul")
-    st.dataframe(df_centru[['Judete', an]].set_index('Judete'))
+    afiseaza_tabel(df_centru[['Judete', an]].set_index('Judete'))
 
-def grafic_linie_somaj(df, ani, titlu, ylabel):
+def grafic_linie_somaj(df, ani, titlu, ylabel, sex):
     # Creaza grafic linie pentru evolutia ratei somajului pe judete
     st.divider()
+    figura = figura_memorata("Evoluție rată șomaj", (titlu, ylabel, sex), versiune_date(),
+                             lambda: figura_linie_somaj(df, ani, titlu, ylabel))
+    afiseaza_figura(figura)
+    st.markdown("#### Tabel cu datele")
+    afiseaza_tabel(df.set_index('Judete')[ani])
+    st.divider()
+
+def figura_linie_somaj(df, ani, titlu, ylabel):
+    # Figura cu evolutia ratei somajului pe judete si linia mediei nationale
     ani_num = extrage_ani(ani)
-    df = replace_total_with_romania(df)
-    df = converteste_ani_la_float(df, ani)
     df_judete = df[df['Judete'] != 'Romania']
     fig = go.Figure()
     for idx, row in df_judete.iterrows():
@@ -1704,21 +968,31 @@ def grafic_linie_somaj(df, ani, titlu, ylabel):
         legend=dict(font=dict(size=14)),
         hovermode="x unified"
     )
-    st.plotly_chart(fig, use_container_width=True)
-    st.markdown("#### Tabel cu datele")
-    st.dataframe(df.set_index('Judete')[ani])
-    st.divider()
+    return fig
 
-def heatmap_judete_ani_interactiv(df, ani, titlu):
+def heatmap_judete_ani_interactiv(df, ani, titlu, sex):
     # Creaza heatmap pentru comparatie rata somaj pe judete si ani
     st.divider()
+    df_hm = date_heatmap(df, ani)
+    figura = figura_memorata("Hartă termică șomaj", (titlu, sex), versiune_date(),
+                             lambda: figura_heatmap(df_hm, titlu))
+    afiseaza_figura(figura)
+    st.markdown("#### Tabel cu datele")
+    afiseaza_tabel(df_hm)
+    st.divider()
+
+def date_heatmap(df, ani):
+    # Matricea judete x ani a hartii termice: judetele din Centru, apoi Romania
     ani_num = extrage_ani(ani)
-    df = replace_total_with_romania(df)
     df_total = df[df['Judete'] == 'Romania']
     df_centru = df[df['Judete'].isin(['Alba', 'Brasov', 'Covasna', 'Harghita', 'Mures', 'Sibiu'])]
     df_hm = pd.concat([df_centru, df_total], ignore_index=True)
     df_hm = df_hm.set_index('Judete')[ani]
     df_hm.columns = ani_num
+    return df_hm
+
+def figura_heatmap(df_hm, titlu):
+    # Harta termica a ratei somajului pe judete si ani
     fig = px.imshow(
         df_hm,
         text_auto=True,
@@ -1745,17 +1019,12 @@ def heatmap_judete_ani_interactiv(df, ani, titlu):
         title=dict(font=dict(size=22)),
         coloraxis_colorbar=dict(title_font=dict(size=16), tickfont=dict(size=12))
     )
-    st.plotly_chart(fig, use_container_width=True)
-    st.markdown("#### Tabel cu datele")
-    st.dataframe(df_hm)
-    st.divider()
+    return fig
 
 def stacked_bar_absolventi_interactiv(df, ani, judet_selectat):
     # Creaza stacked bar pentru structura absolventilor pe niveluri de educatie
     st.divider()
     ani_num = extrage_ani(ani)
-    df = replace_total_with_romania(df)
-    df = converteste_ani_la_float(df, ani)
     df_judet = df[df['Judete'] == judet_selectat]
 
     # Pastreaza ordinea nivelurilor de educatie asa cum sunt in tabel
@@ -1808,7 +1077,7 @@ def stacked_bar_absolventi_interactiv(df, ani, judet_selectat):
         yaxis=dict(title=dict(text="Numar absolventi", font=dict(size=16)), tickfont=dict(size=12)),
         showlegend=False
     )
-    st.plotly_chart(fig, use_container_width=True)
+    afiseaza_figura(fig)
 
     # Generam legenda pentru niveluri de educatie
     st.markdown("#### Legenda nivel educatie")
@@ -1823,21 +1092,32 @@ def stacked_bar_absolventi_interactiv(df, ani, judet_selectat):
     st.markdown(legend_html, unsafe_allow_html=True)
 
     st.markdown("#### Tabel cu datele")
-    st.dataframe(df_judet.set_index('Niveluri de educatie')[ani])
+    afiseaza_tabel(df_judet.set_index('Niveluri de educatie')[ani])
     st.divider()
 
-def bar_chart_an_interactiv(df, an, titlu, ylabel):
-    # Creaza bar chart pentru comparatia rata somaj in anul selectat
+def bar_chart_an_interactiv(df, ani, titlu, ylabel, sex):
+    # Creaza bar chart pentru comparatia rata somaj in anul selectat; cu mai multi ani,
+    # anul se schimba din slider-ul graficului (titlu contine {an})
+    st.divider()
+    figura = figura_memorata("Comparație rată șomaj", (tuple(ani), titlu, ylabel, sex), versiune_date(),
+                             lambda: figura_bare_an(df, ani, titlu, ylabel))
+    afiseaza_figura(figura)
+    st.markdown("#### Tabel cu datele")
+    afiseaza_tabel(df.set_index('Judete')[ani])
     st.divider()
-    an_num = an.split()[-1]
-    df = replace_total_with_romania(df)
-    df = converteste_ani_la_float(df, [an])
+
+def figura_bare_an(df, ani, titlu, ylabel):
+    # Figura cu valorile judetelor din Centru si ale Romaniei in primul an din ani,
+    # plus slider-ul pentru ceilalti ani
+    an = ani[0]
     judete_ord = ["Alba", "Brasov", "Covasna", "Harghita", "Mures", "Sibiu"]
     colors = [JUD_COLORS[j] for j in judete_ord]
     fig = go.Figure()
+    randuri = []
     for idx, jud in enumerate(judete_ord):
         row = df[df['Judete'] == jud]
         if not row.empty:
+            randuri.append(row.iloc[0])
             val = row.iloc[0][an]
             fig.add_trace(go.Bar(
                 x=[jud],
@@ -1851,6 +1131,7 @@ def bar_chart_an_interactiv(df, an, titlu, ylabel):
     # Adauga bara pentru Romania separat
     row = df[df['Judete'] == 'Romania']
     if not row.empty:
+        randuri.append(row.iloc[0])
         val = row.iloc[0][an]
         fig.add_trace(go.Bar(
             x=["Romania"],
@@ -1866,82 +1147,74 @@ def bar_chart_an_interactiv(df, an, titlu, ylabel):
         font=dict(family="Segoe UI, Arial", size=16),
         yaxis=dict(title=dict(text=ylabel, font=dict(size=18)), tickfont=dict(size=14)),
         xaxis=dict(title=dict(text="Judet", font=dict(size=18)), tickangle=30, tickfont=dict(size=14)),
-        title=dict(text=titlu, font=dict(size=26)),
+        title=dict(text=titlu.format(an=an.split()[-1]), font=dict(size=26)),
         legend=dict(font=dict(size=14))
     )
-    st.plotly_chart(fig, use_container_width=True)
-    st.markdown("#### Tabel cu datele")
-    st.dataframe(df.set_index('Judete')[[an]])
-    st.divider()
-
-def scatter_corelatie_interactiv(df_x, df_y, an, titlu, xlabel, ylabel):
-    # Creaza scatter plot pentru corelatia intre rata somaj si rata de ocupare
+    if len(ani) > 1:
+        fig.update_layout(sliders=slider_ani(ani, [
+            ({'y': [[rand[a]] for rand in randuri], 'text': [[rand[a]] for rand in randuri]},
+             {'title.text': titlu.format(an=a.split()[-1])})
+            for a in ani], list(range(len(randuri)))))
+    return fig
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def indicatori_aliniati(indicator_x, dimensiune_x, indicator_y, dimensiune_y, versiune):
+    # Matricele judete x ani ale celor doi indicatori, aliniate pe (judet, an); schimbarea anului este o felie.
+    # Valorile sunt in unitatile de pe harta (factor_harta), aceleasi cu titlu_scala din registru.
+    cub, tabele = incarca_cub(versiune)
+    judete, ani, x, y = aliniaza_indicatori(cub, INDICATORI[indicator_x]['tabel'], dimensiune_x,
+                                            INDICATORI[indicator_y]['tabel'], dimensiune_y)
+    return (judete, ani, x * INDICATORI[indicator_x].get('factor_harta', 1),
+            y * INDICATORI[indicator_y].get('factor_harta', 1))
+
+def scatter_corelatie_interactiv(judete, x, y, titlu, xlabel, ylabel):
+    # Creaza scatter plot pentru corelatia intre doi indicatori, cu trei grupuri de puncte:
+    # celelalte judete (gri), judetele din regiunea Centru (culorile lor) si Romania
     st.divider()
-    an_num = an.split()[-1]
-    df_x = replace_total_with_romania(df_x)
-    df_y = replace_total_with_romania(df_y)
-    df_x = converteste_ani_la_float(df_x, [an])
-    df_y = converteste_ani_la_float(df_y, [an])
-    
-    # Defineste judetele din regiunea Centru
-    judete_centru = ["Alba", "Brasov", "Covasna", "Harghita", "Mures", "Sibiu"]
-    
-    # Toate celelalte judete (excluzand regiunea Centru si Romania)
-    judete_alte = [j for j in TOATE_JUDETELE if j not in judete_centru and j != "Romania"]
-    
-    df_corel = pd.DataFrame({
-        'Judet': df_x['Judete'],
-        'Rata somaj': df_x[an],
-        'Rata ocupare': df_y[an]
-    })
+    df_corel = pd.DataFrame({'Judet': judete, xlabel: x, ylabel: y}).dropna()
+    in_centru = df_corel['Judet'].isin(JUDETE_CENTRU)
+    este_romania = df_corel['Judet'] == "Romania"
     
     fig = go.Figure()
     
-    # Adauga celelalte judete cu gri si opacitate redusa
-    for jud in judete_alte:
-        row = df_corel[df_corel['Judet'] == jud]
-        if not row.empty:
-            fig.add_trace(go.Scatter(
-                x=row['Rata somaj'],
-                y=row['Rata ocupare'],
-                mode='markers+text',
-                name=jud,
-                text=[jud],
-                marker=dict(
-                    size=12, 
-                    color="rgba(128, 128, 128, 0.5)",
-                    line=dict(width=1, color="rgba(128, 128, 128, 0.7)")
-                ),
-                textfont=dict(size=10, color="rgba(128, 128, 128, 0.8)"),
-                textposition='top center',
-                showlegend=False
-            ))
-    
-    # Adauga judetele din regiunea Centru cu culorile specifice
-    for jud in judete_centru:
-        row = df_corel[df_corel['Judet'] == jud]
-        if not row.empty:
-            color = JUD_COLORS.get(jud, "#888888")
-            fig.add_trace(go.Scatter(
-                x=row['Rata somaj'],
-                y=row['Rata ocupare'],
-                mode='markers+text',
-                name=jud,
-                text=[jud],
-                marker=dict(size=18, color=color, line=dict(width=1.5, color="#222")),
-                textfont=dict(size=14, color=color),
-                textposition='top center'
-            ))
-    
-    # Adauga Romania
-    row_romania = df_corel[df_corel['Judet'] == "Romania"]
-    if not row_romania.empty:
+    # Celelalte judete cu gri si opacitate redusa
+    alte = df_corel[~in_centru & ~este_romania]
+    fig.add_trace(go.Scatter(
+        x=alte[xlabel], y=alte[ylabel],
+        mode='markers+text',
+        name="Alte judete",
+        text=alte['Judet'],
+        marker=dict(
+            size=12, 
+            color="rgba(128, 128, 128, 0.5)",
+            line=dict(width=1, color="rgba(128, 128, 128, 0.7)")
+        ),
+        textfont=dict(size=10, color="rgba(128, 128, 128, 0.8)"),
+        textposition='top center',
+        showlegend=False
+    ))
+    
+    # Judetele din regiunea Centru cu culorile specifice
+    centru = df_corel[in_centru]
+    culori = [JUD_COLORS.get(jud, "#888888") for jud in centru['Judet']]
+    fig.add_trace(go.Scatter(
+        x=centru[xlabel], y=centru[ylabel],
+        mode='markers+text',
+        name="Regiunea Centru",
+        text=centru['Judet'],
+        marker=dict(size=18, color=culori, line=dict(width=1.5, color="#222")),
+        textfont=dict(size=14, color=culori),
+        textposition='top center'
+    ))
+    
+    # Romania
+    romania = df_corel[este_romania]
+    if not romania.empty:
         fig.add_trace(go.Scatter(
-            x=row_romania['Rata somaj'],
-            y=row_romania['Rata ocupare'],
+            x=romania[xlabel], y=romania[ylabel],
             mode='markers+text',
             name="Romania",
-            text=["Romania"],
+            text=romania['Judet'],
             marker=dict(size=20, color="#FFFFFF", line=dict(width=2, color="#222")),
             textfont=dict(size=14, color="#FFFFFF"),
             textposition='top center'
@@ -1956,34 +1229,36 @@ def scatter_corelatie_interactiv(df_x, df_y, an, titlu, xlabel, ylabel):
         legend=dict(font=dict(size=14))
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    afiseaza_figura(fig)
     st.markdown("#### Tabel cu datele pentru regiunea Centru și România")
     # Afiseaza doar datele pentru regiunea Centru si Romania in tabel
-    df_display = df_corel[df_corel['Judet'].isin(judete_centru + ["Romania"])]
-    st.dataframe(df_display.set_index('Judet'))
+    df_display = pd.concat([centru, romania])
+    afiseaza_tabel(df_display.set_index('Judet'))
     st.divider()
 
-def bar_chart_salariati_activitati(df, ani, an_selectat):
-    # Creaza bar chart pentru numarul salariatilor pe activitati economice in anul selectat
+def bar_chart_salariati_activitati(df, ani):
+    # Creaza bar chart pentru numarul salariatilor pe activitati economice in primul an din ani;
+    # cu mai multi ani, anul se schimba din slider-ul graficului
     st.divider()
-    an_num = an_selectat.split()[-1]
-    df = replace_total_with_romania(df)
-    df = converteste_ani_la_float(df, [an_selectat])
+    an_selectat = ani[0]
     judete_ord = ["Alba", "Brasov", "Covasna", "Harghita", "Mures", "Sibiu", "Romania"]
     colors = [JUD_COLORS.get(j, "#888888") for j in judete_ord]
-    activitati = df['Activitati ale economiei'].unique()
-    activitati_prescurtate = [prescurteaza_activitate(a) for a in activitati]
-    # Alege activitatea economica prin dropdown
-    activitate = st.selectbox("Alege activitatea economica", activitati_prescurtate)
-    activitate_originala = [a for a in activitati if prescurteaza_activitate(a) == activitate][0]
-    df_activ = df[df['Activitati ale economiei'] == activitate_originala]
+    # Alege activitatea economica prin dropdown (prescurtarile sunt calculate la tipizare)
+    activitate = st.selectbox("Alege activitatea economica", df[COLOANA_PRESCURTARE].unique())
+    df_activ = df[df[COLOANA_PRESCURTARE] == activitate]
     show_romania = st.checkbox("Afiseaza si Romania", value=False)
+
+    def titlu(an):
+        return f"Numar salariati in {an.split()[-1]} pentru activitatea: {activitate}"
+
     fig = go.Figure()
+    randuri = []
     for idx, jud in enumerate(judete_ord):
         if jud == "Romania" and not show_romania:
             continue
         row = df_activ[df_activ['Judete'] == jud]
         if not row.empty:
+            randuri.append(row.iloc[0])
             val = row.iloc[0][an_selectat]
             fig.add_trace(go.Bar(
                 x=[jud],
@@ -1999,32 +1274,32 @@ def bar_chart_salariati_activitati(df, ani, an_selectat):
         font=dict(family="Segoe UI, Arial", size=16),
         yaxis=dict(title=dict(text="Numar salariati", font=dict(size=18)), tickfont=dict(size=14)),
         xaxis=dict(title=dict(text="Judet", font=dict(size=18)), tickangle=30, tickfont=dict(size=14)),
-        title=dict(text=f"Numar salariati in {an_num} pentru activitatea: {activitate}", font=dict(size=26)),
+        title=dict(text=titlu(an_selectat), font=dict(size=26)),
         legend=dict(font=dict(size=14))
     )
-    st.plotly_chart(fig, use_container_width=True)
+    if len(ani) > 1:
+        fig.update_layout(sliders=slider_ani(ani, [
+            ({'y': [[rand[a]] for rand in randuri], 'text': [[rand[a]] for rand in randuri]},
+             {'title.text': titlu(a)})
+            for a in ani], list(range(len(randuri)))))
+    afiseaza_figura(fig)
     st.markdown("#### Tabel cu datele")
     if not show_romania:
-        st.dataframe(df_activ[df_activ['Judete'] != "Romania"].set_index('Judete')[[an_selectat]])
+        afiseaza_tabel(df_activ[df_activ['Judete'] != "Romania"].set_index('Judete')[ani])
     else:
-        st.dataframe(df_activ.set_index('Judete')[[an_selectat]])
+        afiseaza_tabel(df_activ.set_index('Judete')[ani])
     st.divider()
 
 def pie_charts_salariati_judete(df, ani, an_selectat):
     # Creaza pie chart-uri pentru structura salariatilor pe activitati economice in fiecare judet
     st.divider()
     an_num = an_selectat.split()[-1]
-    df = replace_total_with_romania(df)
-    df = converteste_ani_la_float(df, [an_selectat])
     judete = ["Alba", "Brasov", "Covasna", "Harghita", "Mures", "Sibiu"]
     st.subheader(f"Structura salariatilor pe activitati economice in anul {an_num}")
 
     # Checkbox pentru a afisa detaliile pentru categoriile sub 5%
     show_detail_alte = st.checkbox("Afiseaza detaliu pentru Alte Industrii (categorii < 5%)", value=False)
 
-    # Creeaza coloana cu activitatea prescurtata
-    df['Activitate'] = df['Activitati ale economiei'].apply(prescurteaza_activitate)
-
     for judet in judete:
         df_judet = df[df['Judete'] == judet]
         total_judet = df_judet[an_selectat].sum()
@@ -2063,9 +1338,9 @@ def pie_charts_salariati_judete(df, ani, an_selectat):
                 title=dict(font=dict(size=20)),
                 legend=dict(font=dict(size=12))
             )
-            st.plotly_chart(fig, use_container_width=True)
+            afiseaza_figura(fig)
             st.markdown(f"#### Tabel cu datele pentru {judet} - Categorii grupate")
-            st.dataframe(df_main.set_index('Activitate')[[an_selectat]])
+            afiseaza_tabel(df_main.set_index('Activitate')[[an_selectat]])
             st.divider()
         else:
             # Afiseaza graficul detaliat pentru categoriile sub 5%
@@ -2094,15 +1369,15 @@ def pie_charts_salariati_judete(df, ani, an_selectat):
                     title=dict(font=dict(size=20)),
                     legend=dict(font=dict(size=12))
                 )
-                st.plotly_chart(fig_other, use_container_width=True)
+                afiseaza_figura(fig_other)
                 st.markdown(f"#### Tabel cu datele pentru {judet} - Alte industrii detaliat")
-                st.dataframe(df_other.set_index('Activitate')[[an_selectat]])
+                afiseaza_tabel(df_other.set_index('Activitate')[[an_selectat]])
                 st.divider()
 
     st.markdown("### Legenda activitati economice")
     # Afiseaza legenda pentru prescurtari activitati
     st.markdown(
-        "\n".join([f"- **{prescurtare}**: {activitate}" for activitate, prescurtare in PRESCURTARI_ACTIVITATI.items()])
+        "\n".join([f"- **{prescurtare}**: {activitate}" for activitate, prescurtare in SECTIUNI_NACE.values()])
     )
     st.divider()
 
@@ -2152,7 +1427,7 @@ def pie_chart_public_privat(df_analiza, an, doar_centru):
         font=dict(family="Segoe UI, Arial", size=14)
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    afiseaza_figura(fig)
     
     # Afiseaza comparatie pe judete
     st.markdown("#### Comparatie pe judete")
@@ -2164,46 +1439,51 @@ def pie_chart_public_privat(df_analiza, an, doar_centru):
         'Procent_public': 'Procent public (%)',
         'Procent_privat': 'Procent privat (%)'
     })
-    st.dataframe(df_comparatie.set_index('Judete'))
-
-def choropleth_public_privat(df_analiza, geo_data, geo_type, an, doar_centru):
-    # Creeaza choropleth map pentru procentul de salariati publici
-    st.subheader("Procentul de salariati din sectorul public - Harta interactiva")
-    
-    # Prima parte: Harta animata pentru toti anii
-    st.markdown("#### Evoluția în timp - Animație")
-    choropleth_animat_public_privat(geo_data, geo_type, doar_centru)
-    st.divider()
+    afiseaza_tabel(df_comparatie.set_index('Judete'))
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def sectoare_salariati(versiune):
+    # Salariatii totali, publici si privati pe judet si an, cu ponderi si cresteri anuale, pentru o versiune a datelor
+    cub, tabele = incarca_cub(versiune)
+    return ingheata(cub_sectoare(cub, ACTIVITATI_PUBLICE))
+
+def date_sectoare_an(sectoare, judete, an):
+    # Felia unui an pentru judetele date, in forma folosita de harta, tabel si graficul circular
+    felie = sectoare.xs(an, level='An')
+    df_analiza = felie[felie.index.isin(judete)].reset_index()
+    df_analiza['Judete'] = df_analiza['Judete'].astype(str)
+    return df_analiza
+
+def choropleth_public_privat(df_analiza, an, doar_centru):
+    # Creeaza choropleth map pentru procentul de salariati publici in anul selectat
     st.markdown("#### Harta detaliată pentru anul selectat")
+    figura = figura_memorata("Sectorul public vs privat", ('harta', an, doar_centru), versiune_date(),
+                             lambda: figura_harta_public_privat(df_analiza, an, doar_centru))
+    afiseaza_figura(figura)
     
-    # Coordonatele ajustate ale centrelor judetelor din regiunea Centru
-    coordonate_judete = {
-        'Alba': (46.0667, 23.5833),
-        'Brasov': (45.6500, 25.6000),
-        'Covasna': (45.8667, 26.1833),
-        'Harghita': (46.3600, 25.8000),
-        'Mures': (46.5500, 24.5667),
-        'Sibiu': (45.7833, 24.1500)
-    }
-    
-    # Adauga prescurtari pentru judete
-    prescurtari_judete = {
-        'Alba': 'AB',
-        'Brasov': 'BV', 
-        'Covasna': 'CV',
-        'Harghita': 'HR',
-        'Mures': 'MS',
-        'Sibiu': 'SB'
-    }
-    
-    df_analiza['Prescurtare'] = df_analiza['Judete'].map(prescurtari_judete)
+    # Afiseaza tabelul cu datele
+    st.markdown("#### Datele afisate pe harta")
+    df_display = df_analiza[['Judete', 'Procent_public', 'Procent_privat', 'Salariati_publici', 'Total_salariati']].copy()
+    df_display['Procent_public'] = df_display['Procent_public'].round(1)
+    df_display['Procent_privat'] = df_display['Procent_privat'].round(1)
+    df_display = df_display.rename(columns={
+        'Procent_public': 'Procent public (%)',
+        'Procent_privat': 'Procent privat (%)',
+        'Salariati_publici': 'Salariati publici',
+        'Total_salariati': 'Total salariati'
+    })
+    afiseaza_tabel(df_display.set_index('Judete'))
+
+def figura_harta_public_privat(df_analiza, an, doar_centru):
+    # Harta ponderii sectorului public in anul selectat
+    geo_data, geo_type = incarca_date_geografice(nivel_detaliu(doar_centru))
     
     # Creeaza harta cu Plotly
     if geo_type == 'geojson':
         fig = px.choropleth(
             df_analiza,
             geojson=geo_data,
-            locations='Judete_std',
+            locations='Judete',
             color='Procent_public',
             hover_name='Judete',
             hover_data={
@@ -2220,25 +1500,9 @@ def choropleth_public_privat(df_analiza, geo_data, geo_type, an, doar_centru):
         
         # Adauga textul pentru fiecare judet DOAR daca este selectata regiunea Centru
         if doar_centru:
-            for _, row in df_analiza.iterrows():
-                if row['Judete'] in coordonate_judete and pd.notna(row['Prescurtare']):
-                    lat, lon = coordonate_judete[row['Judete']]
-                    text_afisare = f"{row['Prescurtare']}<br>{row['Procent_public']:.1f}%"
-                    
-                    fig.add_scattergeo(
-                        lat=[lat],
-                        lon=[lon],
-                        text=[text_afisare],
-                        mode='text',
-                        textfont=dict(
-                            size=12,
-                            color="white",
-                            family="Arial Black"
-                        ),
-                        textposition='middle center',
-                        showlegend=False,
-                        hoverinfo='skip'
-                    )
+            texte = (centroide_judete()['Prescurtare'].reindex(df_analiza['Judete']).to_numpy()
+                     + "<br>" + df_analiza['Procent_public'].map('{:.1f}%'.format).to_numpy())
+            fig.add_trace(trace_etichete_judete(df_analiza['Judete'], texte, marime=12, culoare="white"))
 
     fig.update_geos(
         fitbounds="locations",
@@ -2253,168 +1517,134 @@ def choropleth_public_privat(df_analiza, geo_data, geo_type, an, doar_centru):
         paper_bgcolor="rgba(0,0,0,0)",
         plot_bgcolor="rgba(0,0,0,0)"
     )
+    return fig
+
+def figura_animata_public_privat(doar_centru, versiune):
+    # Harta animata a ponderii sectorului public. Geometria este trimisa o singura
+    # data, in urma de baza; fiecare cadru (an) contine doar valorile z si customdata ale judetelor.
+    judete = JUDETE_CENTRU if doar_centru else TOATE_JUDETELE
+    sectoare = sectoare_salariati(versiune)
+    felie = sectoare[sectoare.index.get_level_values('Judete').isin(judete)]
+
+    # Matrice judete x ani, feliate din cubul sectoarelor
+    matrice = felie[['Procent_public', 'Salariati_publici', 'Total_salariati']].unstack('An')
+    ani = list(matrice['Total_salariati'].columns)
+    procent, publici, total = matrice['Procent_public'], matrice['Salariati_publici'], matrice['Total_salariati']
+    nume_judete = total.index.astype(str)
+
+    geo_data, geo_type = incarca_date_geografice(nivel_detaliu(doar_centru))
+    geojson = geo_data if geo_type == 'geojson' else geo_data.__geo_interface__
+    sablon_hover = ("<b>%{hovertext}</b><br>Procent public: %{z:.1f}%<br>"
+                    "Salariati publici: %{customdata[0]:,.0f}<br>"
+                    "Total salariati: %{customdata[1]:,.0f}<extra></extra>")
+
+    def valori_an(an):
+        return dict(
+            z=procent[an].to_numpy(),
+            customdata=np.column_stack([publici[an].to_numpy(), total[an].to_numpy()])
+        )
 
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Afiseaza tabelul cu datele
-    st.markdown("#### Datele afisate pe harta")
-    df_display = df_analiza[['Judete', 'Procent_public', 'Procent_privat', 'Salariati_publici', 'Total_salariati']].copy()
-    df_display['Procent_public'] = df_display['Procent_public'].round(1)
-    df_display['Procent_privat'] = df_display['Procent_privat'].round(1)
-    df_display = df_display.rename(columns={
-        'Procent_public': 'Procent public (%)',
-        'Procent_privat': 'Procent privat (%)',
-        'Salariati_publici': 'Salariati publici',
-        'Total_salariati': 'Total salariati'
-    })
-    st.dataframe(df_display.set_index('Judete'))
+    fig_animat = go.Figure(
+        data=[go.Choropleth(
+            geojson=geojson,
+            featureidkey="properties.name",
+            locations=list(nume_judete),
+            hovertext=[str(judet) for judet in total.index],
+            hovertemplate=sablon_hover,
+            coloraxis="coloraxis",
+            **valori_an(ani[0])
+        )],
+        frames=[go.Frame(name=str(an), data=[go.Choropleth(**valori_an(an))], traces=[0]) for an in ani]
+    )
 
-def choropleth_animat_public_privat(geo_data, geo_type, doar_centru):
-    # Creeaza harta animata pentru evolutia in timp
-    
-    # Incarca datele de salariati
-    df_salariati = incarca_date('Salariati2')
-    df_salariati = replace_total_with_romania(df_salariati)
+    # Configurari pentru animatie
+    fig_animat.update_geos(
+        fitbounds="locations",
+        visible=False,
+        bgcolor="rgba(0,0,0,0)",
+        projection_type="mercator"
+    )
     
-    # Selecteaza anii disponibili
-    ani = sorted([col for col in df_salariati.columns if col.startswith('Anul')],
-                 key=lambda x: int(x.split()[-1]))
+    fig_animat.update_layout(
+        width=1400,
+        height=900,
+        title=dict(
+            text=f"Evoluția procentului de salariați din sectorul public în timp - {'Regiunea Centru' if doar_centru else 'Romania'}",
+            font=dict(size=18)
+        ),
+        coloraxis=dict(colorscale="Reds", cmin=10, cmax=25,
+                       colorbar=dict(title="Procent salariati publici (%)")),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)"
+    )
     
-    # Defineste activitatile publice
-    activitati_publice = [
-        'O ADMINISTRATIE PUBLICA SI APARARE; ASIGURARI SOCIALE DIN SISTEMUL PUBLIC',
-        'P INVATAMANT',
-        'Q SANATATE SI ASISTENTA SOCIALA'
+    # Configurari pentru butoanele de animatie; cadrele nu schimba geometria, deci nu cer redesenare completa
+    fig_animat.layout.updatemenus = [
+        dict(
+            type="buttons",
+            direction="left",
+            pad={"r": 10, "t": 87},
+            showactive=False,
+            x=0.011,
+            xanchor="right",
+            y=0,
+            yanchor="top",
+            buttons=[
+                dict(
+                    label="▶️ Play",
+                    method="animate",
+                    args=[None, {"frame": {"duration": 1500, "redraw": True},
+                                "fromcurrent": True, 
+                                "transition": {"duration": 300}}]
+                ),
+                dict(
+                    label="⏸️ Pause",
+                    method="animate",
+                    args=[[None], {"frame": {"duration": 0, "redraw": False},
+                                  "mode": "immediate",
+                                  "transition": {"duration": 0}}]
+                )
+            ]
+        )
     ]
     
-    # Prepara datele pentru animatie
-    df_animatie_lista = []
-    
-    for an in ani:
-        an_num = an.split()[-1]
-        
-        # Filtreaza si pregateste datele pentru anul curent
-        df_filtrat = filtreaza_judete_pentru_harta(df_salariati, doar_centru)
-        df_filtrat = converteste_ani_la_float(df_filtrat, [an])
-        
-        # Calculeaza totalul de salariati pe judete
-        df_total = df_filtrat.groupby('Judete')[an].sum().reset_index()
-        df_total = df_total.rename(columns={an: 'Total_salariati'})
-        
-        # Calculeaza salariati din sectorul public
-        df_public = df_filtrat[df_filtrat['Activitati ale economiei'].isin(activitati_publice)]
-        df_public_total = df_public.groupby('Judete')[an].sum().reset_index()
-        df_public_total = df_public_total.rename(columns={an: 'Salariati_publici'})
-        
-        # Uneste datele si calculeaza procentul
-        df_an = df_total.merge(df_public_total, on='Judete', how='left')
-        df_an['Salariati_publici'] = df_an['Salariati_publici'].fillna(0)
-        df_an['Procent_public'] = (df_an['Salariati_publici'] / df_an['Total_salariati']) * 100
-        df_an['Judete_std'] = df_an['Judete'].apply(standardizeaza_nume_judete)
-        df_an['An'] = an_num
-        
-        df_animatie_lista.append(df_an)
-    
-    # Combina toate datele intr-un singur DataFrame
-    df_animatie = pd.concat(df_animatie_lista, ignore_index=True)
-    
-    # Creeaza harta animata
-    if geo_type == 'geojson':
-        fig_animat = px.choropleth(
-            df_animatie,
-            geojson=geo_data,
-            locations='Judete_std',
-            color='Procent_public',
-            animation_frame='An',
-            hover_name='Judete',
-            hover_data={
-                'Procent_public': ':.1f',
-                'Salariati_publici': ':,.0f',
-                'Total_salariati': ':,.0f',
-                'An': False
-            },
-            featureidkey="properties.name",
-            projection="mercator",
-            color_continuous_scale="Reds",
-            range_color=[10, 25],
-            title=f"Evoluția procentului de salariați din sectorul public în timp - {'Regiunea Centru' if doar_centru else 'Romania'}"
-        )
-        
-        # Configurari pentru animatie
-        fig_animat.update_geos(
-            fitbounds="locations",
-            visible=False,
-            bgcolor="rgba(0,0,0,0)"
-        )
-        
-        fig_animat.update_layout(
-            width=1400,
-            height=900,
-            title=dict(font=dict(size=18)),
-            coloraxis_colorbar=dict(title="Procent salariati publici (%)"),
-            paper_bgcolor="rgba(0,0,0,0)",
-            plot_bgcolor="rgba(0,0,0,0)"
-        )
-        
-        # Configurari pentru butoanele de animatie
-        fig_animat.layout.updatemenus = [
-            dict(
-                type="buttons",
-                direction="left",
-                pad={"r": 10, "t": 87},
-                showactive=False,
-                x=0.011,
-                xanchor="right",
-                y=0,
-                yanchor="top",
-                buttons=[
-                    dict(
-                        label="▶️ Play",
-                        method="animate",
-                        args=[None, {"frame": {"duration": 1500, "redraw": True},
-                                    "fromcurrent": True, 
-                                    "transition": {"duration": 300}}]
-                    ),
-                    dict(
-                        label="⏸️ Pause",
-                        method="animate",
-                        args=[[None], {"frame": {"duration": 0, "redraw": False},
-                                      "mode": "immediate",
-                                      "transition": {"duration": 0}}]
-                    )
-                ]
-            )
-        ]
-        
-        # Configurari pentru slider-ul de animatie
-        fig_animat.layout.sliders = [dict(
-            active=0,
-            yanchor="top",
-            xanchor="left",
-            currentvalue=dict(
-                font=dict(size=16), 
-                prefix="Anul: ",
-                visible=True,
-                xanchor="right"
-            ),
-            transition=dict(duration=300, easing="cubic-in-out"),
-            pad=dict(b=10, t=50),
-            len=0.9,
-            x=0.1,
-            y=0,
-            steps=[dict(
-                args=[[f.name], dict(
-                    frame=dict(duration=300, redraw=True),
-                    mode="immediate",
-                    transition=dict(duration=300)
-                )],
-                label=f.name,
-                method="animate"
-            ) for f in fig_animat.frames]
-        )]
-    
-    st.plotly_chart(fig_animat, use_container_width=True)
+    # Configurari pentru slider-ul de animatie
+    fig_animat.layout.sliders = [dict(
+        active=0,
+        yanchor="top",
+        xanchor="left",
+        currentvalue=dict(
+            font=dict(size=16), 
+            prefix="Anul: ",
+            visible=True,
+            xanchor="right"
+        ),
+        transition=dict(duration=300, easing="cubic-in-out"),
+        pad=dict(b=10, t=50),
+        len=0.9,
+        x=0.1,
+        y=0,
+        steps=[dict(
+            args=[[f.name], dict(
+                frame=dict(duration=300, redraw=True),
+                mode="immediate",
+                transition=dict(duration=300)
+            )],
+            label=f.name,
+            method="animate"
+        ) for f in fig_animat.frames]
+    )]
+    return fig_animat
+
+@cronometrat("Public vs privat: animatie")
+def choropleth_animat_public_privat(doar_centru):
+    # Creeaza harta animata pentru evolutia in timp
+    versiune = versiune_date()
+    figura = figura_memorata("Sectorul public vs privat", ('animatie', doar_centru), versiune,
+                             lambda: figura_animata_public_privat(doar_centru, versiune))
+    afiseaza_figura(figura)
 
+@cronometrat("Public vs privat: pagina")
 def analiza_spatiala_public_privat():
     # Analiza spatiala pentru salariati public vs privat
     st.header("Analiza spatiala - Sectorul public vs privat")
@@ -2423,88 +1653,44 @@ def analiza_spatiala_public_privat():
     if geo_data is None:
         st.error("Nu s-au putut incarca datele geografice.")
         return
-    # Incarca datele de salariati
-    df_salariati = incarca_date('Salariati2')
-    df_salariati = replace_total_with_romania(df_salariati)
-    # Selecteaza parametrii
-    ani = sorted([col for col in df_salariati.columns if col.startswith('Anul')],
-                 key=lambda x: int(x.split()[-1]), reverse=True)
-    an = st.selectbox("Alege anul:", ani, index=0)
+    # Cubul precalculat al sectoarelor (judet x an); pagina, metricile, graficele si animatia il feliaza
+    sectoare = sectoare_salariati(versiune_date())
     doar_centru = st.checkbox("Afiseaza doar regiunea Centru", value=True)
     
-    # Defineste activitatile publice
-    activitati_publice = [
-        'O ADMINISTRATIE PUBLICA SI APARARE; ASIGURARI SOCIALE DIN SISTEMUL PUBLIC',
-        'P INVATAMANT',
-        'Q SANATATE SI ASISTENTA SOCIALA'
-    ]
-    # Filtreaza si pregateste datele pentru anul curent
-    df_filtrat = filtreaza_judete_pentru_harta(df_salariati, doar_centru)
-    df_filtrat = converteste_ani_la_float(df_filtrat, [an])
-    # Calculeaza totalul de salariati pe judete pentru anul curent
-    df_total = df_filtrat.groupby('Judete')[an].sum().reset_index()
-    df_total = df_total.rename(columns={an: 'Total_salariati'})
-    # Calculeaza salariati din sectorul public pentru anul curent
-    df_public = df_filtrat[df_filtrat['Activitati ale economiei'].isin(activitati_publice)]
-    df_public_total = df_public.groupby('Judete')[an].sum().reset_index()
-    df_public_total = df_public_total.rename(columns={an: 'Salariati_publici'})
-    # Uneste datele si calculeaza procentul pentru anul curent
-    df_analiza = df_total.merge(df_public_total, on='Judete', how='left')
-    df_analiza['Salariati_publici'] = df_analiza['Salariati_publici'].fillna(0)
-    df_analiza['Procent_public'] = (df_analiza['Salariati_publici'] / df_analiza['Total_salariati']) * 100
-    df_analiza['Procent_privat'] = 100 - df_analiza['Procent_public']
-    df_analiza['Judete_std'] = df_analiza['Judete'].apply(standardizeaza_nume_judete)
-    # Calculeaza statisticile pentru anul curent
-    total_salariati_publici = df_analiza['Salariati_publici'].sum()
-    total_salariati_general = df_analiza['Total_salariati'].sum()
-    total_salariati_privati = total_salariati_general - total_salariati_publici
-    procent_public_general = (total_salariati_publici / total_salariati_general) * 100
-    procent_privat_general = (total_salariati_privati / total_salariati_general) * 100
-    # Calculeaza cresterea fata de anul precedent
+    # Animatia depinde doar de setul de judete, deci nu se reconstruieste la schimbarea anului
+    st.subheader("Procentul de salariati din sectorul public - Harta interactiva")
+    st.markdown("#### Evoluția în timp - Animație")
+    choropleth_animat_public_privat(doar_centru)
+    st.divider()
+    sectiune_an_public_privat(sectoare, doar_centru)
+
+@fragment_cronometrat("Public vs privat: anul selectat")
+def sectiune_an_public_privat(sectoare, doar_centru):
+    # Metricile, harta detaliata, tabelul si graficul circular pentru un an; la schimbarea anului
+    # se reruleaza doar acest fragment
+    ani = [f"Anul {a}" for a in sorted(sectoare.index.get_level_values('An').unique(), reverse=True)]
+    an = st.selectbox("Alege anul:", ani, index=0)
+    judete = JUDETE_CENTRU if doar_centru else TOATE_JUDETELE
     an_curent = int(an.split()[-1])
-    an_precedent_str = f"Anul {an_curent - 1}"
+    
+    # Datele judetelor pentru anul curent
+    df_analiza = date_sectoare_an(sectoare, judete, an_curent)
+    # Totalurile setului de judete si cresterea fata de anul precedent
+    totaluri = totaluri_sectoare(sectoare, judete).loc[an_curent]
+    total_salariati_publici = totaluri['Salariati_publici']
+    total_salariati_general = totaluri['Total_salariati']
+    total_salariati_privati = totaluri['Salariati_privati']
     if an_curent == 2010:
         # Pentru 2010, nu avem date din 2009
-        delta_public = "N/A - nu sunt date din 2009"
-        delta_privat = "N/A - nu sunt date din 2009"
-        delta_total = "N/A - nu sunt date din 2009"
-    elif an_precedent_str in df_salariati.columns:
-        # Calculeaza pentru anul precedent
-        df_filtrat_prec = filtreaza_judete_pentru_harta(df_salariati, doar_centru)
-        df_filtrat_prec = converteste_ani_la_float(df_filtrat_prec, [an_precedent_str])
-        # Total pentru anul precedent
-        df_total_prec = df_filtrat_prec.groupby('Judete')[an_precedent_str].sum().reset_index()
-        total_salariati_general_prec = df_total_prec[an_precedent_str].sum()
-        # Public pentru anul precedent
-        df_public_prec = df_filtrat_prec[df_filtrat_prec['Activitati ale economiei'].isin(activitati_publice)]
-        df_public_total_prec = df_public_prec.groupby('Judete')[an_precedent_str].sum().reset_index()
-        total_salariati_publici_prec = df_public_total_prec[an_precedent_str].sum()
-        # Privat pentru anul precedent
-        total_salariati_privati_prec = total_salariati_general_prec - total_salariati_publici_prec
-        
-        # Calculeaza cresterea procentuala
-        if total_salariati_publici_prec > 0:
-            crestere_public = ((total_salariati_publici - total_salariati_publici_prec) / total_salariati_publici_prec) * 100
-            delta_public = f"{crestere_public:+.1f}%"
-        else:
-            delta_public = "N/A"
-            
-        if total_salariati_privati_prec > 0:
-            crestere_privat = ((total_salariati_privati - total_salariati_privati_prec) / total_salariati_privati_prec) * 100
-            delta_privat = f"{crestere_privat:+.1f}%"
-        else:
-            delta_privat = "N/A"
-            
-        if total_salariati_general_prec > 0:
-            crestere_total = ((total_salariati_general - total_salariati_general_prec) / total_salariati_general_prec) * 100
-            delta_total = f"{crestere_total:+.1f}%"
-        else:
-            delta_total = "N/A"
-    else:
+        delta_public = delta_privat = delta_total = "N/A - nu sunt date din 2009"
+    elif an_curent - 1 not in sectoare.index.get_level_values('An'):
         # Anul precedent nu există in date
-        delta_public = "N/A - nu sunt date disponibile"
-        delta_privat = "N/A - nu sunt date disponibile"
-        delta_total = "N/A - nu sunt date disponibile"
+        delta_public = delta_privat = delta_total = "N/A - nu sunt date disponibile"
+    else:
+        delta_public, delta_privat, delta_total = [
+            "N/A" if np.isnan(totaluri[coloana]) else f"{totaluri[coloana]:+.1f}%"
+            for coloana in ['Crestere_publici', 'Crestere_privati', 'Crestere_total']
+        ]
     
     # Afiseaza statistici sumare la inceput
     st.markdown("#### Statistici sumare")
@@ -2538,154 +1724,163 @@ def analiza_spatiala_public_privat():
     )
     st.divider()
     # Afiseaza harta choropleth
-    choropleth_public_privat(df_analiza, geo_data, geo_type, an, doar_centru)
+    choropleth_public_privat(df_analiza, an, doar_centru)
     # Afiseaza pie chart cu distributia generala
     pie_chart_public_privat(df_analiza, an, doar_centru)
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def model_panel(dependenta, explicative, ani, set_judete, versiune):
+    # Modelele FE/RE si testul Hausman, memorate pentru fiecare (formula, interval de ani, set de judete)
+    cub, tabele = incarca_cub(versiune)
+    return estimeaza_panel(cub, dependenta, list(explicative), judete=SETURI_JUDETE[set_judete], ani=ani)
+
+def interval_ani_panel(variabile, versiune):
+    # Anii comuni tuturor variabilelor selectate
+    cub, tabele = incarca_cub(versiune)
+    ani = cub[cub['Indicator'].isin([VARIABILE_PANEL[v] for v in variabile])].groupby('Indicator', observed=True)['An']
+    return int(ani.min().max()), int(ani.max().min())
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def matrice_corelatie_indicatori(versiune):
+    # Corelatiile Pearson si Spearman intre variabilele modelului panel, pe observatiile judet x an,
+    # recalculate doar la schimbarea versiunii datelor
+    cub, tabele = incarca_cub(versiune)
+    return corelatii(date_panel(cub, list(VARIABILE_PANEL), judete=TOATE_JUDETELE, standardizeaza=False,
+                                doar_complete=False))
+
+def afiseaza_matrice_corelatie():
+    # Heatmap interactiv cu coeficientii de corelatie si semnificatia lor (pe perechi complete)
+    metoda = st.radio("Coeficientul de corelație:", ["Pearson", "Spearman"], horizontal=True)
+    rezultat = matrice_corelatie_indicatori(versiune_date())[metoda]
+    r, p, n = rezultat['r'], rezultat['p'], rezultat['n']
+    texte = [[f"{r.iat[i, j]:.2f}{marcaj_semnificatie(p.iat[i, j]) if i != j else ''}" for j in range(len(r))]
+             for i in range(len(r))]
+    fig = go.Figure(go.Heatmap(
+        z=r.to_numpy(), x=list(r.columns), y=list(r.index),
+        zmin=-1, zmax=1, colorscale='RdBu', reversescale=True,
+        text=texte, texttemplate="%{text}",
+        customdata=np.dstack([p.to_numpy(), n.to_numpy()]),
+        hovertemplate="%{y} - %{x}<br>r = %{z:.3f}<br>p-value = %{customdata[0]:.3g}<br>"
+                      "n = %{customdata[1]}<extra></extra>"
+    ))
+    fig.update_layout(height=520, yaxis=dict(autorange='reversed'), margin=dict(l=0, r=0, t=30, b=0))
+    afiseaza_figura(fig)
+    st.caption(f"Corelații {metoda} între variabilele modelului, calculate pe observațiile județ × an "
+               "(perechi complete). Semnificație: *** p < 0.001, ** p < 0.01, * p < 0.05, . p < 0.1")
+
+def marcaj_semnificatie(p):
+    # Codurile de semnificatie din R
+    for prag, marcaj in ((0.001, '***'), (0.01, '**'), (0.05, '*'), (0.1, '.')):
+        if p < prag:
+            return marcaj
+    return ''
+
+def afiseaza_coeficienti(coeficienti):
+    tabel = coeficienti.copy()
+    tabel[''] = tabel['p-value'].map(marcaj_semnificatie)
+    afiseaza_tabel(tabel.style.format({col: '{:.6f}' for col in coeficienti.columns[:3]} | {'p-value': '{:.4g}'}),
+                   use_container_width=True)
+
 def analiza_regresie():
-    # Analiza de regresie pentru date de tip panel realizata in R
+    # Analiza de regresie pentru date de tip panel, estimata in aplicatie pe datele curente
     st.header("Analiza de regresie pentru date de tip panel")
     st.info(
-        "Această analiză de regresie pentru date de tip panel a fost realizată în R, "
-        "folosind datele economice și demografice din Regiunea Centru a României. "
-        "Datele au fost standardizate folosind funcția scale() din R."
+        "Această analiză de regresie pentru date de tip panel a fost realizată inițial în R (pachetul plm), "
+        "folosind datele economice și demografice ale județelor României. Modelele sunt estimate acum direct "
+        "în aplicație, pe datele curente. Datele sunt standardizate ca în funcția scale() din R."
     )
     
     # Explicatia despre metodologia folosita
     st.markdown("#### Metodologia analizei")
     st.markdown("""
     **Selecția variabilelor:** Variabilele au fost alese în funcție de matricea de corelație 
-    care a fost creată cu ajutorul unui script în R. Matricea de corelație a evidențiat 
+    dintre indicatori (calculată mai jos pe datele curente). Matricea de corelație a evidențiat 
     relațiile semnificative între variabilele economice și demografice.
     
     **Compararea modelelor:** Modelele au fost comparate folosind:
     - **Hausman Test** pentru alegerea între Fixed Effects și Random Effects
     - **Compararea R-squared** pentru evaluarea puterii explicative a modelelor
     
-    **Standardizarea datelor:** Toate variabilele au fost standardizate folosind funcția `scale()` 
-    din R pentru a permite compararea directă a coeficienților.
+    **Standardizarea datelor:** Toate variabilele sunt standardizate (medie 0, abatere standard 1), 
+    la fel ca funcția `scale()` din R, pentru a permite compararea directă a coeficienților.
     """)
     
-    # Afisarea matricei de corelatie
+    # Matricea de corelatie, calculata pe datele curente
     st.markdown("#### Matricea de corelație")
-    st.markdown("Matricea de corelație utilizată pentru selecția variabilelor:")
-    
-    try:
-        from PIL import Image
-        image = Image.open(Path(__file__).with_name("matrice_corelatie.png"))
-        st.image(image, caption='Matricea de corelație între variabilele economice și demografice', 
-                width=600)
-    except:
-        st.error("Nu s-a putut încărca imaginea cu matricea de corelație (matrice_corelatie.png)")
+    afiseaza_matrice_corelatie()
     
     st.markdown("---")
     
-    # Rezultatele analizei din R
+    # Specificarea modelului
+    st.markdown("#### Specificarea modelului")
+    variabile = list(VARIABILE_PANEL)
+    dependenta = st.selectbox("Variabila dependentă:", variabile, index=variabile.index(DEPENDENTA_IMPLICITA))
+    optiuni = [v for v in variabile if v != dependenta]
+    explicative = st.multiselect("Variabilele explicative:", optiuni,
+                                 default=[v for v in EXPLICATIVE_IMPLICITE if v in optiuni])
+    if not explicative:
+        st.warning("Alege cel puțin o variabilă explicativă.")
+        return
+    set_judete = st.selectbox("Județele incluse:", list(SETURI_JUDETE), index=list(SETURI_JUDETE).index('Toate judetele'))
+    versiune = versiune_date()
+    an_min, an_max = interval_ani_panel([dependenta] + explicative, versiune)
+    ani = st.slider("Intervalul de ani:", an_min, an_max, (an_min, an_max))
+    
+    try:
+        rezultat = model_panel(dependenta, tuple(explicative), ani, set_judete, versiune)
+    except (np.linalg.LinAlgError, ValueError) as eroare:
+        st.error(f"Modelul nu poate fi estimat pentru selecția făcută: {eroare}")
+        return
+    fixe, aleatoare, hausman = rezultat['fixe'], rezultat['aleatoare'], rezultat['hausman']
+    formula = f"{dependenta} ~ {' + '.join(explicative)}"
+    
+    # Rezultatele analizei
     st.markdown("#### Rezultatele analizei de regresie")
-    st.markdown("Rezultatele obținute din analiza efectuată în R:")
-    
-    # Afisarea rezultatelor formatate
-    st.code("""
-=== MODELUL 1: FIXED EFFECTS ===
-Oneway (individual) effect Within Model
-
-Call:
-plm(formula = Salariu ~ Imigranti + Rata_Somaj + Rata_Ocupare + 
-    Pop_Activa, data = panel_pdata, model = "within")
-
-Balanced Panel: n = 42, T = 13, N = 546
-
-Residuals:
-     Min.   1st Qu.    Median   3rd Qu.      Max. 
--1.548817 -0.394844 -0.084152  0.331147  2.691460 
-
-Coefficients:
-              Estimate Std. Error  t-value  Pr(>|t|)    
-Imigranti     0.276490   0.046662   5.9253 5.808e-09 ***
-Rata_Somaj   -1.112099   0.054922 -20.2485 < 2.2e-16 ***
-Rata_Ocupare  0.042407   0.062213   0.6816  0.495783    
-Pop_Activa   -1.037893   0.326945  -3.1745  0.001593 ** 
----
-Signif. codes:  0 '***' 0.001 '**' 0.01 '*' 0.05 '.' 0.1 ' ' 1
-
-Total Sum of Squares:    467.72
-Residual Sum of Squares: 168.26
-R-Squared:      0.64026
-Adj. R-Squared: 0.60789
-F-statistic: 222.475 on 4 and 500 DF, p-value: < 2.22e-16
-
-=== MODELUL 2: RANDOM EFFECTS ===
-Oneway (individual) effect Random Effect Model 
-   (Swamy-Arora's transformation)
-
-Call:
-plm(formula = Salariu ~ Imigranti + Rata_Somaj + Rata_Ocupare + 
-    Pop_Activa, data = panel_pdata, model = "random")
-
-Balanced Panel: n = 42, T = 13, N = 546
-
-Effects:
-                  var std.dev share
-idiosyncratic 0.33651 0.58010 0.937
-individual    0.02257 0.15025 0.063
-theta: 0.2691
-
-Residuals:
-     Min.   1st Qu.    Median   3rd Qu.      Max. 
--1.977198 -0.553702 -0.072856  0.525829  2.463928 
-
-Coefficients:
-                Estimate  Std. Error  z-value  Pr(>|z|)    
-(Intercept)  -5.1074e-16  4.1809e-02   0.0000  1.000000    
-Imigranti     3.1267e-01  4.2487e-02   7.3592  1.85e-13 ***
-Rata_Somaj   -7.2608e-01  4.1321e-02 -17.5715 < 2.2e-16 ***
-Rata_Ocupare  2.6614e-02  4.8461e-02   0.5492  0.582880    
-Pop_Activa   -1.4790e-01  5.4560e-02  -2.7108  0.006711 ** 
----
-Signif. codes:  0 '***' 0.001 '**' 0.01 '*' 0.05 '.' 0.1 ' ' 1
-
-Total Sum of Squares:    509
-Residual Sum of Squares: 275.8
-R-Squared:      0.45816
-Adj. R-Squared: 0.45415
-Chisq: 457.444 on 4 DF, p-value: < 2.22e-16
-
-============================================================
-COMPARAREA MODELELOR
-============================================================
-
-1. HAUSMAN TEST (Fixed Effects vs Random Effects):
-H0: Random Effects model este preferat
-H1: Fixed Effects model este preferat
-
-	Hausman Test
-
-data:  Salariu ~ Imigranti + Rata_Somaj + Rata_Ocupare + Pop_Activa
-chisq = 157.27, df = 4, p-value < 2.2e-16
-alternative hypothesis: one model is inconsistent
-
-Rezultat: Fixed Effects model este preferat (p < 0.05)
-
-2. COMPARAREA R-SQUARED:
-Fixed Effects R-squared: 0.6403 
-Random Effects R-squared: 0.4582 
-""", language="")
+    st.markdown(f"`{formula}` — panel: n = {fixe['n']} județe, T = {fixe['T']} ani, N = {fixe['N']} observații")
     
-    # Interpretarea rezultatelor
-    st.markdown("#### Interpretarea rezultatelor")
-    st.markdown("""
-    **Modelul selectat:** Pe baza Hausman Test (p < 2.2e-16), modelul **Fixed Effects** 
-    este preferat față de modelul Random Effects.
+    st.markdown("**Modelul 1: Fixed Effects (within)**")
+    afiseaza_coeficienti(fixe['coeficienti'])
+    st.markdown(
+        f"R-squared: {fixe['r2']:.5f} · Adj. R-squared: {fixe['r2_ajustat']:.5f} · "
+        f"F-statistic: {fixe['statistica_f']:.3f} pe {fixe['grade_f'][0]} și {fixe['grade_f'][1]} DF, "
+        f"p-value: {fixe['p_f']:.4g}"
+    )
+    
+    st.markdown("**Modelul 2: Random Effects (transformarea Swamy-Arora)**")
+    afiseaza_coeficienti(aleatoare['coeficienti'])
+    st.markdown(
+        f"Varianța idiosincratică: {aleatoare['sigma2_idiosincratic']:.5f} · "
+        f"varianța individuală: {aleatoare['sigma2_individual']:.5f} · theta: {aleatoare['theta']:.4f}  \n"
+        f"R-squared: {aleatoare['r2']:.5f} · Adj. R-squared: {aleatoare['r2_ajustat']:.5f} · "
+        f"Chisq: {aleatoare['chi2']:.3f} pe {len(explicative)} DF, p-value: {aleatoare['p_chi2']:.4g}"
+    )
     
-    **Puterea explicativă:** Modelul Fixed Effects explică **64.03%** din variația 
-    salariului (R-squared = 0.6403), comparativ cu **45.82%** pentru modelul Random Effects.
+    # Compararea modelelor
+    st.markdown("**Compararea modelelor**")
+    model_preferat = "Fixed Effects" if hausman['p'] < 0.05 else "Random Effects"
+    st.markdown(
+        f"Hausman Test (H0: Random Effects model este preferat): chisq = {hausman['chi2']:.2f}, "
+        f"df = {hausman['grade']}, p-value = {hausman['p']:.4g} → **{model_preferat}** model este preferat  \n"
+        f"Fixed Effects R-squared: {fixe['r2']:.4f} · Random Effects R-squared: {aleatoare['r2']:.4f}"
+    )
     
-    **Variabile semnificative:**
-    - **Imigranti** (p = 5.808e-09): Efect pozitiv semnificativ
-    - **Rata_Somaj** (p < 2.2e-16): Efect negativ puternic semnificativ  
-    - **Pop_Activa** (p = 0.001593): Efect negativ semnificativ
-    - **Rata_Ocupare** (p = 0.495783): Nu este semnificativ statistic
-    """)  
+    # Interpretarea rezultatelor
+    coeficienti = (fixe if model_preferat == "Fixed Effects" else aleatoare)['coeficienti'].loc[explicative]
+    variabile_text = "\n".join(
+        f"- **{nume}** (p = {rand['p-value']:.4g}): "
+        + (f"Efect {'pozitiv' if rand['Estimare'] > 0 else 'negativ'} semnificativ" if rand['p-value'] < 0.05
+           else "Nu este semnificativ statistic")
+        for nume, rand in coeficienti.iterrows()
+    )
+    st.markdown("#### Interpretarea rezultatelor")
+    st.markdown(
+        f"**Modelul selectat:** Pe baza Hausman Test (p = {hausman['p']:.4g}), modelul **{model_preferat}** "
+        f"este preferat.\n\n"
+        f"**Puterea explicativă:** Modelul Fixed Effects explică **{fixe['r2']:.2%}** din variația "
+        f"variabilei {dependenta} (R-squared = {fixe['r2']:.4f}), comparativ cu **{aleatoare['r2']:.2%}** "
+        f"pentru modelul Random Effects.\n\n"
+        f"**Variabile (modelul {model_preferat}):**\n{variabile_text}"
+    )
 
 def pagina_principala():
     # Pagina de landing cu design modern si estetic
@@ -2930,16 +2125,13 @@ def analiza_absolventi_evolutie():
     st.info("Acest grafic arata evolutia numarului total de absolventi in timp pentru fiecare judet din regiunea Centru. "
             "Linia alba punctata reprezinta media pe judete din regiunea Centru.")
     
-    df = incarca_date('Absolventi')
+    df = tabel_tipizat('Absolventi')
     ani = sorted([col for col in df.columns if col.startswith('Anul')],
                  key=lambda x: int(x.split()[-1]), reverse=True)
     
     # Filtreaza DOAR judetele din regiunea Centru (fara Romania)
     df_filtrat = df[df['Judete'].isin(['Alba', 'Brasov', 'Covasna', 'Harghita', 'Mures', 'Sibiu'])]
     
-    # Converteste la float pentru calculele numerice
-    df_filtrat = converteste_ani_la_float(df_filtrat, ani)
-    
     # Calculeaza totalul de absolventi pe judete (suma tuturor nivelurilor de educatie)
     df_total = df_filtrat.groupby('Judete')[ani].sum().reset_index()
     
@@ -2960,7 +2152,6 @@ def grafic_linie_absolventi(df, ani, titlu, ylabel):
     # Creaza grafic linie pentru evolutia numarului de absolventi pe judete
     st.divider()
     ani_num = extrage_ani(ani)
-    df = converteste_ani_la_float(df, ani)
     df_judete = df[df['Judete'] != 'Romania']
     
     fig = go.Figure()
@@ -3006,11 +2197,11 @@ def grafic_linie_absolventi(df, ani, titlu, ylabel):
         hovermode="x unified"
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    afiseaza_figura(fig)
     st.markdown("#### Tabel cu datele")
     df_display = df.copy()
     df_display.loc[df_display['Judete'] == 'Romania', 'Judete'] = 'Romania'
-    st.dataframe(df_display.set_index('Judete')[ani])
+    afiseaza_tabel(df_display.set_index('Judete')[ani])
     st.divider()
 
 def main():
@@ -3022,6 +2213,8 @@ def main():
         initial_sidebar_state="expanded"
     )
     
+    # Numarul rularilor complete ale paginii in sesiune (rularile doar ale unui fragment nu il cresc)
+    st.session_state['rulari_complete'] = st.session_state.get('rulari_complete', 0) + 1
     st.sidebar.title("Navigare")
     st.sidebar.markdown("---")
     
@@ -3042,11 +2235,25 @@ def main():
             "Statistici descriptive",
             "Analiză spațială",
             "Sectorul public vs privat",
+            "Specializare economică",
+            "Analiză shift-share",
             "Analiză de regresie"
         ),
         index=0
     )
-    
+    instrumentat = instrumentare_activa()
+    if instrumentat:
+        instrumentare.porneste(optiune)
+    with instrumentare.faza('sidebar: memorie date'):
+        afiseaza_memorie_date()
+    with instrumentare.faza(f"pagina: {optiune}"):
+        afiseaza_pagina(optiune)
+    if instrumentat:
+        afiseaza_jurnal_timpi()
+        afiseaza_instrumentare(instrumentare.opreste())
+
+def afiseaza_pagina(optiune):
+    # Continutul sectiunii alese in sidebar
     if optiune == "Pagina principală":
         pagina_principala()
         
@@ -3054,14 +2261,14 @@ def main():
         st.header("Evolutia ratei somajului in regiunea Centru (grafic cu linii)")
         st.info("Acest grafic arata evolutia ratei somajului in timp pentru fiecare judet din regiunea Centru. "
                 "Linia alba punctata reprezinta media nationala.")
-        df = incarca_date('Somaj')
+        df = tabel_tipizat('Somaj')
         ani = sorted([col for col in df.columns if col.startswith('Anul')],
                      key=lambda x: int(x.split()[-1]), reverse=True)
         sex = st.selectbox("Sex", df['Sexe'].unique())
         df_filtrat = df[(df['Sexe'] == sex) & ((df['Judete'].isin(['Alba', 'Brasov', 'Covasna',
                                                                     'Harghita', 'Mures', 'Sibiu'])) |
-                                                (df['Judete'].str.upper() == 'TOTAL'))]
-        grafic_linie_somaj(df_filtrat, ani, "Evolutia ratei somajului", "Rata somaj (%)")
+                                                (df['Judete'] == 'Romania'))]
+        grafic_linie_somaj(df_filtrat, ani, "Evolutia ratei somajului", "Rata somaj (%)", sex)
 
     elif optiune == "Evoluție PIB":
         analiza_pib_evolutie()
@@ -3072,75 +2279,92 @@ def main():
     elif optiune == "Hartă termică șomaj":
         st.header("Comparatie rata somajului pe judete si ani (harta termica)")
         st.info("Harta termica permite compararea rapida a ratei somajului intre judete si ani.")
-        df = incarca_date('Somaj')
+        df = tabel_tipizat('Somaj')
         ani = sorted([col for col in df.columns if col.startswith('Anul')],
                      key=lambda x: int(x.split()[-1]), reverse=True)
         sex = st.selectbox("Sex", df['Sexe'].unique())
         df = df[(df['Sexe'] == sex) & ((df['Judete'].isin(['Alba', 'Brasov', 'Covasna',
                                                            'Harghita', 'Mures', 'Sibiu'])) |
-                                        (df['Judete'].str.upper() == 'TOTAL'))]
-        heatmap_judete_ani_interactiv(df, ani, "Harta termica rata somajului pe judete si ani")
+                                        (df['Judete'] == 'Romania'))]
+        heatmap_judete_ani_interactiv(df, ani, "Harta termica rata somajului pe judete si ani", sex)
 
     elif optiune == "Comparație rată șomaj":
         st.header("Top judete dupa rata somajului (grafic cu bare)")
         st.info("Acest grafic arata comparatia ratei somajului intre judete pentru anul selectat.")
-        df = incarca_date('Somaj')
-        ani = sorted([col for col in df.columns if col.startswith('Anul')],
-                     key=lambda x: int(x.split()[-1]), reverse=True)
-        sex = st.selectbox("Sex", df['Sexe'].unique())
-        an = st.selectbox("An", ani, index=0)
-        df = df[(df['Sexe'] == sex) & ((df['Judete'].isin(['Alba', 'Brasov', 'Covasna',
-                                                           'Harghita', 'Mures', 'Sibiu'])) |
-                                        (df['Judete'].str.upper() == 'TOTAL'))]
-        bar_chart_an_interactiv(df, an, f"Rata somajului pe judete in {an.split()[-1]}", "Rata somaj (%)")
+        ani = ani_tabel('Somaj')
+        sex = st.selectbox("Sex", valori_distincte('Somaj', 'Sexe'))
+        loc_an = st.container()
+        # In modul interactiv se trimit toti anii o singura data, altfel doar anul ales
+        if not st.checkbox(ETICHETA_MOD_INTERACTIV, value=False, help=AJUTOR_MOD_INTERACTIV):
+            ani = [loc_an.selectbox("An", ani, index=0)]
+        # Se citesc doar randurile si anii afisati pe grafic
+        df = tabel_filtrat('Somaj', judete=JUDETE_CENTRU + ['Romania'], filtre={'Sexe': [sex]}, ani=ani)
+        bar_chart_an_interactiv(df, ani, "Rata somajului pe judete in {an}", "Rata somaj (%)", sex)
 
     elif optiune == "Salariați pe activități (bare)":
         st.header("Numar salariati pe activitati economice si judete (grafic cu bare)")
         st.info("Acest grafic arata distributia salariatilor pe activitati economice pentru fiecare judet.")
-        df = incarca_date('Salariati2')
+        df = tabel_tipizat('Salariati2')
         ani = sorted([col for col in df.columns if col.startswith('Anul')],
                      key=lambda x: int(x.split()[-1]), reverse=True)
-        an = st.selectbox("An", ani, index=0)
+        loc_an = st.container()
+        # In modul interactiv graficul primeste toti anii, altfel doar anul ales
+        if not st.checkbox(ETICHETA_MOD_INTERACTIV, value=False, help=AJUTOR_MOD_INTERACTIV):
+            ani = [loc_an.selectbox("An", ani, index=0)]
         df = df[(df['Judete'].isin(['Alba', 'Brasov', 'Covasna', 'Harghita', 'Mures', 'Sibiu'])) |
-                (df['Judete'].str.upper() == 'TOTAL')]
-        bar_chart_salariati_activitati(df, ani, an)
+                (df['Judete'] == 'Romania')]
+        bar_chart_salariati_activitati(df, ani)
 
     elif optiune == "Salariați pe activități (grafice circulare)":
         st.header("Structura salariatilor pe activitati economice (grafice circulare pe judete)")
         st.info("Fiecare grafic circular arata structura salariatilor pe activitati economice pentru un judet.")
-        df = incarca_date('Salariati2')
+        df = tabel_tipizat('Salariati2')
         ani = sorted([col for col in df.columns if col.startswith('Anul')],
                      key=lambda x: int(x.split()[-1]), reverse=True)
         an = st.selectbox("An", ani, index=0)
         df = df[(df['Judete'].isin(['Alba', 'Brasov', 'Covasna', 'Harghita', 'Mures', 'Sibiu'])) |
-                (df['Judete'].str.upper() == 'TOTAL')]
+                (df['Judete'] == 'Romania')]
         pie_charts_salariati_judete(df, ani, an)
 
     elif optiune == "Corelație șomaj-ocupare":
         st.header("Corelatie intre rata somajului si rata de ocupare a resurselor de munca")
         st.info("Aceasta diagrama de dispersie arata relatia dintre rata somajului si rata de ocupare a resurselor de munca. "
             "Județele din regiunea Centru sunt evidențiate cu culori distinctive, celelalte județe sunt afișate în gri.")
-        df_somaj = incarca_date('Somaj')
-        df_resurse = incarca_date('Resurse')
-        ani = sorted([col for col in df_somaj.columns if col.startswith('Anul')],
-                 key=lambda x: int(x.split()[-1]), reverse=True)
-        sex = st.selectbox("Sex", df_somaj['Sexe'].unique())
+        indicatori = list(INDICATORI)
+        indicator_x = st.selectbox("Indicatorul de pe axa X", indicatori, index=indicatori.index("Rata somajului"))
+        indicator_y = st.selectbox("Indicatorul de pe axa Y", indicatori,
+                                   index=indicatori.index("Rata de ocupare a resurselor de munca"))
+        dimensiuni = []
+        for axa, indicator in (('x', indicator_x), ('y', indicator_y)):
+            config = INDICATORI[indicator]
+            # Indicatorii agregati (agregare 'suma') sunt adunati pe dimensiune, ca pe harta
+            dimensiune = None if config.get('agregare') == 'suma' else DIMENSIUNE_IMPLICITA
+            if config.get('dimensiune'):
+                eticheta = "Sex" if config['dimensiune'] == 'Sexe' else config['eticheta_dimensiune']
+                dimensiune = st.selectbox(f"{eticheta} ({indicator})",
+                                          valori_distincte(config['tabel'], config['dimensiune']),
+                                          key=f"dim_{axa}")
+            dimensiuni.append(dimensiune)
     
         # Include toate judetele, nu doar regiunea Centru
-        df_somaj = df_somaj[(df_somaj['Sexe'] == sex)]
-        df_resurse = replace_total_with_romania(df_resurse)
-    
-        an = st.selectbox("An", ani, index=0)
-        scatter_corelatie_interactiv(
-        df_somaj, df_resurse, an,
-        f"Corelație rata somaj - rata de ocupare ({an.split()[-1]})",
-        "Rata somaj (%)", "Rata de ocupare (%)"
-    )
+        judete, ani, x, y = indicatori_aliniati(indicator_x, dimensiuni[0], indicator_y, dimensiuni[1],
+                                                versiune_date())
+        if len(ani) == 0:
+            st.warning("Cei doi indicatori nu au ani comuni pentru selectia facuta.")
+        else:
+            an = st.selectbox("An", [f"Anul {a}" for a in ani[::-1]], index=0)
+            coloana = list(ani).index(int(an.split()[-1]))
+            scatter_corelatie_interactiv(
+                judete, x[:, coloana], y[:, coloana],
+                f"Corelație {indicator_x.lower()} - {indicator_y.lower()} ({an.split()[-1]})",
+                INDICATORI[indicator_x]['titlu_scala'], INDICATORI[indicator_y]['titlu_scala']
+            )
 
     elif optiune == "Structura absolvenți":
         st.header("Structura absolventilor pe niveluri de educatie (diagrama cu bare stivuite)")
         st.info("Aceasta diagrama cu bare stivuite arata structura absolventilor pe niveluri de educatie pentru judetul selectat.")
-        df = filtreaza_regiunea_centru_si_romania(incarca_date('Absolventi'))
+        df = tabel_tipizat('Absolventi')
+        df = df[df['Judete'].isin(JUDETE_CENTRU)]
         ani = sorted([col for col in df.columns if col.startswith('Anul')],
                      key=lambda x: int(x.split()[-1]), reverse=True)
         judet = st.selectbox("Alege judetul", df['Judete'].unique())
@@ -3155,6 +2379,12 @@ def main():
     elif optiune == "Sectorul public vs privat":
         analiza_spatiala_public_privat()
 
+    elif optiune == "Specializare economică":
+        analiza_specializare()
+
+    elif optiune == "Analiză shift-share":
+        analiza_shift_share()
+
     elif optiune == "Analiză de regresie":
         analiza_regresie()
 
@@ -0,0 +1,253 @@
+# Migrarea bazei data.sqlite: tabele de dimensiuni (judete, activitati NACE, categorii),
+# tabele de fapte tipizate cu chei intregi si indecsi pentru filtrele folosite in aplicatie.
+# Tabelele late originale raman neschimbate (primesc doar indecsi), astfel ca aplicatia le poate
+# citi in continuare. Rulare: python python/migrare_db.py [--baza cale] [--iesire cale]
+import argparse
+import os
+import re
+import shutil
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+from baza_date import CALE_BAZA_DATE
+from cub_indicatori import DIMENSIUNI_TABELE, este_coloana_an
+from judete import (INDEX_JUDETE, JUDETE, MACROREGIUNE_REGIUNE, MACROREGIUNI, calculeaza_centroide, cheie_nume,
+                    id_geojson)
+
+# Versiunea schemei scrise de migrare (PRAGMA user_version)
+VERSIUNE_SCHEMA = 1
+
+# Primele diviziuni NACE Rev. 2 ale fiecarei sectiuni; o diviziune apartine ultimei sectiuni
+# al carei prag este mai mic sau egal cu ea
+PRAGURI_SECTIUNI_NACE = [
+    (1, 'A'), (5, 'B'), (10, 'C'), (35, 'D'), (36, 'E'), (41, 'F'), (45, 'G'), (49, 'H'),
+    (55, 'I'), (58, 'J'), (64, 'K'), (68, 'L'), (69, 'M'), (77, 'N'), (84, 'O'), (85, 'P'),
+    (86, 'Q'), (90, 'R'), (94, 'S'), (97, 'T'), (99, 'U'),
+]
+
+_SECTIUNE = re.compile(r'^([A-U]) ')
+_DIVIZIUNE = re.compile(r'^(\d{2}(?:-\d{2})?) ')
+
+
+def _ghilimele(identificator):
+    return '"' + identificator.replace('"', '""') + '"'
+
+
+def nume_tabel_fapte(nume_tabel):
+    # Numele tabelului de fapte tipizat corespunzator unui tabel lat (ex. Somaj -> fapt_somaj)
+    return 'fapt_' + nume_tabel.lower()
+
+
+def clasifica_activitate(denumire):
+    # (cod, sectiune, nivel) pentru o denumire de activitate din tabelele Salariati:
+    # "C INDUSTRIA PRELUCRATOARE" -> ('C', 'C', 'sectiune'), "10 Industria alimentara" -> ('10', 'C', 'diviziune')
+    potrivire = _SECTIUNE.match(denumire)
+    if potrivire:
+        return potrivire.group(1), potrivire.group(1), 'sectiune'
+    potrivire = _DIVIZIUNE.match(denumire)
+    if potrivire:
+        cod = potrivire.group(1)
+        diviziune = int(cod[:2])
+        sectiune = [litera for prag, litera in PRAGURI_SECTIUNI_NACE if prag <= diviziune][-1]
+        return cod, sectiune, 'diviziune'
+    if denumire.strip().upper() == 'TOTAL':
+        return None, None, 'total'
+    return None, None, 'agregat'
+
+
+def randuri_dim_judet():
+    # Randurile tabelului dim_judet: tara, macroregiunile, regiunile de dezvoltare si judetele,
+    # fiecare cu cheia surogat atribuita in aceasta ordine
+    centroide = calculeaza_centroide()
+    randuri = [(None, 'Romania', 'tara', None, None, None, None, None, None)]
+    for macroregiune in MACROREGIUNI:
+        randuri.append((None, macroregiune, 'macroregiune', None, macroregiune, None, None, None, None))
+    for regiune, macroregiune in MACROREGIUNE_REGIUNE.items():
+        randuri.append((None, f'Regiunea {regiune}', 'regiune', regiune, macroregiune, None, None, None, None))
+    for nume, siruta, prescurtare, regiune in sorted(JUDETE, key=lambda judet: judet[1]):
+        lat, lon = centroide.get(id_geojson(prescurtare), (None, None))
+        randuri.append((siruta, nume, 'judet', regiune, MACROREGIUNE_REGIUNE[regiune],
+                        prescurtare, id_geojson(prescurtare), lat, lon))
+    return [(id_judet,) + rand for id_judet, rand in enumerate(randuri, start=1)]
+
+
+def index_nume_judete(randuri_judete):
+    # Cheia normalizata a oricarei variante de nume -> id_judet (include aliasurile din INDEX_JUDETE)
+    index = {cheie_nume(rand[2]): rand[0] for rand in randuri_judete}
+    for cheie, nume in INDEX_JUDETE.items():
+        index.setdefault(cheie, index[cheie_nume(nume)])
+    return index
+
+
+def _valoare_numerica(text):
+    # Celulele sunt stocate ca TEXT; celulele goale sau nenumerice nu intra in tabelele de fapte
+    if text is None:
+        return None
+    try:
+        return float(str(text).strip().replace(',', '.'))
+    except ValueError:
+        return None
+
+
+def creeaza_dimensiuni(con):
+    # Creeaza si populeaza dim_judet, dim_activitate si dim_categorie; intoarce indexurile de cautare
+    con.executescript("""
+        DROP TABLE IF EXISTS dim_judet;
+        DROP TABLE IF EXISTS dim_activitate;
+        DROP TABLE IF EXISTS dim_categorie;
+        CREATE TABLE dim_judet (
+            id_judet INTEGER PRIMARY KEY,
+            siruta INTEGER UNIQUE,
+            nume TEXT NOT NULL UNIQUE,
+            nivel TEXT NOT NULL CHECK (nivel IN ('tara', 'macroregiune', 'regiune', 'judet')),
+            regiune TEXT,
+            macroregiune TEXT,
+            prescurtare TEXT UNIQUE,
+            id_geojson TEXT UNIQUE,
+            latitudine REAL,
+            longitudine REAL
+        );
+        CREATE TABLE dim_activitate (
+            id_activitate INTEGER PRIMARY KEY,
+            denumire TEXT NOT NULL UNIQUE,
+            cod TEXT,
+            sectiune TEXT,
+            nivel TEXT NOT NULL CHECK (nivel IN ('total', 'agregat', 'sectiune', 'diviziune'))
+        );
+        CREATE TABLE dim_categorie (
+            id_categorie INTEGER PRIMARY KEY,
+            dimensiune TEXT NOT NULL,
+            valoare TEXT NOT NULL,
+            UNIQUE (dimensiune, valoare)
+        );
+    """)
+    randuri_judete = randuri_dim_judet()
+    con.executemany("INSERT INTO dim_judet VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", randuri_judete)
+
+    activitati = {}
+    categorii = {}
+    for nume_tabel, dimensiune in DIMENSIUNI_TABELE.items():
+        if dimensiune is None:
+            continue
+        valori = [rand[0] for rand in con.execute(
+            f"SELECT {_ghilimele(dimensiune)} FROM {_ghilimele(nume_tabel)} "
+            f"GROUP BY {_ghilimele(dimensiune)} ORDER BY MIN(rowid)"
+        )]
+        for valoare in valori:
+            if dimensiune == 'Activitati ale economiei':
+                if valoare not in activitati:
+                    activitati[valoare] = len(activitati) + 1
+                    con.execute("INSERT INTO dim_activitate VALUES (?, ?, ?, ?, ?)",
+                                (activitati[valoare], valoare) + clasifica_activitate(valoare))
+            elif (dimensiune, valoare) not in categorii:
+                categorii[(dimensiune, valoare)] = len(categorii) + 1
+                con.execute("INSERT INTO dim_categorie VALUES (?, ?, ?)",
+                            (categorii[(dimensiune, valoare)], dimensiune, valoare))
+    return index_nume_judete(randuri_judete), activitati, categorii
+
+
+def migreaza_tabel(con, nume_tabel, index_judete, activitati, categorii):
+    # Rescrie un tabel lat intr-un tabel de fapte (id_judet, [id dimensiune,] an, valoare)
+    # si adauga indexul pe (Judete, dimensiune) tabelului lat. Intoarce numarul de randuri scrise.
+    dimensiune = DIMENSIUNI_TABELE[nume_tabel]
+    coloane = [rand[1] for rand in con.execute(f"PRAGMA table_info({_ghilimele(nume_tabel)})")]
+    coloane_ani = [col for col in coloane if este_coloana_an(col)]
+    ani = [int(col.split()[-1]) for col in coloane_ani]
+
+    if dimensiune == 'Activitati ale economiei':
+        coloana_dim, definitie_dim = 'id_activitate', 'id_activitate INTEGER NOT NULL REFERENCES dim_activitate, '
+    elif dimensiune:
+        coloana_dim, definitie_dim = 'id_categorie', 'id_categorie INTEGER NOT NULL REFERENCES dim_categorie, '
+    else:
+        coloana_dim, definitie_dim = None, ''
+    chei = ['id_judet'] + ([coloana_dim] if coloana_dim else []) + ['an']
+
+    tabel_fapte = nume_tabel_fapte(nume_tabel)
+    con.execute(f"DROP TABLE IF EXISTS {tabel_fapte}")
+    con.execute(
+        f"CREATE TABLE {tabel_fapte} (id_judet INTEGER NOT NULL REFERENCES dim_judet, {definitie_dim}"
+        f"an INTEGER NOT NULL, valoare REAL NOT NULL, PRIMARY KEY ({', '.join(chei)})) WITHOUT ROWID"
+    )
+
+    selectie = ['Judete'] + ([dimensiune] if dimensiune else []) + coloane_ani
+    randuri = []
+    necunoscute = set()
+    for rand in con.execute(f"SELECT {', '.join(map(_ghilimele, selectie))} FROM {_ghilimele(nume_tabel)}"):
+        id_judet = index_judete.get(cheie_nume(rand[0]))
+        if id_judet is None:
+            necunoscute.add(rand[0])
+            continue
+        if dimensiune == 'Activitati ale economiei':
+            chei_rand = (id_judet, activitati[rand[1]])
+        elif dimensiune:
+            chei_rand = (id_judet, categorii[(dimensiune, rand[1])])
+        else:
+            chei_rand = (id_judet,)
+        celule = rand[2:] if dimensiune else rand[1:]
+        for an, text in zip(ani, celule):
+            valoare = _valoare_numerica(text)
+            if valoare is not None:
+                randuri.append(chei_rand + (an, valoare))
+    if necunoscute:
+        raise ValueError(f"Judete necunoscute in tabelul '{nume_tabel}': {sorted(necunoscute)}")
+
+    con.executemany(f"INSERT INTO {tabel_fapte} VALUES ({', '.join('?' * (len(chei) + 1))})", randuri)
+
+    # Indexul secundar acopera interogarile pe an (harti): valoarea este inclusa in index,
+    # iar cheia primara (judet, dimensiune) este adaugata implicit in tabelele WITHOUT ROWID
+    dupa_an = ['an'] + ([coloana_dim] if coloana_dim else [])
+    con.execute(f"CREATE INDEX idx_{tabel_fapte}_an ON {tabel_fapte} ({', '.join(dupa_an)}, valoare)")
+
+    index_lat = f"idx_{nume_tabel.lower()}_judete"
+    coloane_index = ['Judete'] + ([dimensiune] if dimensiune else [])
+    con.execute(f"DROP INDEX IF EXISTS {index_lat}")
+    con.execute(f"CREATE INDEX {index_lat} ON {_ghilimele(nume_tabel)} ({', '.join(map(_ghilimele, coloane_index))})")
+    return len(randuri)
+
+
+def migreaza(cale_baza, cale_iesire=None):
+    # Migreaza o copie a bazei si o muta atomic peste destinatie (implicit chiar baza sursa),
+    # astfel ca aplicatia nu vede niciodata o baza scrisa pe jumatate
+    cale_baza = Path(cale_baza)
+    cale_iesire = Path(cale_iesire) if cale_iesire else cale_baza
+    descriptor, cale_temporara = tempfile.mkstemp(suffix='.sqlite', dir=cale_iesire.parent)
+    os.close(descriptor)
+    try:
+        shutil.copyfile(cale_baza, cale_temporara)
+        shutil.copymode(cale_baza, cale_temporara)
+        con = sqlite3.connect(cale_temporara)
+        try:
+            with con:
+                index_judete, activitati, categorii = creeaza_dimensiuni(con)
+                raport = {
+                    nume_tabel: migreaza_tabel(con, nume_tabel, index_judete, activitati, categorii)
+                    for nume_tabel in DIMENSIUNI_TABELE
+                }
+                con.execute(f"PRAGMA user_version = {VERSIUNE_SCHEMA}")
+            con.execute("ANALYZE")
+            con.execute("VACUUM")
+        finally:
+            con.close()
+        os.replace(cale_temporara, cale_iesire)
+    except BaseException:
+        os.remove(cale_temporara)
+        raise
+    return raport
+
+
+def main(argumente=None):
+    parser = argparse.ArgumentParser(description="Migreaza data.sqlite la tabele de fapte tipizate si indexate")
+    parser.add_argument('--baza', default=CALE_BAZA_DATE, help="baza sursa (implicit data.sqlite de langa aplicatie)")
+    parser.add_argument('--iesire', default=None, help="baza rezultata (implicit se inlocuieste baza sursa)")
+    argumente = parser.parse_args(argumente)
+
+    raport = migreaza(argumente.baza, argumente.iesire)
+    for nume_tabel, nr_randuri in raport.items():
+        print(f"{nume_tabel:<12} -> {nume_tabel_fapte(nume_tabel):<17} {nr_randuri:>6} randuri")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,164 @@
+# Estimatori pentru date de tip panel (judet x an) construiti direct pe cubul de indicatori, echivalentul
+# modelelor plm din r/regresie_panel.r: efecte fixe (within), efecte aleatoare (Swamy-Arora) si testul Hausman.
+# Centrarea pe judete se face vectorizat (medii de grup prin bincount), iar estimarea prin cele mai mici patrate.
+import numpy as np
+import pandas as pd
+
+from cub_indicatori import DIMENSIUNE_IMPLICITA
+
+# Variabilele disponibile in model: nume variabila -> tabelul (indicatorul) din cub
+VARIABILE_PANEL = {
+    'Salariu': 'Salariu',
+    'Imigranti': 'Imigranti',
+    'Rata_Somaj': 'Somaj',
+    'Rata_Ocupare': 'Resurse',
+    'Pop_Activa': 'PopActiva',
+    'PIB': 'PIB',
+}
+
+# Modelul din analiza initiala facuta in R
+DEPENDENTA_IMPLICITA = 'Salariu'
+EXPLICATIVE_IMPLICITE = ['Imigranti', 'Rata_Somaj', 'Rata_Ocupare', 'Pop_Activa']
+
+
+def date_panel(cub, variabile, judete=None, ani=None, standardizeaza=True, doar_complete=True):
+    # Panelul (Judete, An) x variabile pentru totalul fiecarui indicator, implicit doar cu observatiile complete.
+    # Ca in R, un judet cu mai multe randuri "Total" primeste media lor, iar standardizarea este cea din scale().
+    tabele = [VARIABILE_PANEL[variabila] for variabila in variabile]
+    felie = cub[cub['Indicator'].isin(tabele) & (cub['Dimensiune'].astype(str).str.upper() == DIMENSIUNE_IMPLICITA.upper())]
+    if judete is not None:
+        felie = felie[felie['Judete'].isin(judete)]
+    if ani is not None:
+        felie = felie[felie['An'].between(*ani)]
+    panel = felie.pivot_table(index=['Judete', 'An'], columns='Indicator', values='Valoare',
+                              aggfunc='mean', observed=True)
+    panel = panel.reindex(columns=tabele).set_axis(list(variabile), axis=1)
+    if doar_complete:
+        panel = panel.dropna()
+    if standardizeaza:
+        panel = (panel - panel.mean()) / panel.std(ddof=1)
+    return panel
+
+
+def _grupuri(panel):
+    # Codurile judetelor (0..n-1) pentru fiecare observatie si numarul de observatii pe judet
+    coduri = pd.factorize(panel.index.get_level_values('Judete'))[0]
+    return coduri, np.bincount(coduri)
+
+
+def _medii_grup(valori, coduri, numar):
+    # Mediile pe judet ale fiecarei coloane din valori (observatii x coloane), intr-o singura trecere
+    sume = np.stack([np.bincount(coduri, weights=coloana, minlength=len(numar)) for coloana in valori.T], axis=1)
+    return sume / numar[:, None]
+
+
+def _cmmp(X, y):
+    # Cele mai mici patrate: coeficienti, reziduuri si (X'X)^-1
+    coeficienti, _, _, _ = np.linalg.lstsq(X, y, rcond=None)
+    return coeficienti, y - X @ coeficienti, np.linalg.pinv(X.T @ X)
+
+
+def _tabel_coeficienti(nume, coeficienti, erori, valori_p, eticheta_statistica):
+    return pd.DataFrame({
+        'Estimare': coeficienti,
+        'Eroare standard': erori,
+        eticheta_statistica: coeficienti / erori,
+        'p-value': valori_p,
+    }, index=nume)
+
+
+def efecte_fixe(panel, dependenta, explicative):
+    # Modelul within (efecte fixe individuale): variabilele sunt centrate pe judet, apoi estimate prin CMMP
+    from scipy import stats
+
+    coduri, numar = _grupuri(panel)
+    valori = panel[[dependenta] + list(explicative)].to_numpy(dtype='float64')
+    centrate = valori - _medii_grup(valori, coduri, numar)[coduri]
+    y, X = centrate[:, 0], centrate[:, 1:]
+
+    coeficienti, reziduuri, inversa = _cmmp(X, y)
+    N, k = X.shape
+    grade = N - len(numar) - k
+    rss = reziduuri @ reziduuri
+    tss = y @ y
+    sigma2 = rss / grade
+    erori = np.sqrt(np.diag(inversa) * sigma2)
+    r2 = 1 - rss / tss
+    f = (tss - rss) / k / sigma2
+    return {
+        'coeficienti': _tabel_coeficienti(list(explicative), coeficienti, erori,
+                                          2 * stats.t.sf(np.abs(coeficienti / erori), grade), 't-value'),
+        'covarianta': inversa * sigma2,
+        'reziduuri': reziduuri,
+        'n': len(numar), 'T': int(numar.max()), 'N': N,
+        'tss': tss, 'rss': rss, 'sigma2': sigma2,
+        'r2': r2, 'r2_ajustat': 1 - rss / tss * (N - 1) / grade,
+        'statistica_f': f, 'grade_f': (k, grade), 'p_f': stats.f.sf(f, k, grade),
+    }
+
+
+def efecte_aleatoare(panel, dependenta, explicative):
+    # Modelul cu efecte aleatoare, transformarea Swamy-Arora: variantele componentelor din regresiile within
+    # si between, apoi CMMP pe datele cvasi-centrate (y - theta * media judetului)
+    from scipy import stats
+
+    coduri, numar = _grupuri(panel)
+    valori = panel[[dependenta] + list(explicative)].to_numpy(dtype='float64')
+    medii = _medii_grup(valori, coduri, numar)
+    N, k = len(valori), len(explicative)
+    n = len(numar)
+
+    # Varianta idiosincratica din modelul within, varianta individuala din modelul between
+    centrate = valori - medii[coduri]
+    _, reziduuri_w, _ = _cmmp(centrate[:, 1:], centrate[:, 0])
+    sigma2_e = reziduuri_w @ reziduuri_w / (N - n - k)
+    intre = np.column_stack([np.ones(n), medii[:, 1:]])
+    _, reziduuri_b, _ = _cmmp(intre, medii[:, 0])
+    T_armonic = n / np.sum(1 / numar)
+    sigma2_u = max(reziduuri_b @ reziduuri_b / (n - k - 1) - sigma2_e / T_armonic, 0.0)
+    theta = 1 - np.sqrt(sigma2_e / (numar * sigma2_u + sigma2_e))
+
+    transformate = valori - theta[coduri, None] * medii[coduri]
+    y = transformate[:, 0]
+    X = np.column_stack([1 - theta[coduri], transformate[:, 1:]])
+    coeficienti, reziduuri, inversa = _cmmp(X, y)
+    rss = reziduuri @ reziduuri
+    tss = np.sum((y - y.mean()) ** 2)
+    sigma2 = rss / (N - k - 1)
+    covarianta = inversa * sigma2
+    erori = np.sqrt(np.diag(covarianta))
+    z = coeficienti / erori
+    pante = slice(1, None)
+    chi2 = coeficienti[pante] @ np.linalg.solve(covarianta[pante, pante], coeficienti[pante])
+    return {
+        'coeficienti': _tabel_coeficienti(['(Intercept)'] + list(explicative), coeficienti, erori,
+                                          2 * stats.norm.sf(np.abs(z)), 'z-value'),
+        'covarianta': covarianta,
+        'reziduuri': reziduuri,
+        'n': n, 'T': int(numar.max()), 'N': N,
+        'sigma2_idiosincratic': sigma2_e, 'sigma2_individual': sigma2_u,
+        'theta': float(theta.mean()),
+        'tss': tss, 'rss': rss,
+        'r2': 1 - rss / tss, 'r2_ajustat': 1 - rss / tss * (N - 1) / (N - k - 1),
+        'chi2': chi2, 'p_chi2': stats.chi2.sf(chi2, k),
+    }
+
+
+def test_hausman(fixe, aleatoare):
+    # Testul Hausman pe coeficientii comuni: H0 - efectele aleatoare sunt consistente (si eficiente)
+    from scipy import stats
+
+    nume = list(fixe['coeficienti'].index)
+    diferenta = (fixe['coeficienti']['Estimare'] - aleatoare['coeficienti'].loc[nume, 'Estimare']).to_numpy()
+    pozitii = [list(aleatoare['coeficienti'].index).index(variabila) for variabila in nume]
+    covarianta = fixe['covarianta'] - aleatoare['covarianta'][np.ix_(pozitii, pozitii)]
+    chi2 = float(diferenta @ np.linalg.pinv(covarianta) @ diferenta)
+    return {'chi2': chi2, 'grade': len(nume), 'p': stats.chi2.sf(chi2, len(nume))}
+
+
+def estimeaza_panel(cub, dependenta, explicative, judete=None, ani=None, standardizeaza=True):
+    # Ambele modele si testul Hausman pentru o formula (dependenta ~ explicative) pe setul de judete si anii dati
+    panel = date_panel(cub, [dependenta] + list(explicative), judete, ani, standardizeaza)
+    fixe = efecte_fixe(panel, dependenta, explicative)
+    aleatoare = efecte_aleatoare(panel, dependenta, explicative)
+    return {'panel': panel, 'fixe': fixe, 'aleatoare': aleatoare, 'hausman': test_hausman(fixe, aleatoare)}
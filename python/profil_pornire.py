@@ -0,0 +1,99 @@
+# Profilul pornirii aplicatiei: timpul de import al fiecarui modul (python -X importtime) si timpul pana la
+# prima randare a paginii principale, intr-un proces nou, comparate cu bugetul din buget_pornire.json.
+#   python python/profil_pornire.py                - masoara si verifica bugetul (cod de iesire 1 la depasire)
+#   python python/profil_pornire.py --inregistreaza - salveaza masuratorile curente ca buget (cu marja)
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+DIRECTOR = Path(__file__).resolve().parent
+CALE_BUGET = DIRECTOR / 'buget_pornire.json'
+
+# Marja adaugata peste masuratori la inregistrarea bugetului
+MARJA_BUGET = 1.5
+
+# Scriptul rulat intr-un proces nou: prima randare a aplicatiei (pagina principala este cea implicita)
+_SCRIPT_RANDARE = """
+import time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({cale!r}, default_timeout=300)
+at.run()
+assert not at.exception, at.exception
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def timpi_import():
+    # (ms pentru importul lui main, {modul importat direct de main: ms cumulati}, toate modulele importate),
+    # masurate dintr-un proces nou
+    proces = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import main'],
+                            cwd=DIRECTOR, capture_output=True, text=True, check=True)
+    linii = []
+    for linie in proces.stderr.splitlines():
+        if not linie.startswith('import time:') or 'cumulative' in linie:
+            continue
+        _, cumulat, modul = linie[len('import time:'):].split('|')
+        linii.append((len(modul) - len(modul.lstrip()), modul.strip(), int(cumulat) / 1000))
+
+    # -X importtime scrie dependentele inaintea modulului care le importa, cu indentare mai mare
+    nivel_main, total = next((nivel, ms) for nivel, nume, ms in linii if nume == 'main')
+    timpi = {}
+    for nivel, nume, ms in linii:
+        if nivel == nivel_main + 2:
+            timpi[nume] = timpi.get(nume, 0.0) + ms
+        elif nivel == nivel_main and nume != 'main':
+            timpi = {}
+    toate = {nume.split('.')[0] for _, nume, _ in linii}
+    return total, timpi, toate
+
+
+def timp_prima_randare():
+    # Milisecunde de la pornirea unui proces nou pana la randarea paginii principale
+    script = _SCRIPT_RANDARE.format(cale=str(DIRECTOR / 'main.py'))
+    proces = subprocess.run([sys.executable, '-c', script], cwd=DIRECTOR,
+                            capture_output=True, text=True, check=True)
+    return float(proces.stdout.strip().splitlines()[-1])
+
+
+def main(argumente=None):
+    parser = argparse.ArgumentParser(description="Profilul de pornire al aplicatiei si verificarea bugetului")
+    parser.add_argument('--inregistreaza', action='store_true', help="salveaza masuratorile ca buget nou")
+    parser.add_argument('--top', type=int, default=15, help="cate module sa fie afisate")
+    argumente = parser.parse_args(argumente)
+
+    import_main_ms, timpi, toate_modulele = timpi_import()
+    prima_randare_ms = timp_prima_randare()
+
+    print(f"{'modul':<28}{'ms':>10}")
+    for modul, ms in sorted(timpi.items(), key=lambda x: -x[1])[:argumente.top]:
+        print(f"{modul:<28}{ms:>10.1f}")
+    print(f"\nimport main: {import_main_ms:.0f} ms   prima randare pagina principala: {prima_randare_ms:.0f} ms")
+
+    buget = json.loads(CALE_BUGET.read_text(encoding='utf-8')) if CALE_BUGET.exists() else {}
+    if argumente.inregistreaza:
+        buget.update({
+            'import_main_ms': round(import_main_ms * MARJA_BUGET),
+            'prima_randare_ms': round(prima_randare_ms * MARJA_BUGET),
+        })
+        CALE_BUGET.write_text(json.dumps(buget, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+        print(f"Buget inregistrat in {CALE_BUGET}")
+        return 0
+
+    depasiri = []
+    if import_main_ms > buget.get('import_main_ms', float('inf')):
+        depasiri.append(f"import main {import_main_ms:.0f} ms > {buget['import_main_ms']} ms")
+    if prima_randare_ms > buget.get('prima_randare_ms', float('inf')):
+        depasiri.append(f"prima randare {prima_randare_ms:.0f} ms > {buget['prima_randare_ms']} ms")
+    for modul in buget.get('module_interzise_la_pornire', []):
+        if modul in toate_modulele:
+            depasiri.append(f"modulul '{modul}' este importat la pornire")
+    for depasire in depasiri:
+        print("DEPASIRE:", depasire)
+    return 1 if depasiri else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
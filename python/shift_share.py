@@ -0,0 +1,74 @@
+# Analiza shift-share a variatiei numarului de salariati: pentru fiecare judet j, activitate a si pereche de ani
+# (b = anul de baza, e = anul final), variatia E[j,a,e] - E[j,a,b] se descompune in
+#   efectul national     NS = E[j,a,b] * g                    g   = cresterea ocuparii totale la nivel national
+#   efectul structural   IM = E[j,a,b] * (g[a] - g)           g[a] = cresterea nationala a activitatii a
+#   efectul regional     RS = variatie - NS - IM              (= E[j,a,b] * (r[j,a] - g[a]) cand E[j,a,b] > 0)
+# Referinta nationala este randul TOTAL (Romania) din Salariati2. Toate perechile de ani se calculeaza deodata,
+# prin broadcasting, in tablouri 4-D judet x activitate x an baza x an final.
+import numpy as np
+import pandas as pd
+
+from specializare import INDICATOR_OCUPARE, tensor_ocupare
+
+COMPONENTE = ['Efect national', 'Efect structural', 'Efect regional']
+
+
+def descompunere_shift_share(cub, indicator=INDICATOR_OCUPARE):
+    # Componentele pentru toate judetele, activitatile si perechile de ani (float32, tablouri read-only)
+    judete, activitati, ani, ocupare = tensor_ocupare(cub, indicator)
+    _, _, _, national = tensor_ocupare(cub, indicator, judete=['Romania'], activitati=activitati, ani=ani)
+    national = national[0]
+    if not national.any():
+        national = ocupare.sum(axis=0)
+
+    # Cresterea nationala totala si pe activitati, pentru fiecare pereche (b, e)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        total_national = national.sum(axis=0)
+        g = total_national[None, :] / total_national[:, None] - 1
+        g_activitate = national[:, None, :] / national[:, :, None] - 1
+    g_activitate = np.nan_to_num(g_activitate, nan=0.0, posinf=0.0, neginf=0.0)
+
+    baza = ocupare[:, :, :, None]
+    variatie = ocupare[:, :, None, :] - baza
+    efect_national = baza * g[None, None, :, :]
+    efect_structural = baza * (g_activitate[None, :, :, :] - g[None, None, :, :])
+    efect_regional = variatie - efect_national - efect_structural
+
+    tablouri = {
+        'variatie': variatie,
+        'Efect national': efect_national,
+        'Efect structural': efect_structural,
+        'Efect regional': efect_regional,
+    }
+    for nume, tablou in tablouri.items():
+        tablou = tablou.astype('float32')
+        tablou.flags.writeable = False
+        tablouri[nume] = tablou
+    return {'judete': judete, 'activitati': activitati, 'ani': ani, **tablouri}
+
+
+def _pozitii(descompunere, an_baza, an_final):
+    ani = descompunere['ani']
+    return int(np.searchsorted(ani, an_baza)), int(np.searchsorted(ani, an_final))
+
+
+def shift_share_judete(descompunere, an_baza, an_final, judete=None):
+    # Componentele pe judet (suma pe activitati) pentru perioada aleasa
+    b, e = _pozitii(descompunere, an_baza, an_final)
+    tabel = pd.DataFrame({
+        nume: descompunere[nume][:, :, b, e].sum(axis=1, dtype='float64')
+        for nume in ['variatie'] + COMPONENTE
+    }, index=descompunere['judete'].rename('Judete')).rename(columns={'variatie': 'Variatie totala'})
+    if judete is not None:
+        tabel = tabel[tabel.index.isin(judete)]
+    return tabel
+
+
+def shift_share_activitati(descompunere, judet, an_baza, an_final):
+    # Componentele pe activitati pentru un judet si perioada aleasa
+    b, e = _pozitii(descompunere, an_baza, an_final)
+    j = descompunere['judete'].get_loc(judet)
+    return pd.DataFrame({
+        nume: descompunere[nume][j, :, b, e].astype('float64')
+        for nume in ['variatie'] + COMPONENTE
+    }, index=descompunere['activitati'].rename('Activitate')).rename(columns={'variatie': 'Variatie totala'})
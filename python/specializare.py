@@ -0,0 +1,99 @@
+# Indicii de specializare si concentrare a ocuparii pe activitati economice (sectiuni NACE), calculati
+# vectorizat pe tensorul judet x activitate x an al salariatilor (Salariati2):
+#   coeficientul de localizare  LQ[j,a,t] = (E[j,a,t] / E[j,t]) / (E[a,t] / E[t])
+#   indicele Krugman            K[j,t]    = suma_a |s[j,a,t] - s[a,t]|, s = ponderea activitatii in ocupare
+#   indicele Herfindahl         HHI[j,t]  = suma_a s[j,a,t]^2 (concentrarea ocuparii judetului pe activitati)
+#   concentrarea geografica     HHI[a,t]  = suma_j (E[j,a,t] / E[a,t])^2
+# Referinta (E[a,t], E[t]) este suma judetelor, deci totalul national din tabel nu se dubleaza.
+import numpy as np
+import pandas as pd
+
+from judete import JUDETE
+
+INDICATOR_OCUPARE = 'Salariati2'
+
+
+def tensor_ocupare(cub, indicator=INDICATOR_OCUPARE, judete=None, activitati=None, ani=None):
+    # (judete, activitati, ani, E): salariatii ca tablou judet x activitate x an (0 unde lipsesc);
+    # implicit pentru toate judetele din nomenclator si toate activitatile si anii prezenti
+    judete = pd.Index([nume for nume, _, _, _ in JUDETE] if judete is None else judete)
+    felie = cub[(cub['Indicator'] == indicator) & cub['Judete'].isin(judete)]
+    if activitati is None:
+        activitati = pd.Index(sorted(felie['Dimensiune'].astype(str).unique()))
+    if ani is None:
+        ani = np.sort(felie['An'].unique())
+    felie = felie[felie['Dimensiune'].isin(activitati) & felie['An'].isin(ani)]
+    ocupare = np.zeros((len(judete), len(activitati), len(ani)))
+    np.add.at(ocupare, (judete.get_indexer(felie['Judete'].astype(str)),
+                        activitati.get_indexer(felie['Dimensiune'].astype(str)),
+                        np.searchsorted(ani, felie['An'].to_numpy())), felie['Valoare'].to_numpy())
+    return judete, activitati, ani, ocupare
+
+
+def indici_specializare(judete, activitati, ani, ocupare):
+    # Toti indicii pentru fiecare judet x activitate x an, ca tablouri numpy
+    total_judet = ocupare.sum(axis=1, keepdims=True)
+    total_activitate = ocupare.sum(axis=0, keepdims=True)
+    total = ocupare.sum(axis=(0, 1), keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        pondere_judet = ocupare / total_judet
+        pondere_nationala = total_activitate / total
+        lq = pondere_judet / pondere_nationala
+        pondere_geografica = ocupare / total_activitate
+    return {
+        'judete': judete, 'activitati': activitati, 'ani': ani,
+        'ocupare': ocupare,
+        'pondere': pondere_judet,
+        'lq': lq,
+        'krugman': np.abs(pondere_judet - pondere_nationala).sum(axis=1),
+        'hhi_judet': (pondere_judet ** 2).sum(axis=1),
+        'hhi_activitate': (pondere_geografica ** 2).sum(axis=0),
+    }
+
+
+def tabele_specializare(indici):
+    # Indicii in format lung: (tabel judet x activitate x an, tabel judet x an, tabel activitate x an)
+    judete, activitati, ani = indici['judete'], indici['activitati'], indici['ani']
+    chei = pd.MultiIndex.from_product([judete, activitati, ani], names=['Judete', 'Activitate', 'An'])
+    pe_activitati = pd.DataFrame({
+        'Salariati': indici['ocupare'].ravel(),
+        'Pondere (%)': indici['pondere'].ravel() * 100,
+        'LQ': indici['lq'].ravel(),
+    }, index=chei).reset_index()
+    pe_judete = pd.DataFrame({
+        'Indice Krugman': indici['krugman'].ravel(),
+        'HHI': indici['hhi_judet'].ravel(),
+    }, index=pd.MultiIndex.from_product([judete, ani], names=['Judete', 'An'])).reset_index()
+    concentrare = pd.DataFrame({
+        'HHI geografic': indici['hhi_activitate'].ravel(),
+    }, index=pd.MultiIndex.from_product([activitati, ani], names=['Activitate', 'An'])).reset_index()
+    return pe_activitati, pe_judete, concentrare
+
+
+def clasament_lq(indici, activitate, an, judete=None):
+    # Judetele ordonate descrescator dupa coeficientul de localizare al unei activitati intr-un an
+    a = indici['activitati'].get_loc(activitate)
+    t = int(np.searchsorted(indici['ani'], an))
+    clasament = pd.DataFrame({
+        'LQ': indici['lq'][:, a, t],
+        'Pondere (%)': indici['pondere'][:, a, t] * 100,
+        'Salariati': indici['ocupare'][:, a, t],
+    }, index=indici['judete'].rename('Judete'))
+    if judete is not None:
+        clasament = clasament[clasament.index.isin(judete)]
+    return clasament.sort_values('LQ', ascending=False)
+
+
+def clasament_specializare(indici, an, judete=None):
+    # Judetele ordonate dupa indicele Krugman intr-un an, cu HHI si activitatea cu cel mai mare LQ
+    t = int(np.searchsorted(indici['ani'], an))
+    lq = indici['lq'][:, :, t]
+    clasament = pd.DataFrame({
+        'Indice Krugman': indici['krugman'][:, t],
+        'HHI': indici['hhi_judet'][:, t],
+        'Activitatea cea mai specializata': indici['activitati'][np.nanargmax(np.nan_to_num(lq, nan=-np.inf), axis=1)],
+        'LQ maxim': np.nanmax(lq, axis=1),
+    }, index=indici['judete'].rename('Judete'))
+    if judete is not None:
+        clasament = clasament[clasament.index.isin(judete)]
+    return clasament.sort_values('Indice Krugman', ascending=False)
@@ -0,0 +1,289 @@
+# Motorul de statistici descriptive: calculeaza dintr-o singura trecere vectorizata statisticile pentru
+# fiecare indicator x dimensiune (ex. sex) x an x set de judete din cubul de indicatori, impreuna cu
+# testele de semnificativitate (rezultate numerice, memorate dupa amprenta vectorului de valori)
+import hashlib
+import threading
+import warnings
+
+import numpy as np
+import pandas as pd
+
+# Statisticile calculate, in ordinea in care sunt afisate
+STATISTICI = [
+    'Media',
+    'Mediana',
+    'Dispersia',
+    'Abaterea standard',
+    'Minimul',
+    'Maximul',
+    'Coeficientul de variatie (%)',
+    'Amplitudinea',
+]
+
+CHEI_GRILA = ['Set judete', 'Indicator', 'Dimensiune', 'An']
+
+# Rezultatele testelor de semnificativitate, ca valori numerice (formatarea se face la afisare)
+COLOANE_TESTE = [
+    'n',
+    'Test normalitate',
+    'Statistica normalitate',
+    'p normalitate',
+    'IC 95% inferior',
+    'IC 95% superior',
+    'IC 99% inferior',
+    'IC 99% superior',
+    't medie',
+    'p medie',
+    'Q1',
+    'Q3',
+    'Limita inferioara',
+    'Limita superioara',
+    'Numar valori extreme',
+    'Valori extreme',
+    'Chi2 varianta',
+    'p varianta',
+]
+
+NIVEL_SEMNIFICATIE = 0.05
+
+# Pana la aceasta dimensiune a esantionului se foloseste Shapiro-Wilk, peste ea Kolmogorov-Smirnov
+PRAG_SHAPIRO = 50
+
+# Rezultatele testelor deja calculate, dupa amprenta vectorului de valori; sunt comune tuturor
+# sesiunilor, deci aceeasi felie nu este testata de doua ori (randari repetate, exporturi). La depasirea
+# limitei ies cele mai vechi intrari (FIFO); accesul din firele sesiunilor trece prin blocare.
+_TESTE_MEMORATE = {}
+MAX_TESTE_MEMORATE = 8192
+_BLOCARE_TESTE = threading.Lock()
+
+
+def _statistici_matrice(valori):
+    # Statisticile pe fiecare rand al unei matrice (o felie per rand, judetele pe coloane, NaN = lipsa)
+    n = np.sum(~np.isnan(valori), axis=1)
+    with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+        warnings.simplefilter('ignore', RuntimeWarning)
+        media = np.nanmean(valori, axis=1)
+        dispersia = np.where(n > 1, np.nanvar(valori, axis=1, ddof=1), np.nan)
+        abatere = np.sqrt(dispersia)
+        minim = np.nanmin(valori, axis=1)
+        maxim = np.nanmax(valori, axis=1)
+        rezultat = {
+            'n': n,
+            'Media': media,
+            'Mediana': np.nanmedian(valori, axis=1),
+            'Dispersia': dispersia,
+            'Abaterea standard': abatere,
+            'Minimul': minim,
+            'Maximul': maxim,
+            'Coeficientul de variatie (%)': abatere / media * 100,
+            'Amplitudinea': maxim - minim,
+        }
+    return rezultat
+
+
+def _matrici(cub, seturi_judete):
+    # Pentru fiecare set de judete, cubul pivotat intr-o matrice (felii x judete)
+    for nume_set, judete in seturi_judete.items():
+        felie = cub[cub['Judete'].isin(judete)]
+        matrice = felie.pivot_table(index=['Indicator', 'Dimensiune', 'An'], columns='Judete',
+                                    values='Valoare', aggfunc='first', observed=True)
+        yield nume_set, matrice
+
+
+def _grila(bucati):
+    grila = pd.concat(bucati, ignore_index=True)
+    for coloana in ['Set judete', 'Indicator', 'Dimensiune']:
+        grila[coloana] = grila[coloana].astype(str)
+    return grila
+
+
+def grila_statistici(cub, seturi_judete):
+    # Grila completa de statistici: un rand pentru fiecare set de judete x indicator x dimensiune x an.
+    # seturi_judete {nume set: lista de judete}. Pentru fiecare set, cubul este pivotat intr-o matrice
+    # (felii x judete) si toate statisticile se calculeaza deodata, pe axa judetelor.
+    bucati = []
+    for nume_set, matrice in _matrici(cub, seturi_judete):
+        rezultat = pd.DataFrame(_statistici_matrice(matrice.to_numpy(dtype='float64')), index=matrice.index)
+        bucati.append(rezultat.reset_index().assign(**{'Set judete': nume_set}))
+    return _grila(bucati)[CHEI_GRILA + ['n'] + STATISTICI]
+
+
+def amprenta_vector(valori):
+    # Amprenta unui vector de valori (fara lipsuri), cheia sub care sunt memorate testele lui
+    return hashlib.blake2b(np.ascontiguousarray(valori, dtype='float64').tobytes(), digest_size=16).hexdigest()
+
+
+def _teste_matrice(valori):
+    # Testele de semnificativitate pentru fiecare rand al unei matrice (NaN = lipsa). Intervalele,
+    # testul t, testul chi-patrat si limitele IQR se calculeaza vectorizat pe toate randurile;
+    # doar testul de normalitate se aplica rand cu rand.
+    from scipy import stats
+
+    n = np.sum(~np.isnan(valori), axis=1)
+    with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+        warnings.simplefilter('ignore', RuntimeWarning)
+        grade = n - 1
+        media = np.nanmean(valori, axis=1)
+        dispersia = np.nanvar(valori, axis=1, ddof=1)
+        eroare_std = np.sqrt(dispersia / n)
+        rezultat = {'n': n}
+        for nivel in (95, 99):
+            marja = stats.t.ppf(0.5 + nivel / 200, grade) * eroare_std
+            rezultat[f'IC {nivel}% inferior'] = media - marja
+            rezultat[f'IC {nivel}% superior'] = media + marja
+
+        # Test t pentru media = 0 si test chi-patrat pentru varianta = 1
+        t_medie = media / eroare_std
+        rezultat['t medie'] = t_medie
+        rezultat['p medie'] = 2 * stats.t.sf(np.abs(t_medie), grade)
+        chi2 = grade * dispersia
+        rezultat['Chi2 varianta'] = chi2
+        rezultat['p varianta'] = stats.chi2.sf(chi2, grade)
+
+        # Valori extreme - metoda IQR
+        q1, q3 = np.nanpercentile(valori, [25, 75], axis=1)
+        limita_inf = q1 - 1.5 * (q3 - q1)
+        limita_sup = q3 + 1.5 * (q3 - q1)
+        extreme = (valori < limita_inf[:, None]) | (valori > limita_sup[:, None])
+        rezultat.update({'Q1': q1, 'Q3': q3, 'Limita inferioara': limita_inf, 'Limita superioara': limita_sup,
+                         'Numar valori extreme': extreme.sum(axis=1)})
+
+    # Test de normalitate: Shapiro-Wilk pentru esantioane mici, Kolmogorov-Smirnov pentru cele mari
+    teste, statistici, p_valori, liste_extreme = [], [], [], []
+    for rand, extreme_rand in zip(valori, extreme):
+        prezente = rand[~np.isnan(rand)]
+        liste_extreme.append(tuple(rand[extreme_rand].tolist()))
+        if len(prezente) < 3:
+            teste.append('')
+            statistici.append(np.nan)
+            p_valori.append(np.nan)
+            continue
+        if len(prezente) <= PRAG_SHAPIRO:
+            nume_test, (statistica, p) = 'Shapiro-Wilk', stats.shapiro(prezente)
+        else:
+            nume_test, (statistica, p) = 'Kolmogorov-Smirnov', stats.kstest(prezente, 'norm')
+        teste.append(nume_test)
+        statistici.append(statistica)
+        p_valori.append(p)
+    rezultat.update({'Test normalitate': teste, 'Statistica normalitate': statistici,
+                     'p normalitate': p_valori, 'Valori extreme': liste_extreme})
+    return pd.DataFrame(rezultat)[COLOANE_TESTE]
+
+
+def _memoreaza(noi):
+    # Adauga rezultatele noi si apoi evacueaza cele mai vechi intrari peste limita; se apeleaza sub blocare
+    _TESTE_MEMORATE.update(noi)
+    while len(_TESTE_MEMORATE) > MAX_TESTE_MEMORATE:
+        del _TESTE_MEMORATE[next(iter(_TESTE_MEMORATE))]
+
+
+def _teste_memorate(randuri):
+    # Testele pentru o lista de vectori (fara lipsuri): cele deja memorate se refolosesc,
+    # restul se calculeaza intr-un singur lot (in afara blocarii) si se memoreaza. Rezultatul se
+    # construieste din copiile locale, deci evacuarea nu poate pierde randuri ale acestui lot.
+    amprente = [amprenta_vector(rand) for rand in randuri]
+    with _BLOCARE_TESTE:
+        gasite = {amprenta: _TESTE_MEMORATE[amprenta] for amprenta in amprente if amprenta in _TESTE_MEMORATE}
+    lipsa = {amprenta: rand for amprenta, rand in zip(amprente, randuri) if amprenta not in gasite}
+    noi = {}
+    if lipsa:
+        lungime = max(len(rand) for rand in lipsa.values())
+        matrice = np.full((len(lipsa), lungime), np.nan)
+        for i, rand in enumerate(lipsa.values()):
+            matrice[i, :len(rand)] = rand
+        noi = dict(zip(lipsa, _teste_matrice(matrice).to_dict('records')))
+        with _BLOCARE_TESTE:
+            _memoreaza(noi)
+    rezultate = gasite | noi
+    return pd.DataFrame([rezultate[amprenta] for amprenta in amprente], columns=COLOANE_TESTE)
+
+
+def teste_semnificativitate(valori):
+    # Testele de semnificativitate pentru un singur vector de valori, ca dictionar numeric
+    valori = np.asarray(valori, dtype='float64')
+    return _teste_memorate([valori[~np.isnan(valori)]]).iloc[0].to_dict()
+
+
+def grila_teste(cub, seturi_judete):
+    # Grila testelor de semnificativitate, cu aceleasi chei ca grila de statistici descriptive
+    bucati = []
+    for nume_set, matrice in _matrici(cub, seturi_judete):
+        randuri = [rand[~np.isnan(rand)] for rand in matrice.to_numpy(dtype='float64')]
+        rezultat = _teste_memorate(randuri).set_axis(matrice.index)
+        bucati.append(rezultat.reset_index().assign(**{'Set judete': nume_set}))
+    return _grila(bucati)[CHEI_GRILA + COLOANE_TESTE]
+
+
+def _rand_grila(grila, set_judete, indicator, dimensiune, an):
+    return grila[(grila['Set judete'] == set_judete) & (grila['Indicator'] == indicator)
+                 & (grila['Dimensiune'] == dimensiune) & (grila['An'] == an)]
+
+
+def cauta_statistici(grila, set_judete, indicator, dimensiune, an):
+    # Statisticile unei felii din grila, ca tabel (Statistica, Valoare); tabel gol daca felia nu exista
+    rand = _rand_grila(grila, set_judete, indicator, dimensiune, an)
+    if rand.empty:
+        return pd.DataFrame(columns=['Statistica', 'Valoare'])
+    valori = rand.iloc[0][STATISTICI].astype('float64')
+    return pd.DataFrame({'Statistica': STATISTICI, 'Valoare': valori.to_numpy()})
+
+
+def cauta_teste(grila, set_judete, indicator, dimensiune, an):
+    # Rezultatele testelor pentru o felie, ca dictionar; None daca felia nu exista
+    rand = _rand_grila(grila, set_judete, indicator, dimensiune, an)
+    return None if rand.empty else rand.iloc[0][COLOANE_TESTE].to_dict()
+
+
+def felii_nenormale(grila, alfa=NIVEL_SEMNIFICATIE):
+    # Feliile pentru care ipoteza de normalitate este respinsa la pragul alfa
+    return grila[grila['p normalitate'] < alfa]
+
+
+def _pearson_perechi(a, b):
+    # Coeficientul Pearson si numarul de observatii pentru fiecare pereche, pe ultima axa, folosind
+    # doar observatiile prezente in ambii vectori (NaN = lipsa)
+    prezente = ~(np.isnan(a) | np.isnan(b))
+    n = prezente.sum(axis=-1)
+    a, b = np.where(prezente, a, 0.0), np.where(prezente, b, 0.0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        media_a, media_b = a.sum(axis=-1) / n, b.sum(axis=-1) / n
+        abatere_a = np.where(prezente, a - media_a[..., None], 0.0)
+        abatere_b = np.where(prezente, b - media_b[..., None], 0.0)
+        r = (abatere_a * abatere_b).sum(axis=-1) / np.sqrt((abatere_a ** 2).sum(axis=-1) * (abatere_b ** 2).sum(axis=-1))
+    return np.clip(r, -1.0, 1.0), n
+
+
+def _p_corelatie(r, n):
+    # p-value bilateral pentru H0: corelatie nula (statistica t cu n-2 grade de libertate)
+    from scipy import stats
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t = r * np.sqrt((n - 2) / (1 - r ** 2))
+        p = 2 * stats.t.sf(np.abs(t), n - 2)
+    return np.where(n > 2, p, np.nan)
+
+
+def corelatii(panel):
+    # Matricele de corelatie Pearson si Spearman intre toate coloanele unui panel (observatii x variabile),
+    # cu p-values si numarul de observatii, pe perechi complete. Pentru Spearman rangurile se calculeaza,
+    # pentru fiecare variabila j, doar pe observatiile in care j este prezenta, deci fiecare pereche
+    # foloseste rangurile din propriul esantion comun.
+    from scipy import stats
+
+    valori = panel.to_numpy(dtype='float64')
+    coloane = valori.T
+    r_pearson, n = _pearson_perechi(coloane[:, None, :], coloane[None, :, :])
+
+    lipsa = np.isnan(valori)
+    ranguri = np.stack([
+        stats.rankdata(np.where(lipsa[:, [j]], np.nan, valori), axis=0, nan_policy='omit')
+        for j in range(valori.shape[1])
+    ])
+    r_spearman, _ = _pearson_perechi(ranguri.transpose(2, 0, 1), ranguri.transpose(0, 2, 1))
+
+    nume = list(panel.columns)
+    cadru = lambda matrice: pd.DataFrame(matrice, index=nume, columns=nume)
+    return {
+        metoda: {'r': cadru(r), 'p': cadru(_p_corelatie(r, n)), 'n': cadru(n)}
+        for metoda, r in (('Pearson', r_pearson), ('Spearman', r_spearman))
+    }
@@ -0,0 +1,36 @@
+# Teste pentru alinierea indicatorilor din cub (pagina de corelatie), pe baza data.sqlite
+import numpy as np
+import pytest
+
+from baza_date import citeste_sql
+from cub_indicatori import NUME_JUDETE, aliniaza_indicatori, construieste_cub
+from judete import ROMANIA
+
+
+@pytest.fixture(scope='module')
+def cub():
+    cub, _ = construieste_cub(lambda nume_tabel: citeste_sql(f'SELECT * FROM "{nume_tabel}"'))
+    return cub
+
+
+@pytest.mark.parametrize('indicator_x, indicator_y', [
+    ('Salariati2', 'Absolventi'),
+    ('Somaj', 'Resurse'),
+])
+def test_aliniere_doar_judete_si_romania(cub, indicator_x, indicator_y):
+    # Regiunile si macroregiunile nu trebuie sa ajunga pe scatter langa judetele pe care le includ
+    dimensiune = None if indicator_x == 'Salariati2' else 'Total'
+    judete, ani, x, y = aliniaza_indicatori(cub, indicator_x, dimensiune, indicator_y, dimensiune)
+    assert len(ani) > 0
+    assert set(judete) <= set(NUME_JUDETE) | {ROMANIA}
+    assert not [nume for nume in judete if 'regiun' in nume.lower()]
+    assert x.shape == y.shape == (len(judete), len(ani))
+
+
+def test_suma_pe_dimensiune_foloseste_totalul_tabelului(cub):
+    # Romania are in Absolventi si randul Total, si nivelurile: suma nu trebuie sa le adune pe amandoua
+    judete, ani, x, _ = aliniaza_indicatori(cub, 'Absolventi', None, 'Absolventi', 'Total')
+    rand = list(judete).index(ROMANIA)
+    total = cub[(cub['Indicator'] == 'Absolventi') & (cub['Judete'] == ROMANIA) & (cub['Dimensiune'] == 'Total')]
+    an = total['An'].max()
+    assert np.isclose(x[rand, list(ani).index(an)], total.loc[total['An'] == an, 'Valoare'].iloc[0])